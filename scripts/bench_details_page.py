@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Micro-benchmark kinozal details-page parsing over captured fixtures.
+
+Usage: python scripts/bench_details_page.py <details.html>... [--rounds N]
+
+Capture a fixture with `scripts/capture_kinozal_fixture.py <details-url> <path>`.
+Each page is read the ways below, reading every field the item filter and
+`build_film_profile` read (category, genre, cast, director, description):
+
+- `per-field`: one stdlib parse per field, the cost before `DetailsPage`;
+- `once/html.parser`: one `DetailsPage` on the stdlib parser;
+- `once/lxml`: one `DetailsPage` on lxml, when installed, so the parser's share of
+  the gain is visible on its own.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from kinozal_scraper.kinozal_pipeline import _DETAILS_PARSER, DetailsPage  # noqa: E402
+
+_FIELDS = ("category_id", "genre", "cast", "director", "description")
+
+
+def _per_field(html: str) -> None:
+    for name in _FIELDS:
+        getattr(DetailsPage(html, parser="html.parser"), name)
+
+
+def _once(parser: str) -> Callable[[str], None]:
+    def read(html: str) -> None:
+        page = DetailsPage(html, parser=parser)
+        for name in _FIELDS:
+            getattr(page, name)
+
+    return read
+
+
+def bench(pages: list[str], rounds: int) -> list[tuple[str, float]]:
+    """Mean milliseconds per page for each strategy, in the order listed above."""
+    strategies = [("per-field", _per_field), ("once/html.parser", _once("html.parser"))]
+    if _DETAILS_PARSER != "html.parser":
+        strategies.append((f"once/{_DETAILS_PARSER}", _once(_DETAILS_PARSER)))
+    results: list[tuple[str, float]] = []
+    for label, read in strategies:
+        started = time.perf_counter()
+        for _ in range(rounds):
+            for html in pages:
+                read(html)
+        elapsed = time.perf_counter() - started
+        results.append((label, elapsed * 1000 / (rounds * len(pages))))
+    return results
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("fixtures", nargs="+", type=Path)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args(argv)
+    pages = [path.read_text(encoding="utf-8") for path in args.fixtures]
+    results = bench(pages, args.rounds)
+    baseline = results[0][1]
+    for label, ms in results:
+        print(f"{label:<20} {ms:8.2f} ms/page  x{baseline / ms:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Micro-benchmark `extract_from_html` over captured pages, one line per HTML engine.
+
+Usage: python scripts/bench_extract_html.py <page.html>... [--source ID] [--rounds N]
+
+Each page is read with the named sources.json source (default `github_trending`,
+whose page is captured under `tests/fixtures/github_trending/`) on every engine in
+`HTML_PARSERS` that is installed: `html.parser` is the reference, `lxml` and
+`selectolax` are optional installs and are skipped when absent. A source opts into
+one with its `parser` key; `TestHtmlBackendParity` is what says it may.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from kinozal_scraper.generic_pipeline import HTML_PARSERS, extract_from_html  # noqa: E402
+from kinozal_scraper.pipeline_config import load_sources_config  # noqa: E402
+
+
+def bench(pages: list[str], source: dict[str, Any], rounds: int) -> list[tuple[str, float]]:
+    """Rows extracted per second for each installed engine, reference first."""
+    results: list[tuple[str, float]] = []
+    for parser in HTML_PARSERS:
+        if parser != "html.parser" and importlib.util.find_spec(parser) is None:
+            continue
+        config = {**source, "parser": parser}
+        rows = 0
+        started = time.perf_counter()
+        for _ in range(rounds):
+            for html in pages:
+                rows += len(extract_from_html(html, config).items)
+        elapsed = time.perf_counter() - started
+        results.append((parser, rows / elapsed if elapsed else 0.0))
+    return results
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("fixtures", nargs="+", type=Path)
+    parser.add_argument("--source", default="github_trending")
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args(argv)
+    sources = {s["id"]: s for s in load_sources_config()["sources"]}
+    if args.source not in sources:
+        parser.error(f"unknown source {args.source!r}; known: {sorted(sources)}")
+    pages = [path.read_text(encoding="utf-8") for path in args.fixtures]
+    results = bench(pages, sources[args.source], args.rounds)
+    baseline = results[0][1]
+    for label, rate in results:
+        speedup = rate / baseline if baseline else 0.0
+        print(f"{label:<12} {rate:10.0f} rows/s  x{speedup:.1f}")
+
+
+if __name__ == "__main__":
+    main()
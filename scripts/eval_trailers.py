@@ -23,7 +23,7 @@ import json
 import os
 import sys
 from collections.abc import Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any, Literal
 from urllib.parse import parse_qs, urlsplit
@@ -44,6 +44,11 @@ from kinozal_scraper.trailer_strategy import (  # noqa: E402
     HeuristicStrategy,
     TrailerStrategy,
 )
+from kinozal_scraper.youtube import (  # noqa: E402
+    _MAX_RESULTS,
+    _query_titles,
+    _ru_branch_suffices,
+)
 
 Outcome = Literal["hit", "wrong", "miss"]
 
@@ -363,6 +368,37 @@ def evaluate_delivery(
     return rows, score([o for _, _, o in rows])
 
 
+def _lazy_pool(film: FilmProfile, pool: list[Candidate]) -> tuple[list[Candidate], int]:
+    """The pool and `search.list` count a `lazy_original` search would have had, replayed
+    over a recorded union pool.
+
+    The union lists the RU query's results first, so its first `_MAX_RESULTS` are the
+    RU branch whenever that query filled its page. A shorter pool cannot be split; the
+    whole pool stands in for the RU branch, which errs towards the union's outcome, so
+    the scorecard understates a lazy search's losses only where pools are that small."""
+    queries = len(_query_titles(film))
+    ru_branch = pool[:_MAX_RESULTS]
+    if queries > 1 and _ru_branch_suffices(film, ru_branch):
+        return ru_branch, 1
+    return pool, queries
+
+
+def evaluate_lazy_delivery(
+    cases: list[GoldenCase],
+) -> tuple[list[tuple[GoldenCase, str | None, Outcome]], int, int, int]:
+    """`evaluate_delivery` over the pools a `lazy_original` search would have built,
+    plus the `search.list` queries the union and the lazy search issue for the set."""
+    lazy_cases: list[GoldenCase] = []
+    union_queries = lazy_queries = 0
+    for case in cases:
+        pool, queries = _lazy_pool(case.film, case.candidates)
+        lazy_cases.append(replace(case, candidates=pool))
+        union_queries += len(_query_titles(case.film))
+        lazy_queries += queries
+    rows, total = evaluate_delivery(lazy_cases)
+    return rows, total, union_queries, lazy_queries
+
+
 # ── baseline ratchet over delivery scorecard (#379) ───────────────────────────
 
 
@@ -586,6 +622,11 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument(
         "--threshold", type=int, default=None, help="exit≠0 если итоговый score ниже порога"
     )
+    parser.add_argument(
+        "--lazy-original",
+        action="store_true",
+        help="также delivery-скоркарта ленивого запроса по оригинальному названию",
+    )
     parser.add_argument(
         "--update-baseline",
         action="store_true",
@@ -608,6 +649,12 @@ def main(argv: list[str] | None = None) -> int:
     tmdb_rows, tmdb_total = evaluate_tmdb(cases)
     print("── TMDB videos (metadata source) ──")
     _print_scorecard(tmdb_rows, tmdb_total)
+    if args.lazy_original:
+        lazy_rows, lazy_total, union_queries, lazy_queries = evaluate_lazy_delivery(cases)
+        print("── delivery, lazy original-title query (Youtube(lazy_original=True)) ──")
+        _print_scorecard(lazy_rows, lazy_total)
+        print(f"search.list queries: union={union_queries} lazy={lazy_queries}")
+        print(compare_to_baseline(load_baseline(BASELINE_PATH), lazy_rows).text)
 
     if args.update_baseline:
         save_baseline(BASELINE_PATH, build_baseline(delivery_rows))
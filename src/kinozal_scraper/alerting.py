@@ -23,6 +23,7 @@ from __future__ import annotations
 import html as _html
 import logging
 import os
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any
 
@@ -32,6 +33,9 @@ from kinozal_scraper.generic_pipeline import (
     SourceMetrics,
     without_source_prefix,
 )
+from kinozal_scraper.host_governor import GOVERNOR
+from kinozal_scraper.http_fetch import transport_summary_lines
+from kinozal_scraper.http_observability import HTTP_CALLS
 
 logger = logging.getLogger(__name__)
 
@@ -80,7 +84,7 @@ def _annotations(source_id: str, label: str, messages: list[str]) -> list[str]:
     return lines
 
 
-def publish_run_summary(results: list[PipelineResult]) -> None:
+def publish_run_summary(results: list[PipelineResult], *, extra_lines: Sequence[str] = ()) -> None:
     """Log the metrics lines and append them to the GitHub Actions Step Summary.
 
     Counters are omitted rather than zeroed when `metrics is None` ("this pipeline
@@ -93,6 +97,14 @@ def publish_run_summary(results: list[PipelineResult]) -> None:
     published before the exit code precisely so a failed run's numbers survive, and
     six counters with no stated reason is not a report an operator can act on.
 
+    Process-wide transport counters — `http_fetch`'s validator-cache hit/miss/304,
+    the host governor's opened/short-circuited/paced per host and the per-host
+    `http_latency` p50/p95 — follow the per-source lines: they belong to the run, not to any one source, and
+    they are omitted — not zeroed — when the run made no measured fetch.
+    `extra_lines` are a pipeline's own run-wide counters (kinozal's details cache)
+    and come last, under the same rule: the caller passes none when nothing was
+    measured.
+
     A summary that cannot be written degrades to a WARNING — it is a report
     channel, and losing it must not redden a run that otherwise succeeded.
     """
@@ -102,6 +114,10 @@ def publish_run_summary(results: list[PipelineResult]) -> None:
             lines.append(format_metrics_line(result.source_id, result.metrics))
         lines.extend(_annotations(result.source_id, "error", result.errors))
         lines.extend(_annotations(result.source_id, "warning", result.warnings))
+    lines.extend(transport_summary_lines())
+    lines.extend(GOVERNOR.summary_lines())
+    lines.extend(HTTP_CALLS.summary_lines())
+    lines.extend(extra_lines)
     if not lines:
         return
     for line in lines:
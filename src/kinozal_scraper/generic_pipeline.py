@@ -2,14 +2,23 @@
 
 from __future__ import annotations
 
+import functools
 import html as _html
+import importlib.util
+import logging
 import re
+import string
 import urllib.parse
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, Protocol
 
-from bs4 import BeautifulSoup, Tag
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from soupsieve import SoupSieve
+
+logger = logging.getLogger(__name__)
 
 ROW_HEADERS = ["dedupe_key", "title", "url", "metric", "source_id", "notified_at"]
 
@@ -115,10 +124,10 @@ def _json_field(record: dict[str, Any], key: str | None) -> str:
 def _selector_css_part(selector: str | None) -> str | None:
     """The CSS portion of a field selector (`"css@attr"`, `"@attr"`, `"css"`).
 
-    Returns the stripped CSS string that runtime feeds to `select_one`/`select`,
-    or a falsy value when there is none (empty selector, or `@attr`-only). Shared
-    by `_html_field` (runtime) and `validate_sources_config` (load-time) so both
-    compile the exact same selector string.
+    Returns the stripped CSS string that `compile_field_selector` compiles, or a
+    falsy value when there is none (empty selector, or `@attr`-only). Shared by
+    `compile_field_selector` (runtime) and `validate_sources_config` (load-time) so
+    both compile the exact same selector string.
     """
     if not selector:
         return None
@@ -126,7 +135,37 @@ def _selector_css_part(selector: str | None) -> str | None:
     return css.strip()
 
 
-def _html_field(row: Tag, selector: str | None) -> str:
+@dataclass(frozen=True)
+class FieldSelector:
+    """A field selector split and compiled once (`compile_field_selector`).
+
+    `css` is the stripped CSS part ("" = the row itself), `matcher` its soupsieve
+    compilation (None for ""), `attr` the attribute to read (None = text content).
+    """
+
+    css: str
+    matcher: SoupSieve | None
+    attr: str | None
+
+
+@functools.cache
+def compile_css(css: str) -> SoupSieve:
+    """The soupsieve matcher for `css`, compiled once per process.
+
+    `validate_sources_config` compiles every selector through here at load time, so a
+    typo fails before the run and extraction finds each matcher already built.
+    """
+    return soupsieve.compile(css)
+
+
+@functools.cache
+def compile_field_selector(selector: str) -> FieldSelector:
+    css = _selector_css_part(selector) or ""
+    attr = selector.rsplit("@", 1)[1] if "@" in selector else None
+    return FieldSelector(css=css, matcher=compile_css(css) if css else None, attr=attr)
+
+
+def _html_field(row: Tag, selector: FieldSelector | None) -> str:
     """Extract a field from an HTML row element.
 
     Selector forms:
@@ -135,17 +174,129 @@ def _html_field(row: Tag, selector: str | None) -> str:
       "@attr"      – attribute of the row element itself
       None / ""    – empty string
     """
-    if not selector:
+    if selector is None:
         return ""
-    if "@" in selector:
-        _, attr = selector.rsplit("@", 1)
-        css = _selector_css_part(selector)
-        el: Tag | None = row.select_one(css) if css else row
-        return _str(el.get(attr) if el else None)
-    el = row.select_one(selector)
+    el: Tag | None = selector.matcher.select_one(row) if selector.matcher else row
+    if selector.attr is not None:
+        return _str(el.get(selector.attr) if el else None)
     return el.get_text(strip=True) if el else ""
 
 
+# One compound selector led by a type: `article.Box-row`, `a[href^='/details.php']`.
+# Whether it matches depends on the element alone, never on its ancestors or siblings.
+_COMPOUND_ROW_RE = re.compile(r"([a-zA-Z][\w-]*)(?:[.#][\w-]+|\[[^\]]*\])*")
+
+
+def _row_tag(row_selector: str) -> str | None:
+    """The tag every row must be, when the row selector allows the parse to keep only those."""
+    match = _COMPOUND_ROW_RE.fullmatch(row_selector.strip())
+    return match.group(1).lower() if match else None
+
+
+@dataclass(frozen=True)
+class ExtractionPlan:
+    """A source's HTML selectors, compiled: what `extract_from_html` executes per row.
+
+    `row_tag` is set when rows can be found in a tree built of that tag alone
+    (`_row_tag`); `limit` is the source's row cap, 0 for none.
+    """
+
+    row_selector: str
+    rows: SoupSieve
+    row_tag: str | None
+    limit: int
+    dedupe_key: FieldSelector | None
+    fields: dict[str, FieldSelector | None]
+    extra_fields: dict[str, FieldSelector | None]
+
+
+def extraction_plan(source_config: dict[str, Any]) -> ExtractionPlan:
+    """The compiled plan for an HTML source; every selector comes from the shared cache."""
+
+    def compiled(selector: str | None) -> FieldSelector | None:
+        return compile_field_selector(selector) if selector else None
+
+    row_selector: str = source_config["row_selector"]
+    return ExtractionPlan(
+        row_selector=row_selector,
+        rows=compile_css(row_selector),
+        row_tag=_row_tag(row_selector),
+        limit=int(source_config.get("limit", 0)),
+        dedupe_key=compiled(source_config.get("dedupe_key")),
+        fields={k: compiled(v) for k, v in source_config.get("fields", {}).items()},
+        extra_fields={k: compiled(v) for k, v in source_config.get("extra_fields", {}).items()},
+    )
+
+
+# A source's optional `parser` in sources.json; the first is the reference and default.
+HTML_PARSERS = ("html.parser", "lxml", "selectolax")
+
+
+class HtmlBackend(Protocol):
+    """How `extract_from_html` reads a page: its rows, then one field of a row at a time.
+
+    Every backend honours the selector forms `_html_field` documents, so a source may
+    switch engines without touching its selectors.
+    """
+
+    def rows(self, html: str, plan: ExtractionPlan) -> list[Any]:
+        """The page's rows in document order, at most `plan.limit` of them."""
+        ...
+
+    def field(self, row: Any, selector: FieldSelector | None) -> str: ...
+
+
+@dataclass(frozen=True)
+class SoupBackend:
+    """The reference backend: BeautifulSoup on `builder`, the plan's soupsieve matchers."""
+
+    builder: str = "html.parser"
+
+    def rows(self, html: str, plan: ExtractionPlan) -> list[Any]:
+        # The whole document is still tokenised, but only row-tag subtrees become
+        # nodes, and matching stops at the limit-th row.
+        strainer = SoupStrainer(plan.row_tag) if plan.row_tag else None
+        soup = BeautifulSoup(html, self.builder, parse_only=strainer)
+        return list(plan.rows.select(soup, limit=plan.limit))
+
+    def field(self, row: Any, selector: FieldSelector | None) -> str:
+        return _html_field(row, selector)
+
+
+class SelectolaxBackend:
+    """Lexbor's parser and CSS engine through selectolax, with no Python tree on the way."""
+
+    def rows(self, html: str, plan: ExtractionPlan) -> list[Any]:
+        from selectolax.lexbor import LexborHTMLParser
+
+        rows = LexborHTMLParser(html).css(plan.row_selector)
+        return list(rows[: plan.limit] if plan.limit else rows)
+
+    def field(self, row: Any, selector: FieldSelector | None) -> str:
+        if selector is None:
+            return ""
+        el = row.css_first(selector.css) if selector.css else row
+        if selector.attr is not None:
+            return _str(el.attributes.get(selector.attr) if el is not None else None)
+        return str(el.text(strip=True)) if el is not None else ""
+
+
+def html_backend(parser: str = "html.parser") -> HtmlBackend:
+    """The backend a source's `parser` names.
+
+    lxml and selectolax are optional installs; a source naming one that is absent is
+    read by the reference backend, with a WARNING, rather than not read at all.
+    """
+    if parser not in HTML_PARSERS:
+        raise ValueError(f"unknown HTML parser {parser!r}; expected one of {HTML_PARSERS}")
+    if parser == "html.parser":
+        return SoupBackend()
+    if importlib.util.find_spec(parser) is None:
+        logger.warning("HTML parser %s is not installed; using html.parser", parser)
+        return SoupBackend()
+    return SelectolaxBackend() if parser == "selectolax" else SoupBackend(parser)
+
+
 def _build_item(
     source_id: str,
     dedupe_key: str,
@@ -196,13 +347,36 @@ def select_new_items(
     return selected, existing_count, new_count
 
 
+def json_projection(source_config: dict[str, Any]) -> frozenset[str]:
+    """The record keys a JSON source reads: its `dedupe_key` and `fields`, the `{name}`s
+    of its `message_template` and the `$name`s of its `enrich.prompt`.
+
+    Nothing else in a record reaches a message, a prompt or a row, so `extract_from_json`
+    keeps only these in `raw`.
+    """
+    keys: set[Any] = {source_config.get("dedupe_key")}
+    keys.update(source_config.get("fields", {}).values())
+    keys.update(_PLACEHOLDER_RE.findall(source_config.get("message_template", "")))
+    prompt = (source_config.get("enrich") or {}).get("prompt")
+    if prompt:
+        keys.update(string.Template(prompt).get_identifiers())
+    return frozenset(k for k in keys if isinstance(k, str) and k)
+
+
 def extract_from_json(
     records: list[dict[str, Any]],
     source_config: dict[str, Any],
 ) -> PipelineResult:
+    """Extract items from the first `limit` records of a JSON payload.
+
+    Each item's `raw` is its record projected to `json_projection`: a GitHub search
+    item carries dozens of nested objects no template reads, and `raw` lives as long
+    as the item does.
+    """
     source_id: str = source_config["id"]
     fields: dict[str, Any] = source_config.get("fields", {})
     limit: int = int(source_config.get("limit", len(records)))
+    keep = json_projection(source_config)
     result = PipelineResult(source_id=source_id)
 
     for record in records[:limit]:
@@ -225,7 +399,7 @@ def extract_from_json(
                 description=_json_field(record, fields.get("description")),
                 metric=_json_field(record, fields.get("metric")),
                 image_url=_json_field(record, fields.get("image_url")),
-                raw=record,
+                raw={k: v for k, v in record.items() if k in keep},
             )
         )
 
@@ -240,11 +414,36 @@ def _resolve_url(value: str, base_url: str) -> str:
     return urllib.parse.urljoin(base_url, value) if base_url and value else value
 
 
+@dataclass
+class HtmlPage:
+    """One HTML extraction: its `PipelineResult` and the row elements it read.
+
+    `rows` are the backend's elements (bs4 `Tag`s or selectolax nodes), at most the
+    source's `limit` of them, so a caller can count or inspect them without parsing
+    the page again.
+    """
+
+    result: PipelineResult
+    rows: list[Any] = field(default_factory=list)
+
+
 def extract_from_html(
     html: str,
     source_config: dict[str, Any],
+    *,
+    stop_when: Callable[[NormalizedItem], bool] | None = None,
 ) -> PipelineResult:
-    """Extract items from an HTML payload.
+    """Extract items from an HTML payload (`extract_html_page` without its rows)."""
+    return extract_html_page(html, source_config, stop_when=stop_when).result
+
+
+def extract_html_page(
+    html: str,
+    source_config: dict[str, Any],
+    *,
+    stop_when: Callable[[NormalizedItem], bool] | None = None,
+) -> HtmlPage:
+    """Extract items from an HTML payload, keeping the rows they were read from.
 
     source_config must include:
       row_selector  – CSS selector for the repeating item container
@@ -253,26 +452,33 @@ def extract_from_html(
 
     Optional:
       base_url      – prefix for resolving relative url/image_url values
+      parser        – one of `HTML_PARSERS`, the engine that reads the page
+                      (`html_backend`); default "html.parser"
+      extra_fields  – name → selector map; each value lands in `item.raw[name]`
+                      for the notification template
+
+    `stop_when` is offered each item as it is built; the first True ends the scan
+    with that item kept. A scan that was offered one reports its depth in `metrics`:
+    `fetched` rows on the page (after `limit`), `extracted` items built before it
+    stopped.
     """
     source_id: str = source_config["id"]
-    fields: dict[str, Any] = source_config.get("fields", {})
-    limit: int = int(source_config.get("limit", 0))
     row_selector: str = source_config.get("row_selector", "")
     base_url: str = source_config.get("base_url", "")
     result = PipelineResult(source_id=source_id)
+    page = HtmlPage(result=result)
 
     if not row_selector:
         result.errors.append(f"[{source_id}] missing row_selector for html source")
-        return result
+        return page
 
-    soup = BeautifulSoup(html, "html.parser")
-    rows: list[Tag] = list(soup.select(row_selector))
-    if limit:
-        rows = rows[:limit]
+    plan = extraction_plan(source_config)
+    backend = html_backend(source_config.get("parser", "html.parser"))
+    page.rows = backend.rows(html, plan)
 
-    for row in rows:
-        dedupe_key = _html_field(row, source_config.get("dedupe_key"))
-        title = _html_field(row, fields.get("title"))
+    for row in page.rows:
+        dedupe_key = backend.field(row, plan.dedupe_key)
+        title = backend.field(row, plan.fields.get("title"))
 
         if not dedupe_key or not title:
             result.errors.append(
@@ -281,23 +487,26 @@ def extract_from_html(
             )
             continue
 
-        result.items.append(
-            _build_item(
-                source_id=source_id,
-                dedupe_key=dedupe_key,
-                title=title,
-                url=_resolve_url(_html_field(row, fields.get("url")), base_url),
-                description=_html_field(row, fields.get("description")),
-                metric=_html_field(row, fields.get("metric")),
-                image_url=_resolve_url(_html_field(row, fields.get("image_url")), base_url),
-                raw={},
-            )
+        item = _build_item(
+            source_id=source_id,
+            dedupe_key=dedupe_key,
+            title=title,
+            url=_resolve_url(backend.field(row, plan.fields.get("url")), base_url),
+            description=backend.field(row, plan.fields.get("description")),
+            metric=backend.field(row, plan.fields.get("metric")),
+            image_url=_resolve_url(backend.field(row, plan.fields.get("image_url")), base_url),
+            raw={name: backend.field(row, sel) for name, sel in plan.extra_fields.items()},
         )
+        result.items.append(item)
+        if stop_when is not None and stop_when(item):
+            break
 
+    if stop_when is not None:
+        result.metrics = SourceMetrics(fetched=len(page.rows), extracted=len(result.items))
     if not result.items and not result.errors:
         result.errors.append(f"[{source_id}] extraction produced zero items")
 
-    return result
+    return page
 
 
 _URL_FIELDS: frozenset[str] = frozenset({"url", "image_url", "trailer_url"})
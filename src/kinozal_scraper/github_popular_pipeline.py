@@ -17,7 +17,10 @@ from kinozal_scraper.generic_pipeline import (
     extract_from_json,
     select_new_items,
 )
-from kinozal_scraper.http_retry import retry_api_http
+from kinozal_scraper.host_governor import GOVERNOR
+from kinozal_scraper.http_observability import observe_http
+from kinozal_scraper.http_retry import raise_for_api_status, retry_api_http
+from kinozal_scraper.http_transport import exchange
 from kinozal_scraper.pipeline_config import load_sources_config
 from kinozal_scraper.sheets_storage import Storage
 from kinozal_scraper.telegram_notifier import Notifier
@@ -39,11 +42,20 @@ def _clean_headers(headers: dict[str, str]) -> dict[str, str]:
 def _get_json(url: str, params: dict[str, str], headers: dict[str, str]) -> Any:
     """One GET of the GitHub Search API, retried on transient 5xx (#365).
 
-    403/429 are NOT retried here — for this transport they are a rate limit, not
+    403/429 are NOT backed off here — for this transport they are a rate limit, not
     the anti-bot challenge `http_fetch` survives; see `http_retry` for the split.
+    An advertised limit gets one retry timed to its reset when that fits the budget,
+    so a single per-minute 429 no longer costs the source its day.
     """
-    resp = requests.get(url, params=params, headers=headers, timeout=30)
-    resp.raise_for_status()
+    with GOVERNOR.guard(url), observe_http(url) as call:
+        resp = call.response = exchange(
+            "GET",
+            url,
+            lambda: requests.get(url, params=params, headers=headers, timeout=30),
+            client="requests",
+            params=params,
+        )
+        raise_for_api_status(resp)
     return resp.json()
 
 
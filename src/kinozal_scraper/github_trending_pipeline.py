@@ -6,8 +6,6 @@ import logging
 import re
 from typing import Any
 
-from bs4 import BeautifulSoup
-
 from kinozal_scraper.gemini_enricher import FALLBACK_MARKER, Enricher, QuotaExhausted
 from kinozal_scraper.generic_pipeline import (
     ROW_HEADERS,
@@ -16,7 +14,7 @@ from kinozal_scraper.generic_pipeline import (
     SourceMetrics,
     bounded_evidence,
     build_notification,
-    extract_from_html,
+    extract_html_page,
     select_new_items,
 )
 from kinozal_scraper.http_fetch import fetch_html
@@ -52,7 +50,7 @@ def _digits_only(text: str) -> str:
 
 def _normalize_items(items: list[NormalizedItem]) -> list[NormalizedItem]:
     """Strip the leading `/` from `dedupe_key` (and mirror into `title`), and
-    normalise `metric` to a digit-only string.
+    normalise `metric` and `raw["stars_today"]` to digit-only strings.
 
     The trending page exposes `h2 a@href` as `/owner/repo`; we drop the slash
     so the stored key matches `github_new_popular`'s `full_name` shape and the
@@ -61,55 +59,23 @@ def _normalize_items(items: list[NormalizedItem]) -> list[NormalizedItem]:
     locale-formatted number ("14,113") which we strip to digits only so the
     shared `github_projects.metric` column matches `github_new_popular`'s
     integer-string shape (see docs/architecture/storage.md).
+
+    `stars_today` is the daily delta ("1,690 stars today"), read by the source's
+    `extra_fields` from `span.d-inline-block.float-sm-right`. It is NOT a column on
+    the shared tab (where `metric` means total stars — invariant from #86); it only
+    reaches the notification template as `{stars_today}`. A missing element stays
+    empty, and the template renders "(+ today)", which the operator can still spot
+    as drift.
     """
     for item in items:
         item.dedupe_key = item.dedupe_key.lstrip("/")
         item.title = item.dedupe_key
         item.metric = _digits_only(item.metric)
+        if "stars_today" in item.raw:
+            item.raw["stars_today"] = _digits_only(item.raw["stars_today"])
     return items
 
 
-def _enrich_with_stars_today(html: str, items: list[NormalizedItem]) -> None:
-    """Populate `item.raw["stars_today"]` for each item from the trending HTML.
-
-    The daily-delta is shown on the trending page in
-    `span.d-inline-block.float-sm-right` as text like "1,690 stars today".
-    It is NOT a column on the shared `github_projects` Sheets tab (where
-    `metric` means total stars — invariant from #86). We surface the daily
-    value only through the notification template, by stashing it in `raw`
-    keyed by `stars_today` so the template can reference `{stars_today}`.
-
-    Missing or unparseable element → empty string (notification template
-    will render "(+ today)" which the operator can still spot as drift).
-    """
-    soup = BeautifulSoup(html, "html.parser")
-    by_href: dict[str, str] = {}
-    for row in soup.select("article.Box-row"):
-        link = row.select_one("h2 a")
-        if not link or not link.get("href"):
-            continue
-        delta_el = row.select_one("span.d-inline-block.float-sm-right")
-        by_href[str(link["href"]).strip()] = _digits_only(
-            delta_el.get_text(strip=True) if delta_el else ""
-        )
-    for item in items:
-        # item.dedupe_key was already normalised to "owner/repo" — restore
-        # the leading slash to match the original href used as map key.
-        key = "/" + item.dedupe_key if not item.dedupe_key.startswith("/") else item.dedupe_key
-        item.raw["stars_today"] = by_href.get(key, "")
-
-
-def _count_rows(html: str, row_selector: str) -> int:
-    """How many rows the page offered, before the source's `limit` and extraction.
-
-    Counted here rather than threaded out of `extract_from_html` so the extractor
-    keeps one job; one extra parse of a page we already have in memory costs
-    milliseconds once per run."""
-    if not row_selector:
-        return 0
-    return len(BeautifulSoup(html, "html.parser").select(row_selector))
-
-
 def _warn_on_drift(result: PipelineResult, items: list[NormalizedItem]) -> None:
     """Surface empty metric/description so page-layout drift reaches the operator
     instead of silently shipping blank fields (§IV).
@@ -222,10 +188,9 @@ def _process_trending_source(
     # `limit`, which is the top-N of today's trending list — the product intent.
     # Reading the whole page instead was tried and reverted: it turns "top 10
     # trending" into "any 10 rows we have not seen", i.e. positions 11..25.
-    metrics.fetched = min(
-        _count_rows(html_text, source.get("row_selector", "")), int(source["limit"])
-    )
-    extracted = extract_from_html(html_text, source)
+    page = extract_html_page(html_text, source)
+    metrics.fetched = len(page.rows)
+    extracted = page.result
     if not extracted.items and extracted.errors:
         logger.error("[%s] extraction errors: %s", source["id"], extracted.errors)
         result.errors.extend(extracted.errors)
@@ -246,7 +211,6 @@ def _process_trending_source(
         result.warnings.extend(extracted.errors)
 
     items = _normalize_items(extracted.items)
-    _enrich_with_stars_today(html_text, items)
     _warn_on_drift(result, items)
 
     result.items = items
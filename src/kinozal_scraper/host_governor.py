@@ -0,0 +1,269 @@
+"""Per-host pacing, concurrency and fail-fast shared by every outbound transport.
+
+Three mechanisms, one per-host state, consulted around each single HTTP attempt:
+
+- **Token bucket.** A host with a known request budget (Steam Store appdetails, the
+  GitHub Search API) gets a refill rate and a burst; an attempt that finds the bucket
+  empty waits for the next token instead of spending one of the server's. Hosts not
+  listed in `_HOST_RATES` are unpaced — pacing is a measured per-host fact, not a
+  default.
+- **Circuit breaker.** After `_FAILURE_THRESHOLD` consecutive *host* failures
+  (transport errors and 5xx — the origin is down or unreachable) the circuit opens
+  and every attempt raises `CircuitOpenError` at once, for `_COOLDOWN_S`. Then one
+  probe is let through: success closes the circuit, failure re-opens it.
+- **Concurrency cap.** At most `HTTP_HOST_CONCURRENCY` attempts (default 4) are in
+  flight to one host at once, however many prefetch or hedge workers want it. An
+  attempt waits for a slot only after the breaker and the bucket admitted it, so a
+  refused host still fails in microseconds.
+
+The breaker is what the Kinozal facade needed: once kinozal.tv is down, each details
+page used to wait out a timeout or the full `retry_antibot_http` schedule before
+`_from_mirror` ran. With the circuit open the primary fails in microseconds and the
+facade's existing `except` sends the page straight to the mirror.
+
+**What does not count as a failure.** A 4xx is an answer — the host is up — so it
+resets the count like a 200 does. That includes the Cloudflare 403 soldout's patient
+schedule exists to outlast (#396): counting it would let the breaker cut that
+schedule short, which is exactly the wrong reading of a probabilistic block.
+
+**The threshold sits above one call's own retries.** `_MAX_ATTEMPTS` attempts of a
+single call never open the circuit by themselves — that call's fate belongs to the
+retry policy in `http_retry`. The breaker only decides *across* calls, so no
+existing "four attempts on a 5xx" contract changes. `CircuitOpenError` is not an
+`HTTPError`, so no retry policy retries it.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+import requests
+from curl_cffi.requests.exceptions import HTTPError as CurlHTTPError
+from curl_cffi.requests.exceptions import RequestException as CurlRequestException
+
+from kinozal_scraper.http_retry import _MAX_ATTEMPTS
+
+logger = logging.getLogger(__name__)
+
+# (tokens per second, burst). Steam Store's appdetails is commonly reported to
+# throttle at about 200 requests per 5 minutes; the GitHub Search API allows 30
+# requests per minute authenticated. Both budgets sit far above one nightly run,
+# so the buckets only bite when a run loops or a limit drops — that is the point.
+_HOST_RATES: dict[str, tuple[float, float]] = {
+    "store.steampowered.com": (200 / 300, 10),
+    "api.github.com": (30 / 60, 5),
+}
+
+# A browser's handful of parallel requests to one origin: enough to overlap the
+# kinozal details pages, few enough not to look like a crawler to Cloudflare.
+HOST_CONCURRENCY_ENV = "HTTP_HOST_CONCURRENCY"
+_HOST_CONCURRENCY = 4
+
+_FAILURE_THRESHOLD = _MAX_ATTEMPTS + 1
+# Five minutes: long enough that a down origin costs one probe per cooldown, and
+# shorter than the patient schedule's 720 s spacing, so each patient attempt meets
+# a closed or half-open circuit, never an open one.
+_COOLDOWN_S = 300.0
+
+
+def concurrency_from_env(name: str, default: int) -> int:
+    """A positive whole number from `name`; unset is `default`, anything else is a
+    WARNING and `default` too."""
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return default
+    if raw.isdigit() and int(raw) > 0:
+        return int(raw)
+    logger.warning("ignoring %s=%r — expected a positive integer, using %d", name, raw, default)
+    return default
+
+
+class CircuitOpenError(Exception):
+    """The host failed repeatedly; this attempt was refused without a request."""
+
+    def __init__(self, host: str, failures: int, retry_in_s: float) -> None:
+        super().__init__(
+            f"circuit open for {host} after {failures} consecutive failures; "
+            f"next probe in {retry_in_s:.0f}s"
+        )
+        self.host = host
+
+
+def is_host_failure(exc: BaseException) -> bool:
+    """True for errors that say the host is down or unreachable: 5xx and transport.
+
+    Checked for both transports' hierarchies, HTTPError first — curl_cffi's derives
+    from its own `RequestException`, so the order decides whether a 404 reads as a
+    transport failure."""
+    if isinstance(exc, CurlHTTPError | requests.HTTPError):
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+        return isinstance(status, int) and status >= 500
+    return isinstance(exc, CurlRequestException | requests.RequestException)
+
+
+class TokenBucket:
+    """Classic token bucket; `reserve` takes a token and says how long to wait for it."""
+
+    def __init__(self, rate: float, burst: float) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._stamp = time.monotonic()
+
+    def reserve(self) -> float:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._stamp) * self.rate)
+        self._stamp = now
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+class CircuitBreaker:
+    """Closed → open after `threshold` consecutive failures → one probe after cooldown."""
+
+    def __init__(self, threshold: int, cooldown_s: float) -> None:
+        self.threshold = threshold
+        self.cooldown_s = cooldown_s
+        self.failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    def admit(self, host: str) -> None:
+        if self._opened_at is None:
+            return
+        waited = time.monotonic() - self._opened_at
+        if waited < self.cooldown_s or self._probing:
+            raise CircuitOpenError(host, self.failures, max(0.0, self.cooldown_s - waited))
+        self._probing = True
+        logger.info("[host_governor] %s: cooldown over, letting one probe through", host)
+
+    def record(self, host: str, failed: bool) -> bool:
+        """Record an outcome; True when this failure is the one that opened the circuit."""
+        self._probing = False
+        if not failed:
+            if self._opened_at is not None:
+                logger.info("[host_governor] %s: probe succeeded, circuit closed", host)
+            self.failures = 0
+            self._opened_at = None
+            return False
+        self.failures += 1
+        if self._opened_at is None and self.failures < self.threshold:
+            return False
+        reopened = self._opened_at is not None
+        self._opened_at = time.monotonic()
+        logger.warning(
+            "[host_governor] %s: circuit %s after %d consecutive failures — failing fast for %.0fs",
+            host,
+            "re-opened" if reopened else "opened",
+            self.failures,
+            self.cooldown_s,
+        )
+        return not reopened
+
+
+class HostGovernor:
+    """Per-host buckets, breakers and slots behind one lock; one instance per process.
+
+    `host_concurrency` defaults to `HTTP_HOST_CONCURRENCY`, read once, here."""
+
+    def __init__(
+        self,
+        *,
+        rates: dict[str, tuple[float, float]] | None = None,
+        failure_threshold: int = _FAILURE_THRESHOLD,
+        cooldown_s: float = _COOLDOWN_S,
+        host_concurrency: int | None = None,
+    ) -> None:
+        self._rates = dict(_HOST_RATES if rates is None else rates)
+        self._threshold = failure_threshold
+        self._cooldown_s = cooldown_s
+        self.host_concurrency = (
+            concurrency_from_env(HOST_CONCURRENCY_ENV, _HOST_CONCURRENCY)
+            if host_concurrency is None
+            else host_concurrency
+        )
+        self._buckets: dict[str, TokenBucket] = {}
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._slots: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+        self.stats: Counter[tuple[str, str]] = Counter()
+
+    def before(self, url: str) -> float:
+        """Admit one attempt at `url`: raise if its circuit is open, else return the
+        seconds to wait for a token (0.0 for an unpaced host)."""
+        host = urlsplit(url).netloc
+        with self._lock:
+            breaker = self._breakers.setdefault(
+                host, CircuitBreaker(self._threshold, self._cooldown_s)
+            )
+            try:
+                breaker.admit(host)
+            except CircuitOpenError:
+                self.stats[host, "short_circuited"] += 1
+                raise
+            if host not in self._rates:
+                return 0.0
+            bucket = self._buckets.setdefault(host, TokenBucket(*self._rates[host]))
+            delay = bucket.reserve()
+            if delay:
+                self.stats[host, "paced"] += 1
+        if delay:
+            logger.info("[host_governor] %s: pacing %.2fs for a token", host, delay)
+        return delay
+
+    def after(self, url: str, exc: BaseException | None) -> None:
+        host = urlsplit(url).netloc
+        failed = exc is not None and is_host_failure(exc)
+        with self._lock:
+            breaker = self._breakers.setdefault(
+                host, CircuitBreaker(self._threshold, self._cooldown_s)
+            )
+            if breaker.record(host, failed):
+                self.stats[host, "opened"] += 1
+
+    @contextmanager
+    def guard(self, url: str) -> Iterator[None]:
+        """Wrap ONE attempt (inside any retry decorator, so every attempt is seen).
+
+        The host's slot is held for the attempt only, never across a retry's sleep."""
+        if delay := self.before(url):
+            time.sleep(delay)
+        with self._slot(url):
+            try:
+                yield
+            except BaseException as exc:
+                self.after(url, exc)
+                raise
+            self.after(url, None)
+
+    def _slot(self, url: str) -> threading.BoundedSemaphore:
+        host = urlsplit(url).netloc
+        with self._lock:
+            return self._slots.setdefault(host, threading.BoundedSemaphore(self.host_concurrency))
+
+    def summary_lines(self) -> list[str]:
+        """Run-summary lines, one per host that was paced or short-circuited."""
+        hosts = sorted({host for host, _ in self.stats})
+        return [
+            f"host_governor: {host} opened={self.stats[host, 'opened']} "
+            f"short_circuited={self.stats[host, 'short_circuited']} "
+            f"paced={self.stats[host, 'paced']}"
+            for host in hosts
+        ]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+            self._breakers.clear()
+            self._slots.clear()
+            self.stats.clear()
+
+
+GOVERNOR = HostGovernor()
@@ -16,14 +16,27 @@ because choosing a remedy without them would be guesswork.
 
 from __future__ import annotations
 
+import atexit
+import functools
 import logging
 import re
+import threading
+import time
+from collections import Counter, OrderedDict, deque
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
 from typing import Any
+from urllib.parse import urlsplit
 
 from curl_cffi import requests
 from curl_cffi.requests.exceptions import HTTPError
 
+from kinozal_scraper.host_governor import GOVERNOR, concurrency_from_env
+from kinozal_scraper.http_observability import CURL_TIMING_INFOS, observe_http
 from kinozal_scraper.http_retry import retry_antibot_http, retry_antibot_patient
+from kinozal_scraper.http_transport import exchange
+from kinozal_scraper.local_store import LocalStore, open_store
 
 logger = logging.getLogger(__name__)
 
@@ -85,6 +98,159 @@ def describe_block(status_code: int, headers: Any, body: str) -> str:
     return " ".join(parts)
 
 
+# Keep-alive pool bounds. Eight hosts covers one run's working set (kinozal.tv,
+# kinozal.guru, the poster uploaders, github.com, soldout) with room to spare; an
+# evicted host only pays one fresh handshake. 60 s idle is under the keep-alive
+# window typical edges hold an idle connection open for, so a pooled session is
+# closed by us before the peer's silent close would cost a failed reuse.
+_POOL_MAX_HOSTS = 8
+_POOL_IDLE_TIMEOUT_S = 60.0
+
+
+class _HostSession:
+    """One pooled curl_cffi session plus the bookkeeping its log lines report."""
+
+    def __init__(self, session: requests.Session) -> None:
+        self.session = session
+        self.last_used = time.monotonic()
+        self.reused = 0
+
+
+class _SessionPool:
+    """Per-host keep-alive `Session`s behind every `http_fetch` GET.
+
+    Module-level `requests.get` builds and tears down a Curl handle per call, so
+    every listing, details page and poster paid a fresh TCP + impersonated TLS
+    handshake. A pooled session per host lets libcurl reuse the connection.
+
+    The sessions are created **bare**: `impersonate`/`timeout`/`headers` still travel
+    per request from `_HTML_GET`/`_IMAGE_GET`, so the pooled call is the same request
+    the module-level one was and `TestSharedRequestKwargs` keeps pinning it there.
+    `curl_infos` only asks libcurl to report the phase timers `http_observability`
+    logs. `discard_cookies` keeps the one-shot GET's cookie behaviour: a `Set-Cookie`
+    is never stored, so no request carries a cookie an earlier response set. Only the
+    connection is shared.
+    curl_cffi gives each thread its own Curl handle inside one `Session`
+    (`use_thread_local_curl`), so the lock below only guards the dict, never a request.
+
+    The knobs are logged with every opened session and every close carries its reuse
+    count: "keep-alive is working" has to be readable in a run log, not assumed."""
+
+    def __init__(
+        self,
+        *,
+        max_hosts: int = _POOL_MAX_HOSTS,
+        idle_timeout_s: float = _POOL_IDLE_TIMEOUT_S,
+    ) -> None:
+        self._max_hosts = max_hosts
+        self._idle_timeout_s = idle_timeout_s
+        self._sessions: OrderedDict[str, _HostSession] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        # Through `http_transport`: in replay mode no session is opened at all.
+        resp: requests.Response = exchange(
+            "GET",
+            url,
+            lambda: self._acquire(urlsplit(url).netloc).get(url, **kwargs),
+            client="curl_cffi",
+            stream=kwargs.get("stream", False),
+        )
+        return resp
+
+    def close(self) -> None:
+        with self._lock:
+            while self._sessions:
+                host, entry = self._sessions.popitem(last=False)
+                self._close(host, entry, "pool closed")
+
+    def _acquire(self, host: str) -> requests.Session:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._sessions.get(host)
+            if entry is not None and now - entry.last_used > self._idle_timeout_s:
+                del self._sessions[host]
+                self._close(host, entry, f"idle > {self._idle_timeout_s:.0f}s")
+                entry = None
+            if entry is None:
+                while len(self._sessions) >= self._max_hosts:
+                    lru_host, lru = self._sessions.popitem(last=False)
+                    self._close(lru_host, lru, "evicted (pool full)")
+                entry = _HostSession(
+                    requests.Session(curl_infos=list(CURL_TIMING_INFOS), discard_cookies=True)
+                )
+                self._sessions[host] = entry
+                logger.info(
+                    "[http_fetch] keep-alive session opened for %s (pool %d/%d, idle_timeout=%.0fs)",
+                    host,
+                    len(self._sessions),
+                    self._max_hosts,
+                    self._idle_timeout_s,
+                )
+            else:
+                entry.reused += 1
+                self._sessions.move_to_end(host)
+                logger.debug("[http_fetch] keep-alive reuse #%d for %s", entry.reused, host)
+            entry.last_used = now
+            return entry.session
+
+    @staticmethod
+    def _close(host: str, entry: _HostSession, reason: str) -> None:
+        logger.info(
+            "[http_fetch] keep-alive session for %s closed: %s (reused %d time(s))",
+            host,
+            reason,
+            entry.reused,
+        )
+        entry.session.close()
+
+
+# One pool per process: every fetch helper below shares it, so a details page and the
+# poster on the same host ride one connection. Closed at interpreter exit, which every
+# pipeline entry point reaches, so each session's reuse line lands in the run log.
+_POOL = _SessionPool()
+atexit.register(_POOL.close)
+
+# Every prefetch of the run (listing pages, details pages, Steam appdetails, posters)
+# shares these workers, so the run's total fan-out is one number: the global cap,
+# `HTTP_MAX_CONCURRENCY`. Each host is held to the governor's own, smaller cap
+# (`HTTP_HOST_CONCURRENCY`), so a batch spread over poster hosts still overlaps.
+MAX_CONCURRENCY_ENV = "HTTP_MAX_CONCURRENCY"
+_PREFETCH_WORKERS = concurrency_from_env(MAX_CONCURRENCY_ENV, 8)
+_PREFETCH_POOL = ThreadPoolExecutor(max_workers=_PREFETCH_WORKERS, thread_name_prefix="prefetch")
+
+
+def prefetch(
+    fetch: Callable[[Any], Any], items: Sequence[Any], *, ahead: int | None = None
+) -> Iterator[Future[Any]]:
+    """`fetch(item)` for each of `items` on the shared prefetch workers, yielded in
+    item order.
+
+    `ahead` bounds how many fetches are submitted beyond the one being yielded, and
+    so how many results wait in memory; None submits them all at once. With `0` each
+    fetch runs on the consumer's thread when its future is asked for. A failed fetch
+    is the exception of its future either way, never raised here.
+
+    `fetch` must not wait on another `prefetch`: it would hold a worker while its
+    own fetches queue behind it."""
+    if ahead == 0:
+        for item in items:
+            future: Future[Any] = Future()
+            try:
+                future.set_result(fetch(item))
+            except Exception as exc:  # noqa: BLE001 — handed to the consumer, as a pooled fetch's is
+                future.set_exception(exc)
+            yield future
+        return
+    pending = iter(items)
+    window = len(items) if ahead is None else ahead + 1
+    futures = deque(_PREFETCH_POOL.submit(fetch, item) for item in islice(pending, window))
+    while futures:
+        yield futures.popleft()
+        # Taking one result out of the window lets the next fetch in.
+        futures.extend(_PREFETCH_POOL.submit(fetch, item) for item in islice(pending, 1))
+
+
 def _get_once(url: str, **kwargs: Any) -> requests.Response:
     """Single curl_cffi GET + raise_for_status, WITHOUT the retry wrapper.
 
@@ -97,19 +263,37 @@ def _get_once(url: str, **kwargs: Any) -> requests.Response:
     Diagnostics attach to `except HTTPError`, not `if status >= 400`: curl_cffi decides
     what is an error, the happy path remains untouched, and logging is tied to failure.
     Bare `raise` propagates the original exception unchanged (#358: logging is additive,
-    not a replacement failure)."""
-    resp = requests.get(url, **kwargs)
+    not a replacement failure).
+
+    The GET goes through the per-host keep-alive `_POOL` rather than the module-level
+    `requests.get`, which opened a fresh connection per call.
+
+    Each attempt passes the shared `GOVERNOR`: once a host's circuit is open the
+    attempt raises `CircuitOpenError` before any socket work, so a dead kinozal.tv
+    sends later pages to the mirror at once instead of after another timeout.
+
+    Inside the guard, `observe_http` emits the attempt's `http_call` breadcrumb."""
+    with GOVERNOR.guard(url), observe_http(url) as call:
+        resp = _POOL.get(url, **kwargs)
+        call.response = resp
+        _raise_for_status(url, resp)
+    return resp
+
+
+def _raise_for_status(url: str, resp: requests.Response) -> None:
+    """`raise_for_status` plus the #358 block line, logged before the error propagates."""
     try:
         resp.raise_for_status()
     except HTTPError:
-        # Use `decode(errors="replace")` rather than `resp.text`: the block-page body is
-        # already in memory, and broken encoding must not crash failure diagnostics.
-        body = resp.content.decode("utf-8", "replace") if resp.content else ""
-        logger.warning(
-            "[http_fetch] %s %s", url, describe_block(resp.status_code, resp.headers, body)
-        )
+        _log_block(url, resp, resp.content)
         raise
-    return resp
+
+
+def _log_block(url: str, resp: requests.Response, content: bytes) -> None:
+    # Use `decode(errors="replace")` rather than `resp.text`: the block-page body is
+    # already in memory, and broken encoding must not crash failure diagnostics.
+    body = content.decode("utf-8", "replace") if content else ""
+    logger.warning("[http_fetch] %s %s", url, describe_block(resp.status_code, resp.headers, body))
 
 
 # The retrying transport every production call site uses. Applied as a plain call
@@ -134,7 +318,9 @@ class NotAnImageError(Exception):
     Carries `url`, the actual `content_type`, and the already-downloaded `body`
     so a resolver can extract the direct signed image link from the viewer page
     WITHOUT a second GET of the same 300 KB page (runtime tokens/traffic; keeps
-    the signed-link `expires` window tight)."""
+    the signed-link `expires` window tight). The body is only downloaded when the
+    caller asked for it (`fetch_bytes(..., keep_html=True)`); otherwise it is empty
+    and the page was never read past its headers."""
 
     def __init__(self, url: str, content_type: str, body: bytes) -> None:
         super().__init__(f"{url} returned {content_type!r}, not an image")
@@ -143,6 +329,19 @@ class NotAnImageError(Exception):
         self.body = body
 
 
+class BodyTooLargeError(Exception):
+    """The response body is larger than the caller's cap; the download was abandoned.
+
+    Not an `HTTPError`, so no retry policy retries it: the same URL would send the
+    same oversized body again."""
+
+    def __init__(self, url: str, limit: int, size: int | None) -> None:
+        seen = "unknown size" if size is None else f"{size} bytes"
+        super().__init__(f"{url} body exceeds {limit} bytes ({seen}), download abandoned")
+        self.url = url
+        self.limit = limit
+
+
 # Request parameters live here, in one place, because more than one caller exists:
 # `fetch_html` and `fetch_html_patient` differ ONLY in retry schedule, and that
 # claim stops being true the moment someone copy-pastes an `impersonate`/`timeout`
@@ -155,8 +354,99 @@ _IMAGE_GET: dict[str, Any] = {
 }
 
 
+# Validator cache bounds. Entries are only written for responses that carry a
+# validator, which on this tree means listing-scale pages (trending, kinozal
+# listings, soldout), not the per-item details pages; 256 covers them many times
+# over. A week's TTL drops the body of a URL the operator has stopped configuring.
+_VALIDATOR_NAMESPACE = "http_validators"
+_VALIDATOR_MAX_ENTRIES = 256
+_VALIDATOR_TTL_S = 7 * 24 * 3600.0
+
+# `hit` = a cached validator was sent, `miss` = none was stored, `304` = the server
+# confirmed the cached body. hit - 304 is the number of pages that really changed.
+CACHE_STATS: Counter[str] = Counter()
+_CACHE_STATS_LOCK = threading.Lock()
+
+
+@functools.cache
+def _validator_store() -> LocalStore | None:
+    # Opened once, on first use: the same process serves every fetch of the run.
+    return open_store(_VALIDATOR_NAMESPACE, max_entries=_VALIDATOR_MAX_ENTRIES)
+
+
+def _count_cache(outcome: str) -> None:
+    # Listing pages are revalidated from the prefetch workers, several at once.
+    with _CACHE_STATS_LOCK:
+        CACHE_STATS[outcome] += 1
+
+
+def _conditional_text(get: Callable[..., requests.Response], url: str) -> str:
+    """GET `url` as text, revalidating a body stored on a previous run.
+
+    Trending, the kinozal listings and soldout are fetched once a day and often
+    have not changed. When the last response carried an `ETag`/`Last-Modified`,
+    this run sends `If-None-Match`/`If-Modified-Since`; a 304 costs no body and is
+    one fewer full page served to a Cloudflare bot score that counts them.
+
+    The validator headers are merged *over* `_HTML_GET`, exactly like the image
+    `Accept` override, so the impersonate profile is untouched. With `STATE_DIR`
+    unset there is no store and the call is byte-for-byte the plain GET."""
+    store = _validator_store()
+    if store is None:
+        return get(url, **_HTML_GET).text
+    cached = store.get_json(url)
+    kwargs = _HTML_GET
+    if isinstance(cached, dict) and isinstance(cached.get("body"), str):
+        _count_cache("hit")
+        conditional = {}
+        if cached.get("etag"):
+            conditional["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            conditional["If-Modified-Since"] = cached["last_modified"]
+        kwargs = {**_HTML_GET, "headers": conditional}
+    else:
+        cached = None
+        _count_cache("miss")
+    resp = get(url, **kwargs)
+    if resp.status_code == 304 and cached is not None:
+        _count_cache("304")
+        logger.info("[http_fetch] %s not modified (304), served from cache", url)
+        # A 304 confirms the entry: store it again so its TTL runs from now, with any
+        # validator the 304 itself carried, or a page that never changes would lose its
+        # validators a week after the one full response and be downloaded again.
+        refreshed = {
+            **cached,
+            "etag": resp.headers.get("etag") or cached.get("etag", ""),
+            "last_modified": resp.headers.get("last-modified") or cached.get("last_modified", ""),
+        }
+        store.put_json(url, refreshed, ttl_s=_VALIDATOR_TTL_S)
+        return str(cached["body"])
+    text: str = resp.text
+    etag = resp.headers.get("etag", "")
+    last_modified = resp.headers.get("last-modified", "")
+    if etag or last_modified:
+        store.put_json(
+            url,
+            {"etag": etag, "last_modified": last_modified, "body": text},
+            ttl_s=_VALIDATOR_TTL_S,
+        )
+    elif cached is not None:
+        # The host stopped sending validators: a stale body must not outlive them.
+        store.delete(url)
+    return text
+
+
+def transport_summary_lines() -> list[str]:
+    """Run-summary lines for the shared transport; empty when nothing was measured."""
+    if not CACHE_STATS:
+        return []
+    return [
+        f"http_cache: hit={CACHE_STATS['hit']} miss={CACHE_STATS['miss']} 304={CACHE_STATS['304']}"
+    ]
+
+
 def fetch_html(url: str) -> str:
-    return _get(url, **_HTML_GET).text
+    return _conditional_text(_get, url)
 
 
 def fetch_html_patient(url: str) -> str:
@@ -168,10 +458,65 @@ def fetch_html_patient(url: str) -> str:
     general "more reliable fetch" — it costs a job slot for ~4.6 h and its numbers
     were measured against one host (`docs/adr/0002-soldout-cloudflare-spread-retries.md`).
     """
-    return _get_patient(url, **_HTML_GET).text
+    return _conditional_text(_get_patient, url)
+
+
+def fetch_html_once(url: str) -> str:
+    """`fetch_html_patient`'s request as a single attempt, with no retry at all.
+
+    For the patient ledger (`patient_ledger.py`), which spaces soldout's attempts
+    across short cron invocations instead of sleeping between them in one process:
+    each invocation makes exactly one attempt and the ledger counts it. Same
+    kwargs, validators and `describe_block` line as the retrying helpers."""
+    return _conditional_text(_get_once, url)
+
 
+# Telegram's `sendPhoto` refuses photos over 10 MB, so a larger body could never be
+# delivered; a real poster is 100–500 KB. The cap bounds what a misbehaving host can
+# make us hold in memory, not what a poster may weigh.
+_MAX_IMAGE_BYTES = 10 * 1024 * 1024
+# Enough of an error page for `describe_block`'s `<title>` and Cloudflare-code scan.
+_ERROR_BODY_LIMIT = 64 * 1024
 
-def fetch_bytes(url: str) -> bytes:
+
+def _content_type(resp: requests.Response) -> str:
+    return str(resp.headers.get("content-type", "")).split(";")[0].strip().lower()
+
+
+def _read_prefix(resp: requests.Response, limit: int) -> bytes:
+    buffer = bytearray()
+    for chunk in resp.iter_content():
+        buffer += chunk[: limit - len(buffer)]
+        if len(buffer) >= limit:
+            break
+    return bytes(buffer)
+
+
+def _read_capped(url: str, resp: requests.Response, limit: int) -> bytes:
+    """Read a streamed body into one buffer, abandoning it past `limit` bytes.
+
+    A declared `Content-Length` is checked before any byte is read and sizes the
+    buffer up front, so each chunk is copied into place instead of regrowing the body.
+    The header is a hint, not a promise: a chunked response starts from an empty
+    buffer, and a body that outruns its declared length is still cut off at `limit`."""
+    declared = _header(resp.headers, "content-length")
+    size = int(declared) if declared.isdigit() else None
+    if size is not None and size > limit:
+        raise BodyTooLargeError(url, limit, size)
+    buffer = bytearray(size or 0)
+    filled = 0
+    for chunk in resp.iter_content():
+        if filled + len(chunk) > limit:
+            raise BodyTooLargeError(url, limit, size)
+        # A slice assignment writes in place while the chunk fits the preallocated
+        # length and extends the buffer when it does not.
+        buffer[filled : filled + len(chunk)] = chunk
+        filled += len(chunk)
+    del buffer[filled:]
+    return bytes(buffer)
+
+
+def fetch_bytes(url: str, *, keep_html: bool = False, max_bytes: int = _MAX_IMAGE_BYTES) -> bytes:
     """Binary sibling of fetch_html for downloading assets (e.g. posters).
 
     Same browser TLS fingerprint, so Cloudflare-fronted image hosts (issue
@@ -183,7 +528,7 @@ def fetch_bytes(url: str) -> bytes:
     curl_cffi's chrome-impersonate default sends a *navigation* Accept
     (`text/html,...`), and content-negotiating hosts (imageban.ru, fastpic) answer
     that with a 200 `text/html` landing page instead of the JPEG → the poster is
-    lost. The header is passed to `requests.get` as an override: curl_cffi merges
+    lost. The header is passed to the pooled `Session.get` as an override: curl_cffi merges
     it by key over the impersonate profile, so UA / Sec-Ch-Ua / TLS fingerprint
     (the #217/#225 403-avoidance) stay intact — only `Accept` changes.
 
@@ -192,12 +537,50 @@ def fetch_bytes(url: str) -> bytes:
     **defense-in-depth** for the rare host that still returns HTML — a blocklist
     (`text/html`), not an `image/*` allowlist, since posters live on a long tail
     of uploader hosts that may serve valid images with exotic content-types.
+
+    The body is streamed and the content-type checked from the headers, before the
+    body is read. An HTML page is refused unread (`NotAnImageError` with an empty
+    body) unless `keep_html` asks for it — `Kinozal.fetch_poster` does, for fastpic,
+    whose viewer page carries the signed image link. Any body larger than `max_bytes`
+    raises `BodyTooLargeError`, from `Content-Length` when the host declares one, else
+    mid-stream: a misbehaving host can no longer hand us an unbounded download.
     """
-    # NotAnImageError is raised BELOW, after _get returns — outside the retry
-    # wrapper: a 200 text/html anti-hotlink page is a content problem, not a
-    # transient, so it must not be retried.
-    resp = _get(url, **_IMAGE_GET)
-    content_type = resp.headers.get("content-type", "").split(";")[0].strip().lower()
-    if content_type == "text/html":
-        raise NotAnImageError(url, content_type, resp.content)
-    return resp.content
+    return _download(url, keep_html=keep_html, max_bytes=max_bytes)
+
+
+def _download_once(url: str, *, keep_html: bool, max_bytes: int) -> bytes:
+    """One streamed attempt of `fetch_bytes`, body included.
+
+    The body is read inside the attempt so the `http_call` breadcrumb's `total_ms`
+    and `bytes` cover the transfer, and a connection dropped mid-body counts against
+    the host like any other transport failure. On an error status only an
+    `_ERROR_BODY_LIMIT` prefix is read for the #358 block line before the `HTTPError`
+    is re-raised unchanged. `NotAnImageError` and `BodyTooLargeError` are content
+    problems, not transients: no retry predicate matches them, so they leave after
+    one attempt.
+
+    curl_cffi streams on a duplicate of the session's Curl handle, so a streamed
+    download does not reuse the pool's keep-alive connection. Posters live on uploader
+    hosts the tracker pages never touch, so there is little to reuse there anyway."""
+    with GOVERNOR.guard(url), observe_http(url) as call:
+        resp = _POOL.get(url, stream=True, **_IMAGE_GET)
+        call.response = resp
+        try:
+            try:
+                resp.raise_for_status()
+            except HTTPError:
+                _log_block(url, resp, _read_prefix(resp, _ERROR_BODY_LIMIT))
+                raise
+            content_type = _content_type(resp)
+            if content_type == "text/html" and not keep_html:
+                raise NotAnImageError(url, content_type, b"")
+            body = _read_capped(url, resp, max_bytes)
+            call.size = len(body)
+            if content_type == "text/html":
+                raise NotAnImageError(url, content_type, body)
+        finally:
+            resp.close()
+    return body
+
+
+_download = retry_antibot_http(_download_once)
@@ -0,0 +1,217 @@
+"""Structured observability for outbound HTTP attempts — the `http_call` breadcrumb.
+
+`llm_observability` gives every Gemini call one `llm_call` line; HTTP had nothing
+comparable, so a slow kinozal run could not be split into Cloudflare time-to-first-
+byte, the mirror login, or poster transfer. Every transport now wraps each single
+attempt in `observe_http`, which emits one INFO line:
+
+    http_call host=kinozal.tv status=200 attempt=1 bytes=48213 dns_ms=0 connect_ms=0
+    tls_ms=0 ttfb_ms=412 total_ms=455 outcome=ok
+
+The phase fields are curl's own cumulative timers (`NAMELOOKUP`, `CONNECT`,
+`APPCONNECT`, `STARTTRANSFER` — each includes the ones before it, as in `curl -w`),
+requested through `CURL_TIMING_INFOS` on every curl_cffi session. On a reused
+keep-alive connection the first three read 0, which is the pool showing it works.
+`total_ms` is our own wall clock around the attempt, so a streamed download's body
+transfer is in it even though curl's timers stop at the headers. The stdlib
+`requests` transports (GitHub, Steam, TMDB) expose only `elapsed` — time to the
+headers — so their DNS/connect/TLS fields read `None`: not measured, never zero (§IV).
+
+Every observed attempt also lands in `HTTP_CALLS`, whose per-host p50/p95 lines
+`alerting.publish_run_summary` appends to the run summary. An attempt refused by the
+host governor never reaches the wire and is not observed.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlsplit
+
+from curl_cffi import CurlInfo
+
+from kinozal_scraper.http_retry import take_attempt
+
+logger = logging.getLogger(__name__)
+
+CURL_TIMING_INFOS = (
+    CurlInfo.NAMELOOKUP_TIME,
+    CurlInfo.CONNECT_TIME,
+    CurlInfo.APPCONNECT_TIME,
+    CurlInfo.STARTTRANSFER_TIME,
+)
+
+
+@dataclass(frozen=True)
+class HttpTiming:
+    """Milliseconds since the attempt started; `None` when the transport cannot tell."""
+
+    dns_ms: float | None
+    connect_ms: float | None
+    tls_ms: float | None
+    ttfb_ms: float | None
+
+
+_UNMEASURED = HttpTiming(dns_ms=None, connect_ms=None, tls_ms=None, ttfb_ms=None)
+
+
+def _ms(seconds: Any) -> float | None:
+    return seconds * 1000 if isinstance(seconds, int | float) else None
+
+
+def extract_timing(resp: Any) -> HttpTiming:
+    """Read the phase timers off a curl_cffi or `requests` response.
+
+    Tolerant like `llm_observability.extract_usage`: a response without `infos` (a
+    `requests.Response`, a test double) falls back to `elapsed` for the TTFB and
+    `None` for the rest, rather than raising inside a live call."""
+    infos = getattr(resp, "infos", None)
+    if isinstance(infos, dict) and infos:
+        return HttpTiming(
+            dns_ms=_ms(infos.get(CurlInfo.NAMELOOKUP_TIME)),
+            connect_ms=_ms(infos.get(CurlInfo.CONNECT_TIME)),
+            tls_ms=_ms(infos.get(CurlInfo.APPCONNECT_TIME)),
+            ttfb_ms=_ms(infos.get(CurlInfo.STARTTRANSFER_TIME)),
+        )
+    elapsed = getattr(resp, "elapsed", None)
+    seconds = getattr(elapsed, "total_seconds", None)
+    if not callable(seconds):
+        return _UNMEASURED
+    return HttpTiming(dns_ms=None, connect_ms=None, tls_ms=None, ttfb_ms=_ms(seconds()))
+
+
+class HttpCall:
+    """One attempt in flight; the transport attaches what it learns as it goes."""
+
+    def __init__(self, url: str, attempt: int) -> None:
+        self.host = urlsplit(url).netloc
+        self.attempt = attempt
+        self.response: Any = None
+        # Set by a streaming caller once it has read the body; otherwise taken
+        # from the buffered `content`.
+        self.size: int | None = None
+
+    @property
+    def bytes_read(self) -> int | None:
+        if self.size is not None:
+            return self.size
+        content = getattr(self.response, "content", None)
+        return len(content) if isinstance(content, bytes) else None
+
+    @property
+    def status(self) -> int | None:
+        status = getattr(self.response, "status_code", None)
+        return status if isinstance(status, int) else None
+
+
+def _fmt(value: float | None) -> str:
+    return "None" if value is None else f"{value:.0f}"
+
+
+class HttpCallStats:
+    """Per-host latency samples of the run, for the p50/p95 summary lines."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._total: dict[str, list[float]] = {}
+        self._ttfb: dict[str, list[float]] = {}
+        self._ok: dict[str, list[float]] = {}
+
+    def record(self, host: str, total_ms: float, ttfb_ms: float | None, *, ok: bool = True) -> None:
+        with self._lock:
+            self._total.setdefault(host, []).append(total_ms)
+            if ok:
+                self._ok.setdefault(host, []).append(total_ms)
+            if ttfb_ms is not None:
+                self._ttfb.setdefault(host, []).append(ttfb_ms)
+
+    def summary_lines(self) -> list[str]:
+        """One line per host that was called; TTFB is omitted, not zeroed, when the
+        host's transport never measured it."""
+        with self._lock:
+            lines = []
+            for host in sorted(self._total):
+                total = sorted(self._total[host])
+                line = (
+                    f"http_latency: {host} n={len(total)} "
+                    f"p50={_percentile(total, 50):.0f}ms p95={_percentile(total, 95):.0f}ms"
+                )
+                if ttfb := sorted(self._ttfb.get(host, [])):
+                    line += (
+                        f" ttfb_p50={_percentile(ttfb, 50):.0f}ms"
+                        f" ttfb_p95={_percentile(ttfb, 95):.0f}ms"
+                    )
+                lines.append(line)
+            return lines
+
+    def percentile(
+        self, host: str, pct: int, *, min_samples: int = 1, prior: Sequence[float] = ()
+    ) -> float | None:
+        """Nearest-rank `pct` of `host`'s successful attempts so far plus `prior` ones
+        (an earlier run's, say), in ms; None until at least `min_samples` of them were
+        observed. A failed attempt is left out: a timeout's 30 s says nothing about how
+        long an answer takes."""
+        with self._lock:
+            total = sorted([*prior, *self._ok.get(host, [])])
+        return _percentile(total, pct) if len(total) >= max(min_samples, 1) else None
+
+    def successes(self, host: str) -> list[float]:
+        """`host`'s successful attempt latencies so far, in ms, in the order seen."""
+        with self._lock:
+            return list(self._ok.get(host, []))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._total.clear()
+            self._ttfb.clear()
+            self._ok.clear()
+
+
+def _percentile(ordered: list[float], pct: int) -> float:
+    # Nearest rank: always a value that was observed, which is what an operator
+    # compares against individual `http_call` lines.
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+HTTP_CALLS = HttpCallStats()
+
+
+@contextmanager
+def observe_http(url: str) -> Iterator[HttpCall]:
+    """Wrap ONE attempt at `url`: breadcrumb and summary sample on the way out.
+
+    Sits inside the host governor's guard, so a token wait is not counted as
+    latency. An exception propagates unchanged; its class name becomes the
+    breadcrumb's `outcome` (an `HTTPError` still carries the status it answered)."""
+    call = HttpCall(url, take_attempt())
+    started = time.monotonic()
+    outcome = "ok"
+    try:
+        yield call
+    except BaseException as exc:
+        outcome = type(exc).__name__
+        raise
+    finally:
+        total_ms = (time.monotonic() - started) * 1000
+        timing = extract_timing(call.response) if call.response is not None else _UNMEASURED
+        HTTP_CALLS.record(call.host, total_ms, timing.ttfb_ms, ok=outcome == "ok")
+        logger.info(
+            "http_call host=%s status=%s attempt=%d bytes=%s dns_ms=%s connect_ms=%s "
+            "tls_ms=%s ttfb_ms=%s total_ms=%.0f outcome=%s",
+            call.host,
+            call.status,
+            call.attempt,
+            call.bytes_read,
+            _fmt(timing.dns_ms),
+            _fmt(timing.connect_ms),
+            _fmt(timing.tls_ms),
+            _fmt(timing.ttfb_ms),
+            total_ms,
+            outcome,
+        )
@@ -18,8 +18,12 @@ exceptions that happen to carry that attribute.
   `x-ratelimit-reset` header” and explicitly warns that “continuing to make requests
   while you are rate limited may result in the banning of your integration”. A 1/2/4-second
   backoff does not close that window — it only adds three futile requests to the same
-  counter. Honouring `Retry-After` is a separate task; while sources make one or two
-  requests per run, it is cheaper to not retry at all and show the failure (§IV).
+  counter. What the API set does instead is **one precisely timed retry**: a call site
+  that raises through `raise_for_api_status` turns an advertised limit into
+  `RateLimited`, carrying the delay read from `Retry-After` or `x-ratelimit-reset`
+  (when `x-ratelimit-remaining` is `0`). If that delay fits `API_RATE_LIMIT_BUDGET_S`
+  the call sleeps exactly until the reset and tries once more; otherwise it fails
+  fast with the reset time in the error, so the operator sees when it would have worked.
   **For Steam Store this decision is by analogy, not by source evidence:** `appdetails`
   has no public contract, its reset window is neither documented nor measured — the
   difference is recorded as **M2** in `coverage-gaps.md` so it is not read as a measurement.
@@ -41,13 +45,22 @@ recorded as gap **M** in `coverage-gaps-ingestion.md` (§V: do not retry what wa
 from __future__ import annotations
 
 import logging
+import os
+import time
 from collections.abc import Callable, Iterable
+from contextvars import ContextVar
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any
 
 import requests
 from curl_cffi.requests.exceptions import HTTPError as CurlHTTPError
 from tenacity import (
+    RetryCallState,
     before_sleep_log,
     retry,
+    retry_any,
+    retry_base,
     retry_if_exception,
     stop_after_attempt,
     wait_exponential,
@@ -74,6 +87,26 @@ API_TRANSIENT_CODES = frozenset({500, 502, 503, 504})
 # After give-up `reraise=True` hands the error to the per-source guard → §IV.
 _MAX_ATTEMPTS = 4
 
+# The attempt in flight, for the `http_call` breadcrumb (`http_observability`): a
+# single-attempt body cannot see tenacity's state, so every policy below publishes
+# the number through `before`. A context variable, not a global: the prefetch and
+# hedge workers run many calls at once, each thread in its own context.
+_ATTEMPT: ContextVar[int] = ContextVar("http_attempt", default=1)
+
+
+def _note_attempt(retry_state: RetryCallState) -> None:
+    _ATTEMPT.set(retry_state.attempt_number)
+
+
+def take_attempt() -> int:
+    """The number of the attempt now running, reset to 1 for whatever runs next.
+
+    Reset on read so a GET outside any retry policy (a login, a TMDB lookup) after
+    a retried one does not inherit its attempt number."""
+    attempt = _ATTEMPT.get()
+    _ATTEMPT.set(1)
+    return attempt
+
 
 def _transient_http_predicate(codes: Iterable[int]) -> Callable[[BaseException], bool]:
     """Build the "is this worth retrying" predicate for a given set of statuses.
@@ -101,15 +134,21 @@ def _transient_http_predicate(codes: Iterable[int]) -> Callable[[BaseException],
 # keeping `_get(...)` typed as returning a `Response` — same reason `_get_once`
 # stays split out in `http_fetch` (#396).
 
+# The anti-bot predicate on its own, for a caller that makes one attempt per process
+# and keeps the count elsewhere (`patient_ledger`): it must still tell a transient it
+# will try again from a failure no retry would change.
+is_antibot_transient = _transient_http_predicate(ANTIBOT_TRANSIENT_CODES)
+
 # HTML transport, fast schedule — every source except soldout. `_get_once` already
 # logs `describe_block` on every attempt (#358), and at 1/2/4 s sleeps a `before_sleep`
 # line would land in the same second as that one, so it is omitted **here**; the
 # patient sibling below sleeps for minutes and does need it.
 retry_antibot_http = retry(
-    retry=retry_if_exception(_transient_http_predicate(ANTIBOT_TRANSIENT_CODES)),
+    retry=retry_if_exception(is_antibot_transient),
     stop=stop_after_attempt(_MAX_ATTEMPTS),
     wait=wait_exponential(multiplier=1, max=30),
     reraise=True,
+    before=_note_attempt,
 )
 
 # HTML transport, patient schedule — soldout only (#396). Same code set, different
@@ -129,21 +168,134 @@ _PATIENT_WAIT_S = 720
 # `before_sleep` is required here and not above: twelve minutes of silence between
 # `_get_once` lines is indistinguishable from a hung step (§IV).
 retry_antibot_patient = retry(
-    retry=retry_if_exception(_transient_http_predicate(ANTIBOT_TRANSIENT_CODES)),
+    retry=retry_if_exception(is_antibot_transient),
     stop=stop_after_attempt(_PATIENT_ATTEMPTS),
     wait=wait_fixed(_PATIENT_WAIT_S),
     reraise=True,
+    before=_note_attempt,
     before_sleep=before_sleep_log(logger, logging.WARNING),
 )
 
 
+# How long one API call may wait for an advertised rate-limit reset. GitHub Search
+# resets its per-minute window within 60 s, so the default covers the one limit a
+# nightly run realistically meets; an hourly core-limit reset does not fit and fails
+# fast instead of parking the job. Overridable per run via the environment.
+_RATE_LIMIT_BUDGET_ENV = "API_RATE_LIMIT_BUDGET_S"
+_RATE_LIMIT_BUDGET_S = 60.0
+_RATE_LIMIT_CODES = frozenset({403, 429})
+_RATE_LIMIT_RETRIES = "rate_limit_retries"
+
+
+class RateLimited(requests.HTTPError):
+    """A JSON-API 403/429 that advertised a rate limit (or a bare 429).
+
+    `delay_s` is how long until the server says the limit lifts — `None` when a 429
+    names no reset. The message carries the reset as an absolute UTC time, because a
+    fail-fast error is only actionable if it says when the call would have worked."""
+
+    def __init__(self, response: requests.Response, delay_s: float | None) -> None:
+        self.delay_s = delay_s
+        if delay_s is None:
+            detail = "no reset advertised"
+        else:
+            reset = datetime.fromtimestamp(time.time() + delay_s, UTC)
+            detail = f"resets at {reset:%Y-%m-%dT%H:%M:%SZ} (in {delay_s:.0f}s)"
+        super().__init__(
+            f"{response.status_code} rate limited: {response.url}; {detail}", response=response
+        )
+
+
+def _retry_after_s(value: str) -> float | None:
+    """`Retry-After` is either delta-seconds or an HTTP-date (RFC 9110 §10.2.3)."""
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def rate_limit_delay(headers: Any) -> float | None:
+    """Seconds until the advertised limit lifts, or None if nothing is advertised.
+
+    `Retry-After` wins (GitHub's secondary limits, generic 429s); otherwise an
+    exhausted primary window — `x-ratelimit-remaining: 0` — lifts at the epoch in
+    `x-ratelimit-reset`. A reset without `remaining == 0` is NOT a rate limit: every
+    GitHub response carries the reset header, including a plain permission 403."""
+    if retry_after := headers.get("retry-after"):
+        return _retry_after_s(retry_after)
+    reset = headers.get("x-ratelimit-reset")
+    if headers.get("x-ratelimit-remaining") == "0" and reset and reset.isdigit():
+        return max(0.0, float(reset) - time.time())
+    return None
+
+
+def raise_for_api_status(resp: requests.Response) -> None:
+    """`raise_for_status` for the JSON-API call sites, rate-limit aware.
+
+    An advertised limit raises `RateLimited` (still a `requests.HTTPError`, so every
+    existing handler keeps working); everything else is the plain `raise_for_status`."""
+    if resp.status_code in _RATE_LIMIT_CODES:
+        delay = rate_limit_delay(resp.headers)
+        if delay is not None or resp.status_code == 429:
+            raise RateLimited(resp, delay)
+    resp.raise_for_status()
+
+
+def _rate_limit_budget_s() -> float:
+    raw = os.environ.get(_RATE_LIMIT_BUDGET_ENV, "").strip()
+    try:
+        return float(raw) if raw else _RATE_LIMIT_BUDGET_S
+    except ValueError:
+        logger.warning("ignoring non-numeric %s=%r", _RATE_LIMIT_BUDGET_ENV, raw)
+        return _RATE_LIMIT_BUDGET_S
+
+
+class _RetryRateLimitOnce(retry_base):
+    """Grant one retry per call for a limit whose reset fits the budget.
+
+    One, not several: the wait below lands exactly on the advertised reset, so a
+    second `RateLimited` means the server's own number was wrong, and guessing past
+    it is the hammering GitHub warns about. The count lives in the per-call
+    `statistics` tenacity resets on every invocation."""
+
+    def __call__(self, retry_state: RetryCallState) -> bool:
+        exc = retry_state.outcome.exception() if retry_state.outcome else None
+        if not isinstance(exc, RateLimited) or exc.delay_s is None:
+            return False
+        stats = retry_state.retry_object.statistics
+        if stats.get(_RATE_LIMIT_RETRIES, 0) >= 1 or exc.delay_s > _rate_limit_budget_s():
+            return False
+        stats[_RATE_LIMIT_RETRIES] = 1
+        return True
+
+
+_api_backoff = wait_exponential(multiplier=1, max=30)
+
+
+def _api_wait(retry_state: RetryCallState) -> float:
+    """Sleep until the advertised reset for a rate limit, back off otherwise."""
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    if isinstance(exc, RateLimited) and exc.delay_s is not None:
+        return exc.delay_s
+    return _api_backoff(retry_state)
+
+
 # JSON APIs: nothing else logs an attempt, and without a line per retry a flapping
 # source stays invisible until it dies outright — the retry would hide exactly the
-# degradation it was added to survive (§IV).
+# degradation it was added to survive (§IV). The same line announces a rate-limit
+# wait, with the reset time from the `RateLimited` message.
 retry_api_http = retry(
-    retry=retry_if_exception(_transient_http_predicate(API_TRANSIENT_CODES)),
+    retry=retry_any(
+        retry_if_exception(_transient_http_predicate(API_TRANSIENT_CODES)),
+        _RetryRateLimitOnce(),
+    ),
     stop=stop_after_attempt(_MAX_ATTEMPTS),
-    wait=wait_exponential(multiplier=1, max=30),
+    wait=_api_wait,
     reraise=True,
+    before=_note_attempt,
     before_sleep=before_sleep_log(logger, logging.WARNING),
 )
@@ -0,0 +1,293 @@
+"""Record/replay transport: whole-run HTTP cassettes for offline benchmarking.
+
+`scripts/capture_external_fixture.py` captures one response at a time for a test
+fixture. Benchmarking `run_kinozal_pipeline` and friends end to end needs every
+exchange of a run, served back in order, with no network. Every outbound call site —
+`http_fetch`, `kinozal_auth`, the Steam/GitHub JSON GETs, `TmdbClient` and
+`TelegramNotifier` — hands its request to `exchange` as a zero-argument callable.
+`HTTP_TRANSPORT_MODE` picks what happens to it:
+
+- `live` (default, also when unset): the callable runs, nothing else happens;
+- `record`: the callable runs and the response is appended to the cassette;
+- `replay`: the callable never runs; the next recorded response for the same
+  request is served instead, optionally after its recorded latency
+  (`HTTP_REPLAY_LATENCY`, a multiplier) and with injected 503s
+  (`HTTP_REPLAY_ERROR_RATE`, seeded by `HTTP_REPLAY_SEED`) to exercise the retry
+  policies and the host governor.
+
+The cassette is `cassette.jsonl.gz` under `HTTP_CASSETTE_DIR`, one gzip member per
+exchange, so recording appends without rewriting and several pipeline processes of one
+job can share it. Delete the directory to record afresh.
+
+**What a cassette never holds.** Request bodies and headers (the Kinozal password,
+the GitHub and TMDB tokens) are not written at all. Response `Set-Cookie` values are
+dropped and only the cookie names are kept. Secrets in the URL — the Telegram bot token
+in the path, `api_key`/`token`-style query values — are masked in the key every entry
+is filed under. Requests are matched on method and masked URL, never on their body, so
+Telegram's sends are served in recorded order.
+
+A replayed request the cassette does not hold raises `CassetteMissError`: a benchmark
+that quietly fell back to the network, or to an empty answer, would be measuring
+something else (§IV).
+"""
+
+from __future__ import annotations
+
+import base64
+import functools
+import gzip
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping
+from pathlib import Path
+from typing import Any, Literal
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from curl_cffi.requests.exceptions import HTTPError as CurlHTTPError
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+MODE_ENV = "HTTP_TRANSPORT_MODE"
+CASSETTE_DIR_ENV = "HTTP_CASSETTE_DIR"
+REPLAY_LATENCY_ENV = "HTTP_REPLAY_LATENCY"
+REPLAY_ERROR_RATE_ENV = "HTTP_REPLAY_ERROR_RATE"
+REPLAY_SEED_ENV = "HTTP_REPLAY_SEED"
+_MODES = ("live", "record", "replay")
+_CASSETTE_NAME = "cassette.jsonl.gz"
+
+# The library whose response the call site expects: `raise_for_status` on a replayed
+# response must raise the HTTPError that site's retry predicate was written against.
+Client = Literal["curl_cffi", "requests"]
+
+_SECRET_PATH_RE = re.compile(r"/bot\d+:[\w-]+")
+_SECRET_PARAMS = frozenset({"access_token", "api_key", "apikey", "key", "token"})
+_MASK = "REDACTED"
+_CHUNK = 64 * 1024
+
+
+class CassetteMissError(LookupError):
+    """Replay was asked for a request the cassette does not hold."""
+
+    def __init__(self, key: str) -> None:
+        super().__init__(f"no recorded response for {key} in the HTTP cassette")
+        self.key = key
+
+
+def cassette_key(method: str, url: str, params: Mapping[str, Any] | None = None) -> str:
+    """`METHOD url` with `params` merged into the query, sorted, and secrets masked."""
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    query += [(str(k), str(v)) for k, v in (params or {}).items()]
+    masked = sorted((k, _MASK if k.lower() in _SECRET_PARAMS else v) for k, v in query)
+    path = _SECRET_PATH_RE.sub(f"/bot{_MASK}", parts.path)
+    return f"{method.upper()} " + urlunsplit(
+        (parts.scheme, parts.netloc, path, urlencode(masked), "")
+    )
+
+
+class CassetteResponse:
+    """A recorded response, shaped like the curl_cffi/`requests` one it stands in for.
+
+    Covers what the call sites read: `status_code`, case-insensitive `headers`,
+    `content`/`text`/`json()`, `iter_content`/`close` for the streamed poster path, and
+    a `raise_for_status` that raises the client's own `HTTPError`. It has no `infos`
+    or `elapsed`, so a replayed `http_call` line reports only its wall-clock
+    `total_ms`."""
+
+    def __init__(self, entry: Mapping[str, Any], client: Client) -> None:
+        self.url = str(entry["request"]).split(" ", 1)[1]
+        self.status_code = int(entry["status"])
+        self.headers: CaseInsensitiveDict[str] = CaseInsensitiveDict(entry.get("headers") or {})
+        self.content = base64.b64decode(entry.get("body", ""))
+        self.encoding = entry.get("encoding") or "utf-8"
+        self.cookie_names: list[str] = list(entry.get("cookies") or [])
+        self._client = client
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, "replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def iter_content(self, chunk_size: int | None = None) -> Iterator[bytes]:
+        step = chunk_size or _CHUNK
+        for start in range(0, len(self.content), step):
+            yield self.content[start : start + step]
+
+    def close(self) -> None:
+        pass
+
+    def raise_for_status(self) -> None:
+        if self.status_code < 400:
+            return
+        message = f"HTTP Error {self.status_code} (replayed) for url: {self.url}"
+        if self._client == "curl_cffi":
+            raise CurlHTTPError(message, 0, self)
+        raise requests.HTTPError(message, response=self)
+
+
+def _entry(key: str, resp: Any, body: bytes, elapsed_ms: float) -> dict[str, Any]:
+    headers = {str(k): str(v) for k, v in resp.headers.items() if str(k).lower() != "set-cookie"}
+    return {
+        "request": key,
+        "status": int(resp.status_code),
+        "headers": headers,
+        "cookies": sorted(dict(getattr(resp, "cookies", None) or {})),
+        "encoding": getattr(resp, "encoding", None),
+        "body": base64.b64encode(body).decode("ascii"),
+        "elapsed_ms": round(elapsed_ms, 1),
+    }
+
+
+class Cassette:
+    """The cassette file of one run, in record or replay mode."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        replay: bool,
+        latency_scale: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        self.path = path
+        self.replay = replay
+        self._lock = threading.Lock()
+        self._latency_scale = latency_scale
+        self._error_rate = error_rate
+        self._rng = random.Random(seed)
+        self._entries: dict[str, list[dict[str, Any]]] = {}
+        self._served: dict[str, int] = {}
+        if replay:
+            with gzip.open(path, "rt", encoding="utf-8") as lines:
+                for line in lines:
+                    entry = json.loads(line)
+                    self._entries.setdefault(entry["request"], []).append(entry)
+            logger.info(
+                "[http_transport] replaying %d exchange(s) from %s (latency x%g, error rate %g)",
+                sum(map(len, self._entries.values())),
+                path,
+                latency_scale,
+                error_rate,
+            )
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            logger.info("[http_transport] recording exchanges to %s", path)
+
+    def append(self, entry: Mapping[str, Any]) -> None:
+        line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+        member = gzip.compress(line)
+        with self._lock, self.path.open("ab") as out:
+            out.write(member)
+
+    def next_entry(self, key: str) -> tuple[dict[str, Any], float]:
+        """The response to serve for `key` and the seconds to wait before serving it.
+
+        Recorded responses are served in order; past the last one, the last repeats,
+        so a replay that retries once more than the recording did still runs."""
+        with self._lock:
+            recorded = self._entries.get(key)
+            if not recorded:
+                raise CassetteMissError(key)
+            index = self._served.get(key, 0)
+            self._served[key] = index + 1
+            entry = recorded[min(index, len(recorded) - 1)]
+            injected = self._error_rate > 0 and self._rng.random() < self._error_rate
+        delay = float(entry.get("elapsed_ms", 0.0)) / 1000 * self._latency_scale
+        if injected:
+            logger.info("[http_transport] injected 503 for %s", key)
+            entry = {"request": key, "status": 503, "headers": {}, "body": ""}
+        return entry, delay
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = os.environ.get(name, "").strip()
+    try:
+        return float(raw) if raw else default
+    except ValueError:
+        raise ValueError(f"{name} must be a number, got {raw!r}") from None
+
+
+@functools.cache
+def _active() -> Cassette | None:
+    """The run's cassette, or None in live mode. Read once per process, on first use.
+
+    A misconfigured mode raises instead of falling back to live: a benchmark that
+    quietly hit the network would report the wrong numbers."""
+    mode = os.environ.get(MODE_ENV, "").strip().lower() or "live"
+    if mode not in _MODES:
+        raise ValueError(f"{MODE_ENV} must be one of {', '.join(_MODES)}, got {mode!r}")
+    if mode == "live":
+        return None
+    directory = os.environ.get(CASSETTE_DIR_ENV, "").strip()
+    if not directory:
+        raise ValueError(f"{MODE_ENV}={mode} needs {CASSETTE_DIR_ENV}")
+    return Cassette(
+        Path(directory) / _CASSETTE_NAME,
+        replay=mode == "replay",
+        latency_scale=_env_float(REPLAY_LATENCY_ENV, 0.0),
+        error_rate=_env_float(REPLAY_ERROR_RATE_ENV, 0.0),
+        seed=int(_env_float(REPLAY_SEED_ENV, 0)),
+    )
+
+
+def _set_cookies(jar: Any, response: CassetteResponse) -> None:
+    # A replayed login leaves the session's jar as the live one would: the login
+    # check reads the jar, and the names are all it looks at.
+    for name in response.cookie_names:
+        jar.set(name, _MASK)
+
+
+def exchange(
+    method: str,
+    url: str,
+    send: Callable[[], Any],
+    *,
+    client: Client,
+    params: Mapping[str, Any] | None = None,
+    stream: bool = False,
+    jar: Any = None,
+) -> Any:
+    """Run `send` — one attempt at `url` — through the configured transport mode.
+
+    `params` are the query parameters the call site passes separately, so the entry
+    is keyed on the URL actually requested. A `stream` response is read to the end
+    while recording, and the call site gets the recorded copy to stream from. `jar`
+    is the session cookie jar a replayed `Set-Cookie` should land in."""
+    cassette = _active()
+    if cassette is None:
+        return send()
+    key = cassette_key(method, url, params)
+    if cassette.replay:
+        entry, delay = cassette.next_entry(key)
+        if delay:
+            time.sleep(delay)
+        return _replayed(entry, client, jar)
+    started = time.monotonic()
+    resp = send()
+    if not stream:
+        cassette.append(_entry(key, resp, resp.content, (time.monotonic() - started) * 1000))
+        return resp
+    try:
+        body = b"".join(resp.iter_content())
+    finally:
+        resp.close()
+    entry = _entry(key, resp, body, (time.monotonic() - started) * 1000)
+    cassette.append(entry)
+    return CassetteResponse(entry, client)
+
+
+def _replayed(entry: Mapping[str, Any], client: Client, jar: Any) -> Any:
+    response = CassetteResponse(entry, client)
+    if jar is not None:
+        _set_cookies(jar, response)
+    return response
@@ -11,15 +11,43 @@ token, no captcha. Bad creds → the login page is returned with no Set-Cookie
 login.php. We therefore detect success cookie-name-agnostically: a non-empty
 jar after takelogin AND a top.php probe that does not redirect to login. This
 also catches the m=5 / VIP gate (a valid login that still can't see top.php).
+
+**A session outlives its run.** With `STATE_DIR` and `KINOZAL_SESSION_KEY` set,
+`save_session` stores the logged-in cookie jar in the cross-run `local_store`,
+encrypted with that Fernet key (a cache restored by `actions/cache` is readable by
+any workflow of the repository, so the cookies never sit there in the clear), and
+`load_session` hands it to the next run. A restored session is not probed: the
+first `fetch_authenticated` through it is the check, and a login redirect there is
+the caller's cue to log in afresh.
 """
 
 from __future__ import annotations
 
+import functools
+import json
+import logging
+import os
+
+from cryptography.fernet import Fernet, InvalidToken
 from curl_cffi import requests
 
+from kinozal_scraper.host_governor import GOVERNOR
+from kinozal_scraper.http_observability import CURL_TIMING_INFOS, observe_http
+from kinozal_scraper.http_transport import exchange
+from kinozal_scraper.local_store import LocalStore, open_store
+
+logger = logging.getLogger(__name__)
+
 _BASE = "https://kinozal.guru"
 _TIMEOUT = 30
 
+SESSION_KEY_ENV = "KINOZAL_SESSION_KEY"
+_SESSION_NAMESPACE = "kinozal_session"
+_SESSION_KEY = "mirror"
+# The mirror's own cookie lifetime is not documented; a week bounds how long a
+# jar nobody used keeps sitting in the cache. A rejected jar is replaced anyway.
+_SESSION_TTL_S = 7 * 24 * 3600.0
+
 
 class KinozalLoginError(Exception):
     """Raised when a Kinozal login fails or a session is not (or no longer)
@@ -35,23 +63,105 @@ def _is_login_redirect(resp: requests.Response) -> bool:
     return 300 <= resp.status_code < 400 and "login.php" in location.lower()
 
 
+def _new_session() -> requests.Session:
+    session: requests.Session = requests.Session(
+        impersonate="chrome", timeout=_TIMEOUT, curl_infos=list(CURL_TIMING_INFOS)
+    )
+    return session
+
+
+@functools.cache
+def _session_persistence() -> tuple[Fernet, LocalStore] | None:
+    """The cipher and store of the saved session, or None when either is unset.
+    Read once per process, on first use, like the other `local_store` caches."""
+    key = os.environ.get(SESSION_KEY_ENV, "").strip()
+    if not key:
+        return None
+    try:
+        cipher = Fernet(key)
+    except ValueError as exc:
+        logger.warning(
+            "%s is not a Fernet key, mirror session not persisted: %s", SESSION_KEY_ENV, exc
+        )
+        return None
+    store = open_store(_SESSION_NAMESPACE)
+    return (cipher, store) if store is not None else None
+
+
+def load_session() -> requests.Session | None:
+    """The mirror session a previous run saved, or None (nothing saved, persistence
+    off, or a jar this key cannot decrypt). Not validated here — see the module
+    docstring."""
+    persistence = _session_persistence()
+    if persistence is None:
+        return None
+    cipher, store = persistence
+    token = store.get(_SESSION_KEY)
+    if token is None:
+        return None
+    try:
+        cookies = json.loads(cipher.decrypt(token))
+    except (InvalidToken, ValueError) as exc:
+        logger.warning("saved kinozal mirror session unreadable, logging in afresh: %r", exc)
+        return None
+    session = _new_session()
+    for cookie in cookies:
+        session.cookies.set(cookie["name"], cookie["value"], cookie["domain"], cookie["path"])
+    return session
+
+
+def save_session(session: requests.Session) -> None:
+    """Store `session`'s cookie jar for the next run; a no-op with persistence off."""
+    persistence = _session_persistence()
+    if persistence is None:
+        return
+    cipher, store = persistence
+    cookies = [
+        {"name": c.name, "value": c.value, "domain": c.domain, "path": c.path}
+        for c in session.cookies.jar
+    ]
+    token = cipher.encrypt(json.dumps(cookies).encode("utf-8"))
+    store.put(_SESSION_KEY, token, ttl_s=_SESSION_TTL_S)
+
+
+def discard_session() -> None:
+    """Forget the saved session once the mirror has rejected it."""
+    persistence = _session_persistence()
+    if persistence is not None:
+        persistence[1].delete(_SESSION_KEY)
+
+
 def login(username: str, password: str, *, base: str = _BASE) -> requests.Session:
     """Log into the Kinozal mirror and return an authenticated session.
 
     Raises KinozalLoginError if credentials are rejected (empty jar) or the
     account cannot reach top.php (probe still redirects to login — e.g. a VIP
-    gate)."""
-    session: requests.Session = requests.Session(impersonate="chrome", timeout=_TIMEOUT)
-    session.post(
-        f"{base}/takelogin.php",
-        data={"username": username, "password": password},
-        allow_redirects=False,
-    )
+    gate). Both requests are observed, so the login's share of a slow run shows up
+    as its own `http_call` lines for the mirror host, and pass the host governor
+    like `fetch_authenticated`, so a mirror that is down is not logged into at all."""
+    session = _new_session()
+    takelogin = f"{base}/takelogin.php"
+    with GOVERNOR.guard(takelogin), observe_http(takelogin) as call:
+        call.response = exchange(
+            "POST",
+            takelogin,
+            lambda: session.post(
+                takelogin,
+                data={"username": username, "password": password},
+                allow_redirects=False,
+            ),
+            client="curl_cffi",
+            jar=session.cookies,
+        )
     if not dict(session.cookies):
         raise KinozalLoginError(
             "login rejected — empty cookie jar after takelogin (bad credentials?)"
         )
-    probe = session.get(f"{base}/top.php", allow_redirects=False)
+    top = f"{base}/top.php"
+    with GOVERNOR.guard(top), observe_http(top) as call:
+        probe = call.response = exchange(
+            "GET", top, lambda: session.get(top, allow_redirects=False), client="curl_cffi"
+        )
     if _is_login_redirect(probe):
         raise KinozalLoginError(
             "logged in but top.php still redirects to login "
@@ -65,17 +175,24 @@ def fetch_authenticated(session: requests.Session, url: str) -> str:
 
     Raises KinozalLoginError if the response redirects to login (session not
     authenticated / expired) instead of silently returning the login-page HTML,
-    which would extract 0 items and read as "no new films" (§IV silent skip)."""
-    resp = session.get(url, allow_redirects=False)
-    if _is_login_redirect(resp):
-        raise KinozalLoginError(f"session not authenticated for {url} (redirected to login)")
-    # raise_for_status() only fires on 4xx/5xx; a 3xx we don't follow
-    # (allow_redirects=False) would otherwise slip through with an empty body
-    # and read as "0 items" (§IV silent skip). Surface any unexpected redirect.
-    if 300 <= resp.status_code < 400:
-        raise KinozalLoginError(
-            f"unexpected redirect {resp.status_code} for {url} "
-            f"(Location={resp.headers.get('Location', '')!r})"
+    which would extract 0 items and read as "no new films" (§IV silent skip).
+
+    Passes the shared host governor, so a mirror that keeps failing is refused
+    with `CircuitOpenError` instead of costing every remaining page a timeout. A
+    login redirect is an answer, not an outage, and does not count against it."""
+    with GOVERNOR.guard(url), observe_http(url) as call:
+        resp = call.response = exchange(
+            "GET", url, lambda: session.get(url, allow_redirects=False), client="curl_cffi"
         )
-    resp.raise_for_status()
+        if _is_login_redirect(resp):
+            raise KinozalLoginError(f"session not authenticated for {url} (redirected to login)")
+        # raise_for_status() only fires on 4xx/5xx; a 3xx we don't follow
+        # (allow_redirects=False) would otherwise slip through with an empty body
+        # and read as "0 items" (§IV silent skip). Surface any unexpected redirect.
+        if 300 <= resp.status_code < 400:
+            raise KinozalLoginError(
+                f"unexpected redirect {resp.status_code} for {url} "
+                f"(Location={resp.headers.get('Location', '')!r})"
+            )
+        resp.raise_for_status()
     return str(resp.text)
@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import functools
+import importlib.util
+import json
 import logging
 import os
 import re
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from typing import Any
-from urllib.parse import urlsplit, urlunsplit
+from urllib.parse import parse_qs, urlsplit, urlunsplit
 
 from bs4 import BeautifulSoup, Tag
 from curl_cffi.requests import Session as _MirrorSession
@@ -15,19 +23,29 @@ from curl_cffi.requests import Session as _MirrorSession
 from kinozal_scraper.generic_pipeline import (
     ROW_HEADERS,
     NormalizedItem,
-    Notification,
     PipelineResult,
     build_notification,
     extract_from_html,
 )
-from kinozal_scraper.http_fetch import NotAnImageError, fetch_bytes, fetch_html
-from kinozal_scraper.kinozal_auth import fetch_authenticated, login
+from kinozal_scraper.host_governor import GOVERNOR
+from kinozal_scraper.http_fetch import NotAnImageError, fetch_bytes, fetch_html, prefetch
+from kinozal_scraper.http_observability import HTTP_CALLS
+from kinozal_scraper.kinozal_auth import (
+    KinozalLoginError,
+    discard_session,
+    fetch_authenticated,
+    load_session,
+    login,
+    save_session,
+)
+from kinozal_scraper.local_store import LocalStore, open_store
 from kinozal_scraper.pipeline_config import load_sources_config
 from kinozal_scraper.sheets_storage import Storage
 from kinozal_scraper.telegram_notifier import Notifier, TelegramNotifier
 from kinozal_scraper.text_utils import YEAR_SEGMENT_RE, original_title
 from kinozal_scraper.trailer_strategy import FilmProfile, HeuristicStrategy
 from kinozal_scraper.youtube import YoutubeQuotaExhausted
+from kinozal_scraper.youtube_quota import QuotaLedger, open_quota_ledger
 
 logger = logging.getLogger(__name__)
 
@@ -155,30 +173,6 @@ def _validate_item_category_config(
         result.errors.append(message)
 
 
-def _parse_item_category(details_html: str) -> int | None:
-    """Return one details-page category id, or ``None`` for ambiguous evidence.
-
-    Kinozal exposes the id on ``img.cat_img_r``. The onclick ``cat(N)`` value is
-    primary; the image path ``/pic/cat/N.gif`` is the markup fallback (#506).
-    """
-    soup = BeautifulSoup(details_html, "html.parser")
-    markers = soup.select("img.cat_img_r")
-    if len(markers) != 1:
-        return None
-    marker = markers[0]
-    onclick = marker.get("onclick")
-    if isinstance(onclick, str):
-        match = re.fullmatch(r"\s*cat\(([0-9]+)\);?\s*", onclick)
-        if match:
-            return int(match.group(1))
-    src = marker.get("src")
-    if isinstance(src, str):
-        match = re.search(r"(?:^|/)pic/cat/([0-9]+)\.gif(?:[?#].*)?$", src)
-        if match:
-            return int(match.group(1))
-    return None
-
-
 def _item_category_excluded(name: str, excluded: set[str]) -> bool:
     """Match a readable category exactly or through a configured group prefix."""
     normalized = _normalize_item_category_name(name)
@@ -188,52 +182,165 @@ def _item_category_excluded(name: str, excluded: set[str]) -> bool:
     )
 
 
-def _parse_labeled_field(details_html: str, label: str) -> str:
-    """Read a `<b>{label}:</b> … <br>` field's visible text off a kinozal details
-    page (#263 for `Genre:`, generalized in #140 for cast/director/description).
-
-    Real markup (verified against the live page): the value follows the `<b>`
-    label as tag-wrapped links/spans (`<span class="lnks_tobrs">…</span>`) or a
-    bare text node, sits after a whitespace node, and is terminated by the next
-    `<br>` or `<b>`. We collect the *visible text* of the siblings up to that
-    terminator — `str(sibling)` would serialize raw HTML for a tag-wrapped value,
-    and `next_sibling` alone is just the whitespace text node. `label` is matched
-    by prefix (`startswith`), so pass it without the trailing colon (`"Genre"`).
-    Returns '' if the field is absent (caller decides what '' means)."""
-    soup = BeautifulSoup(details_html, "html.parser")
-    for b in soup.find_all("b"):
-        if not b.get_text(strip=True).startswith(label):
-            continue
-        parts: list[str] = []
-        for sib in b.next_siblings:
-            if getattr(sib, "name", None) in ("br", "b"):
-                break
-            text = sib.get_text(" ", strip=True) if isinstance(sib, Tag) else str(sib).strip()
-            if text:
-                parts.append(text)
-        return " ".join(parts).strip()
-    return ""
-
-
-def _parse_genre(details_html: str) -> str:
-    """`Genre:` value off a details page — thin wrapper over the shared
-    `_parse_labeled_field` (§II — one sibling-walk, not four copies). Caller
-    treats '' as unknown → keep (#263)."""
-    return _parse_labeled_field(details_html, "Жанр")
+# lxml parses a details page several times faster than the stdlib parser and is
+# used when installed; the fields below read the same from either tree.
+_DETAILS_PARSER = "lxml" if importlib.util.find_spec("lxml") is not None else "html.parser"
+_DETAILS_FIELDS = ("category_id", "genre", "cast", "director", "description")
+
+
+class DetailsPage:
+    """One kinozal details.php page, parsed once, with its fields read on demand.
+
+    The item filter reads the category and genre, and `build_film_profile` reads
+    cast, director, genre and description. Each used to parse the HTML afresh per
+    field, up to six parses of one page. A `DetailsPage` parses on first access,
+    and each field is computed at most once."""
+
+    def __init__(self, html: str, *, parser: str = _DETAILS_PARSER) -> None:
+        self.html = html
+        self._parser = parser
+
+    @functools.cached_property
+    def _soup(self) -> BeautifulSoup:
+        return BeautifulSoup(self.html, self._parser)
+
+    @functools.cached_property
+    def category_id(self) -> int | None:
+        """The page's category id, or ``None`` for ambiguous evidence.
+
+        Kinozal exposes the id on ``img.cat_img_r``. The onclick ``cat(N)`` value is
+        primary; the image path ``/pic/cat/N.gif`` is the markup fallback (#506)."""
+        markers = self._soup.select("img.cat_img_r")
+        if len(markers) != 1:
+            return None
+        marker = markers[0]
+        onclick = marker.get("onclick")
+        if isinstance(onclick, str):
+            match = re.fullmatch(r"\s*cat\(([0-9]+)\);?\s*", onclick)
+            if match:
+                return int(match.group(1))
+        src = marker.get("src")
+        if isinstance(src, str):
+            match = re.search(r"(?:^|/)pic/cat/([0-9]+)\.gif(?:[?#].*)?$", src)
+            if match:
+                return int(match.group(1))
+        return None
 
+    def field(self, label: str) -> str:
+        """Read a `<b>{label}:</b> … <br>` field's visible text (#263 for `Genre:`,
+        generalized in #140 for cast/director/description).
+
+        Real markup (verified against the live page): the value follows the `<b>`
+        label as tag-wrapped links/spans (`<span class="lnks_tobrs">…</span>`) or a
+        bare text node, sits after a whitespace node, and is terminated by the next
+        `<br>` or `<b>`. We collect the *visible text* of the siblings up to that
+        terminator — `str(sibling)` would serialize raw HTML for a tag-wrapped value,
+        and `next_sibling` alone is just the whitespace text node. `label` is matched
+        by prefix (`startswith`), so pass it without the trailing colon (`"Genre"`).
+        Returns '' if the field is absent (caller decides what '' means)."""
+        for b in self._soup.find_all("b"):
+            if not b.get_text(strip=True).startswith(label):
+                continue
+            parts: list[str] = []
+            for sib in b.next_siblings:
+                if getattr(sib, "name", None) in ("br", "b"):
+                    break
+                text = sib.get_text(" ", strip=True) if isinstance(sib, Tag) else str(sib).strip()
+                if text:
+                    parts.append(text)
+            return " ".join(parts).strip()
+        return ""
+
+    @functools.cached_property
+    def genre(self) -> str:
+        """`Жанр:`; the filter treats '' as unknown → keep (#263)."""
+        return self.field("Жанр")
+
+    @functools.cached_property
+    def cast(self) -> list[str]:
+        """`В ролях:`, split on commas like a multi-valued genre."""
+        return [c.strip() for c in self.field("В ролях").split(",") if c.strip()]
+
+    @functools.cached_property
+    def director(self) -> str:
+        return self.field("Режиссер")
+
+    @functools.cached_property
+    def description(self) -> str:
+        return self.field("О фильме")
 
-def _parse_details_metadata(details_html: str) -> dict[str, Any]:
-    """Assemble trailer-selection metadata from a kinozal details page (#140):
-    cast (`Cast:`) / director (`Director:`) / genre (`Genre:`) / description
-    (`About the film:`), all via shared `_parse_labeled_field`. `cast` is split on
-    commas like a multi-valued genre; a missing field yields ''/[] (not an error)."""
-    cast_raw = _parse_labeled_field(details_html, "В ролях")
-    return {
-        "cast": [c.strip() for c in cast_raw.split(",") if c.strip()],
-        "director": _parse_labeled_field(details_html, "Режиссер"),
-        "genre": _parse_genre(details_html),
-        "description": _parse_labeled_field(details_html, "О фильме"),
-    }
+    @classmethod
+    def from_fields(cls, fields: Mapping[str, Any]) -> DetailsPage:
+        """A page restored from `fields()` without its HTML (the details cache).
+        `field()` of a label outside `_DETAILS_FIELDS` reads '' on such a page."""
+        page = cls("")
+        for name in _DETAILS_FIELDS:
+            page.__dict__[name] = fields[name]
+        return page
+
+    def fields(self) -> dict[str, Any]:
+        """Every memoized field, JSON-ready; `from_fields` restores the page."""
+        return {name: getattr(self, name) for name in _DETAILS_FIELDS}
+
+    def metadata(self) -> dict[str, Any]:
+        """Trailer-selection metadata (#140); a missing field yields ''/[] (not an error)."""
+        return {
+            "cast": self.cast,
+            "director": self.director,
+            "genre": self.genre,
+            "description": self.description,
+        }
+
+
+# Category, genre and cast of a published release never change, so a release read
+# on one run is not fetched again on the next — including items whose delivery
+# failed and which come back as new. Keyed by the details.php `id`, which the .tv
+# primary and the .guru mirror share. The TTL only drops releases long gone from
+# every listing; the bound keeps months of daily tops.
+_DETAILS_CACHE_NAMESPACE = "kinozal_details"
+_DETAILS_CACHE_MAX_ENTRIES = 5000
+_DETAILS_CACHE_TTL_S = 90 * 24 * 3600.0
+
+# `hit` = fields served from the store, `miss` = the page was fetched. Only counted
+# when the store is on, so the summary line is absent rather than all misses.
+DETAILS_CACHE_STATS: Counter[str] = Counter()
+_DETAILS_CACHE_STATS_LOCK = threading.Lock()
+
+
+@functools.cache
+def _details_store() -> LocalStore | None:
+    return open_store(_DETAILS_CACHE_NAMESPACE, max_entries=_DETAILS_CACHE_MAX_ENTRIES)
+
+
+def _release_id(url: str) -> str | None:
+    ids = parse_qs(urlsplit(url).query).get("id")
+    return ids[0] if ids else None
+
+
+def _count_details_lookup(outcome: str) -> None:
+    with _DETAILS_CACHE_STATS_LOCK:
+        DETAILS_CACHE_STATS[outcome] += 1
+
+
+def _details_page(url: str, fetch: Callable[[str], str]) -> DetailsPage:
+    """`url`'s details page: the stored fields of its release, or `fetch(url)` parsed.
+
+    A fetched page is stored only when it yielded a category or a genre. A login
+    page served as a 200 (the #317 false success) yields neither, and caching it
+    would blind the filters for that release on every later run."""
+    store = _details_store()
+    release_id = _release_id(url)
+    if store is None or release_id is None:
+        return DetailsPage(fetch(url))
+    cached = store.get_json(release_id)
+    if isinstance(cached, dict) and cached.keys() >= set(_DETAILS_FIELDS):
+        _count_details_lookup("hit")
+        return DetailsPage.from_fields(cached)
+    _count_details_lookup("miss")
+    page = DetailsPage(fetch(url))
+    if page.category_id is not None or page.genre:
+        store.put_json(release_id, page.fields(), ttl_s=_DETAILS_CACHE_TTL_S)
+    return page
 
 
 def build_film_profile(item: NormalizedItem, fetcher: Any) -> FilmProfile:
@@ -242,7 +349,8 @@ def build_film_profile(item: NormalizedItem, fetcher: Any) -> FilmProfile:
     `ru_title` is the clean title; `original_title` is the second ` / ` segment (or
     clean where no separate original exists, so retrieval collapses union to one query);
     year follows `enrich_with_trailer`. Metadata (cast/director/genre/description) comes
-    through `fetcher.fetch_details` and inherits origin→mirror failover.
+    through `fetcher.fetch_details` and inherits origin→mirror failover, unless the
+    details cache already holds the release.
 
     §IV degradation: fetch/parse failure → a title+year profile with empty metadata and
     WARNING; the pipeline does NOT fail. A successful fetch with no parsed cast, director,
@@ -252,11 +360,10 @@ def build_film_profile(item: NormalizedItem, fetcher: Any) -> FilmProfile:
     language; per-item fetching for cast ties is deferred (#144 Out of scope)."""
     clean = item.title.split("(")[0].strip()
     raw_for_year = item.raw.get("kinozal_raw_title", item.dedupe_key)
-    year_match = re.search(r"\b(20\d{2})\b", raw_for_year)
-    year = int(year_match.group(1)) if year_match else None
+    year = _release_year(item)
     orig = original_title(raw_for_year) or clean
     try:
-        meta = _parse_details_metadata(fetcher.fetch_details(item.url))
+        meta = _details_page(item.url, fetcher.fetch_details).metadata()
     except Exception as exc:  # noqa: BLE001 — best-effort: details-fetch/parse degrades to title+year + WARNING (§IV), never crashes the pipeline
         logger.warning(
             "film-profile details fetch failed for %r: %s — degrading to title+year",
@@ -296,6 +403,54 @@ _MIRROR_HOST = "kinozal.guru"
 _KINOZAL_HOSTS = frozenset({_ORIGIN_HOST, _MIRROR_HOST})
 _FASTPIC_HOST = "fastpic.org"
 
+# Hedged listing fetches (opt-in via KINOZAL_HEDGE_PERCENTILE). Until a few
+# kinozal.tv answers have been seen there is no percentile to wait for, so the hedge
+# waits a fixed 10 s: several times a healthy listing, well under one 30 s timeout.
+_HEDGE_ENV = "KINOZAL_HEDGE_PERCENTILE"
+_HEDGE_MIN_SAMPLES = 5
+_HEDGE_COLD_START_S = 10.0
+# The listings are each run's first kinozal.tv requests, so one run alone never has
+# `_HEDGE_MIN_SAMPLES` when they are fetched. With `STATE_DIR` set, the successful
+# listing latencies of earlier runs are kept per host — the last 50, for two weeks —
+# and seed the percentile.
+_LATENCY_CACHE_NAMESPACE = "kinozal_latency"
+_LATENCY_HISTORY = 50
+_LATENCY_TTL_S = 14 * 24 * 3600.0
+# One pool for every hedged listing of the run: room for the governor's per-host cap
+# on both kinozal.tv and kinozal.guru. It is not `prefetch`'s own pool, which the
+# listing fetches that wait on it occupy. A loser finishes in the background but
+# holds its worker (and governor slot) only until its own timeout.
+_HEDGE_POOL = ThreadPoolExecutor(
+    max_workers=2 * GOVERNOR.host_concurrency, thread_name_prefix="kinozal-hedge"
+)
+
+
+@functools.cache
+def _latency_store() -> LocalStore | None:
+    return open_store(_LATENCY_CACHE_NAMESPACE)
+
+
+def _latency_history(host: str) -> list[float]:
+    """`host`'s successful listing latencies stored by earlier runs, oldest first."""
+    store = _latency_store()
+    stored = store.get_json(host) if store is not None else None
+    if not isinstance(stored, list):
+        return []
+    return [float(ms) for ms in stored if isinstance(ms, int | float)]
+
+
+def _remember_listing_latencies() -> None:
+    """Append this run's successful kinozal.tv latencies to the stored history.
+
+    Called once the listings are in, so the history holds listing fetches only: a
+    details page is a different, smaller answer and would shorten the hedge delay."""
+    store = _latency_store()
+    samples = HTTP_CALLS.successes(_ORIGIN_HOST)
+    if store is None or not samples:
+        return
+    history = [*_latency_history(_ORIGIN_HOST), *samples][-_LATENCY_HISTORY:]
+    store.put_json(_ORIGIN_HOST, history, ttl_s=_LATENCY_TTL_S)
+
 
 def _is_fastpic(host: str) -> bool:
     """True for the fastpic anti-hotlink host and its numbered CDN subdomains
@@ -351,14 +506,26 @@ class Kinozal:
     credentials. Posters use the mirror *anonymously* (kinozal.guru serves
     /i/poster/ 200 without login, verified). When credentials are absent or
     partial the HTML mirror is disabled and the primary failure propagates,
-    surfacing visibly (§IV)."""
+    surfacing visibly (§IV).
+
+    With `hedge_percentile` set, a listing whose primary is merely slow is also
+    requested from the mirror — see `fetch_listing`."""
 
-    def __init__(self, username: str, password: str) -> None:
+    def __init__(
+        self, username: str, password: str, *, hedge_percentile: int | None = None
+    ) -> None:
         self._username = username
         self._password = password
         self._mirror_enabled = bool(username) and bool(password)
+        self._hedge_percentile = hedge_percentile
         self._session: _MirrorSession | None = None
         self._login_error: str | None = None
+        # A hedged mirror request logs in from a worker thread while the caller
+        # may reach `_ensure_login` too; one login per run must still hold.
+        self._login_lock = threading.Lock()
+        # The session `load_session` restored from an earlier run, if any: trusted
+        # until the mirror rejects it, then replaced by one fresh login.
+        self._restored_session: _MirrorSession | None = None
 
     @classmethod
     def from_env(cls) -> Kinozal:
@@ -366,7 +533,8 @@ class Kinozal:
 
         Single home for the credential read + partial-creds WARNING so both the
         default `run_kinozal_pipeline` path and `__main__` share it (the WARNING
-        used to live inline in the runner)."""
+        used to live inline in the runner). `KINOZAL_HEDGE_PERCENTILE` is read here
+        as well; a value outside 1–99 is a WARNING and leaves hedging off."""
         username = os.environ.get("KINOZAL_USERNAME", "")
         password = os.environ.get("KINOZAL_PASSWORD", "")
         if bool(username) != bool(password):
@@ -374,7 +542,16 @@ class Kinozal:
                 "kinozal: partial credentials — mirror fallback disabled "
                 "(set BOTH KINOZAL_USERNAME and KINOZAL_PASSWORD)"
             )
-        return cls(username, password)
+        raw = os.environ.get(_HEDGE_ENV, "").strip()
+        hedge: int | None = None
+        if raw:
+            if raw.isdigit() and 1 <= int(raw) <= 99:
+                hedge = int(raw)
+            else:
+                logger.warning(
+                    "kinozal: ignoring %s=%r — expected 1..99, hedging off", _HEDGE_ENV, raw
+                )
+        return cls(username, password, hedge_percentile=hedge)
 
     def fetch_listing(self, url: str) -> tuple[str, str]:
         """Return (html, effective_base_url): the HTML plus the origin that
@@ -385,7 +562,17 @@ class Kinozal:
         page yields .guru links (live for the logged-in user) instead of dead
         .tv ones — reversing #227/#241's fixed canonical-origin choice.
 
-        `fetch_details` reuses this origin→mirror decision (#263)."""
+        `fetch_details` reuses this origin→mirror decision (#263), unhedged.
+
+        Hedged mode (`hedge_percentile`, mirror enabled): when the primary has not
+        answered within that percentile of this run's successful kinozal.tv
+        attempts, the authenticated mirror request starts alongside it and whichever
+        succeeds first is returned, with the base of the origin that served it."""
+        if self._hedge_percentile is not None and self._mirror_enabled:
+            return self._fetch_hedged(url, self._hedge_percentile)
+        return self._fetch_with_fallback(url)
+
+    def _fetch_with_fallback(self, url: str) -> tuple[str, str]:
         try:
             return fetch_html(url), _origin(url)
         except Exception as primary_exc:  # noqa: BLE001 — any primary-fetch failure falls back to the mirror
@@ -398,6 +585,8 @@ class Kinozal:
         A healthy run serves the listing from the anonymous kinozal.tv primary, so
         `url` is a .tv link whose details page shows `Genre:` anonymously — reuse
         `fetch_listing`'s anonymous-primary / authenticated-mirror-on-error path.
+        It is never hedged: details are already fetched on `_prefetch_details`'s
+        workers, and a hedge per item would double the requests of a slow day.
 
         But when kinozal.tv is down the listing falls back to the authenticated
         kinozal.guru mirror (#247), so `url` is a *mirror* link. kinozal.guru gates
@@ -413,8 +602,8 @@ class Kinozal:
         the mirror is already enabled and logged in — so the guarded case is
         unreachable in prod; a login failure still degrades visibly via §IV.)"""
         if urlsplit(url).netloc == _MIRROR_HOST:
-            return fetch_authenticated(self._ensure_login(), url)
-        return self.fetch_listing(url)[0]
+            return self._fetch_mirror(url)
+        return self._fetch_with_fallback(url)[0]
 
     def fetch_poster(self, url: str) -> bytes:
         """Download a poster, sharing the listing's origin→mirror failover (#241).
@@ -433,11 +622,15 @@ class Kinozal:
         returns the BYTES downloaded within this call, never the signed URL — a
         future refactor must not hoist resolve out and revive `expires` staleness
         (the window is milliseconds today: the notifier downloads the poster once,
-        before its retry loop)."""
+        ahead of its send and before its retry loop, and resolve and fetch stay in this
+        one call). It runs on the notifier's prefetch threads. Only a fastpic URL asks `fetch_bytes` to keep an HTML
+        body: any other host's HTML page is refused at its headers, unread."""
+        host = urlsplit(url).netloc
         try:
+            if _is_fastpic(host):
+                return fetch_bytes(url, keep_html=True)
             return fetch_bytes(url)
         except NotAnImageError as viewer_exc:
-            host = urlsplit(url).netloc
             if not _is_fastpic(host):
                 raise  # only fastpic serves the viewer-page trap we can resolve
             direct = _extract_direct_image_url(viewer_exc.body.decode("utf-8", "replace"), url)
@@ -446,7 +639,6 @@ class Kinozal:
             logger.info("[kinozal] fastpic viewer resolved to signed image for %s", url)
             return fetch_bytes(direct)
         except Exception as primary_exc:  # noqa: BLE001 — mirror-retry for kinozal hosts, else propagate to §IV degrade
-            host = urlsplit(url).netloc
             if host not in _KINOZAL_HOSTS or host == _MIRROR_HOST:
                 raise
             mirror_url = _mirror_url(url)
@@ -458,13 +650,59 @@ class Kinozal:
             )
             return fetch_bytes(mirror_url)
 
+    def _fetch_hedged(self, url: str, percentile: int) -> tuple[str, str]:
+        """`fetch_listing` with a hedge: the mirror starts once the primary is late.
+
+        The delay is the nearest-rank `percentile` of the successful kinozal.tv
+        attempts of this run (`HTTP_CALLS`) and of earlier ones (`_latency_history`), so
+        roughly that share of listings never hedge, and a fixed `_HEDGE_COLD_START_S`
+        until enough have been seen. It is measured to the
+        primary's whole answer, not its headers: `fetch_html` returns the body with
+        them, and a listing body is small next to Cloudflare's time to first byte.
+
+        Both attempts run on `_HEDGE_POOL`. The loser is not cancelled — a request in
+        flight cannot be — and finishes in the background; its `http_call` lines still
+        show what it cost. A primary that fails before the delay takes the ordinary
+        mirror fallback."""
+        host = urlsplit(url).netloc
+        observed = HTTP_CALLS.percentile(
+            host, percentile, min_samples=_HEDGE_MIN_SAMPLES, prior=_latency_history(host)
+        )
+        delay_s = observed / 1000 if observed is not None else _HEDGE_COLD_START_S
+        mirror_url = _mirror_url(url)
+        primary = _HEDGE_POOL.submit(fetch_html, url)
+        if wait([primary], timeout=delay_s).done:
+            try:
+                return primary.result(), _origin(url)
+            except Exception as primary_exc:  # noqa: BLE001 — any primary-fetch failure falls back to the mirror
+                return self._from_mirror(url, primary_exc), _origin(mirror_url)
+        logger.info(
+            "[kinozal] primary %s slower than %.1fs (p%d) — hedging with mirror %s",
+            url,
+            delay_s,
+            percentile,
+            mirror_url,
+        )
+        mirror = _HEDGE_POOL.submit(self._fetch_mirror, mirror_url)
+        bases = {primary: _origin(url), mirror: _origin(mirror_url)}
+        pending = set(bases)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    logger.info("[kinozal] hedged %s served by %s", url, bases[future])
+                    return future.result(), bases[future]
+        primary_error, mirror_error = primary.exception(), mirror.exception()
+        raise RuntimeError(
+            f"primary failed ({primary_error}); mirror {mirror_url} also failed ({mirror_error})"
+        ) from mirror_error
+
     def _from_mirror(self, url: str, primary_exc: Exception) -> str:
         if not self._mirror_enabled:
             raise RuntimeError(f"{primary_exc} (mirror fallback disabled — credentials not set)")
-        session = self._ensure_login()
         mirror_url = _mirror_url(url)
         try:
-            html = fetch_authenticated(session, mirror_url)
+            html = self._fetch_mirror(mirror_url)
         except Exception as mirror_exc:
             raise RuntimeError(
                 f"primary failed ({primary_exc}); mirror {mirror_url} also failed ({mirror_exc})"
@@ -477,23 +715,58 @@ class Kinozal:
         )
         return html
 
+    def _fetch_mirror(self, url: str) -> str:
+        """`fetch_authenticated` through the run's mirror session.
+
+        A session saved by an earlier run is used without a login or a probe; this
+        fetch's login-redirect check is what validates it. Rejected, it is discarded
+        and the page is fetched once more through a fresh login. A rejection of a
+        session this run logged in itself is a real failure and propagates."""
+        session = self._ensure_login()
+        try:
+            return fetch_authenticated(session, url)
+        except KinozalLoginError:
+            if not self._drop_restored(session):
+                raise
+        return fetch_authenticated(self._ensure_login(), url)
+
+    def _drop_restored(self, rejected: _MirrorSession) -> bool:
+        with self._login_lock:
+            if rejected is not self._restored_session:
+                return False
+            # A concurrent hedged fetch may have dropped it already; either way the
+            # caller retries through whatever `_ensure_login` now returns.
+            if self._session is rejected:
+                self._session = None
+                discard_session()
+                logger.info("[kinozal] saved mirror session rejected — logging in afresh")
+            return True
+
     def _ensure_login(self) -> _MirrorSession:
-        if self._session is not None:
+        with self._login_lock:
+            if self._session is not None:
+                return self._session
+            if self._login_error is not None:
+                raise RuntimeError(f"mirror login failed earlier: {self._login_error}")
+            if self._restored_session is None:
+                self._restored_session = load_session()
+                if self._restored_session is not None:
+                    logger.info("[kinozal] reusing the mirror session saved by an earlier run")
+                    self._session = self._restored_session
+                    return self._session
+            try:
+                self._session = login(self._username, self._password)
+            except Exception as exc:
+                # Cache ANY login failure (bad creds → KinozalLoginError, but also
+                # transport errors like a timeout if kinozal.guru is itself under
+                # Cloudflare distress) so the "login at most once per run" guarantee
+                # holds — otherwise every subsequent URL retries a dead login,
+                # costing N×timeout seconds.
+                self._login_error = str(exc)
+                logger.error("kinozal mirror login failed: %s", exc)  # noqa: TRY400 — re-raised as RuntimeError with `from exc`; traceback surfaces at the isolation boundary
+                raise RuntimeError(f"mirror login failed: {exc}") from exc
+            save_session(self._session)
             return self._session
-        if self._login_error is not None:
-            raise RuntimeError(f"mirror login failed earlier: {self._login_error}")
-        try:
-            self._session = login(self._username, self._password)
-        except Exception as exc:
-            # Cache ANY login failure (bad creds → KinozalLoginError, but also
-            # transport errors like a timeout if kinozal.guru is itself under
-            # Cloudflare distress) so the "login at most once per run" guarantee
-            # holds — otherwise every subsequent URL retries a dead login,
-            # costing N×timeout seconds.
-            self._login_error = str(exc)
-            logger.error("kinozal mirror login failed: %s", exc)  # noqa: TRY400 — re-raised as RuntimeError with `from exc`; traceback surfaces at the isolation boundary
-            raise RuntimeError(f"mirror login failed: {exc}") from exc
-        return self._session
 
 
 def _build_notifier(bot_token: str, chat_id: str, kinozal: Kinozal) -> TelegramNotifier:
@@ -536,11 +809,39 @@ def _dedupe_key(raw: str) -> str:
     return parts[0]
 
 
+def _seen_run_stop(existing: set[str], run_length: int) -> Callable[[NormalizedItem], bool]:
+    """`extract_from_html`'s stop predicate for an incremental scan: True on the
+    `run_length`-th consecutive row whose `_dedupe_key` is already in storage."""
+    run = 0
+
+    def stop(item: NormalizedItem) -> bool:
+        nonlocal run
+        run = run + 1 if _dedupe_key(item.dedupe_key) in existing else 0
+        return run >= run_length
+
+    return stop
+
+
+def _incremental_existing_keys(
+    kinozal_sources: list[dict[str, Any]], storage: Storage
+) -> set[str] | None:
+    """The stored keys an incremental scan stops against, read before extraction, or
+    None when no source opts in (`incremental_stop_after`) or `KINOZAL_FULL_SCAN=1`
+    overrides them for this run."""
+    if not any(source.get("incremental_stop_after") for source in kinozal_sources):
+        return None
+    if os.environ.get("KINOZAL_FULL_SCAN", "").strip() == "1":
+        logger.info("kinozal pipeline: KINOZAL_FULL_SCAN=1 — incremental scan off, every row read")
+        return None
+    return storage.get_existing_keys("movies")
+
+
 def _extract_kinozal_items(
     html: str,
     source: dict[str, Any],
     base_url: str | None = None,
     listing_url: str | None = None,
+    existing: set[str] | None = None,
 ) -> PipelineResult:
     """Parse kinozal HTML and return PipelineResult with clean titles and raw dedupe_keys.
 
@@ -559,10 +860,27 @@ def _extract_kinozal_items(
     a notification without a link, reports it, and we fix the drift. Silently
     dropping them would just look like "no new films" to the user. The WARNING
     is the dev-side tripwire for the same situation in logs.
+
+    With `existing` given and the source's `incremental_stop_after` set to K, the
+    listing is read only until K consecutive rows are already stored: the source
+    declares that its listing puts new releases first, so the tail is all seen.
     """
     if base_url is not None:
         source = {**source, "base_url": base_url}
-    result = extract_from_html(html, source)
+    stop_after = int(source.get("incremental_stop_after") or 0)
+    stop_when = (
+        _seen_run_stop(existing, stop_after) if stop_after and existing is not None else None
+    )
+    result = extract_from_html(html, source, stop_when=stop_when)
+    if result.metrics is not None:
+        logger.info(
+            "[%s] %s: scanned %d of %d rows (incremental, stop after %d already-seen in a row)",
+            source["id"],
+            listing_url,
+            result.metrics.extracted,
+            result.metrics.fetched,
+            stop_after,
+        )
     if not result.ok:
         logger.error("[%s] extraction errors: %s", source["id"], result.errors)
         return result
@@ -621,6 +939,55 @@ _TRAILER_ERROR_MARKER = "⚠️ трейлер: ошибка поиска"
 _TRAILER_QUOTA_MARKER = "⚠️ трейлер: дневная квота YouTube"
 
 
+# A film's pick is stable for weeks; a miss is worth re-searching sooner, since a
+# trailer is often uploaded after the release. Both save `search.list` quota on a
+# film that comes back — a failed delivery is new again the next day.
+_TRAILER_CACHE_NAMESPACE = "kinozal_trailers"
+_TRAILER_CACHE_MAX_ENTRIES = 5000
+_TRAILER_CACHE_TTL_S = 30 * 24 * 3600.0
+_TRAILER_CACHE_MISS_TTL_S = 3 * 24 * 3600.0
+
+# `hit` = a stored pick or miss was served, `miss` = YouTube was searched.
+TRAILER_CACHE_STATS: Counter[str] = Counter()
+_TRAILER_CACHE_STATS_LOCK = threading.Lock()
+
+
+@functools.cache
+def _trailer_store() -> LocalStore | None:
+    return open_store(_TRAILER_CACHE_NAMESPACE, max_entries=_TRAILER_CACHE_MAX_ENTRIES)
+
+
+def _count_trailer_lookup(outcome: str) -> None:
+    with _TRAILER_CACHE_STATS_LOCK:
+        TRAILER_CACHE_STATS[outcome] += 1
+
+
+def _trailer_key(profile: FilmProfile) -> str:
+    return json.dumps([profile.ru_title, profile.original_title, profile.year], ensure_ascii=False)
+
+
+def _cached_trailer(store: LocalStore, profile: FilmProfile) -> str | None:
+    """The stored outcome for `profile` as `select_trailer` returns it, or None."""
+    cached = store.get_json(_trailer_key(profile))
+    if not isinstance(cached, dict) or "video_id" not in cached:
+        return None
+    _count_trailer_lookup("hit")
+    video_id = cached["video_id"]
+    searched = time.strftime("%Y-%m-%d", time.gmtime(float(cached.get("at", 0))))
+    if video_id is None:
+        logger.info("no trailer found for %r (cached miss from %s)", profile.ru_title, searched)
+        return _TRAILER_MISS_MARKER
+    logger.info(
+        "trailer pick for %r: cached from %s (video_id=%s)", profile.ru_title, searched, video_id
+    )
+    return f"https://www.youtube.com/watch?v={video_id}"
+
+
+def _store_trailer(store: LocalStore, profile: FilmProfile, video_id: str | None) -> None:
+    ttl_s = _TRAILER_CACHE_TTL_S if video_id is not None else _TRAILER_CACHE_MISS_TTL_S
+    store.put_json(_trailer_key(profile), {"video_id": video_id, "at": time.time()}, ttl_s=ttl_s)
+
+
 def select_trailer(profile: FilmProfile, youtube: Any) -> str:
     """Retrieval, selection, and §IV markers: everything between profile and user.
 
@@ -654,7 +1021,19 @@ def select_trailer(profile: FilmProfile, youtube: Any) -> str:
     is pinned by `tests/fixtures/trailer_baseline.json`, so post-pick policy changes fail
     `tests/test_eval_baseline.py`. The seam is `FilmProfile`, the golden-set's native form;
     `NormalizedItem` would make fixtures duplicate Kinozal title grammar (§II).
+
+    **Cross-run cache.** With `STATE_DIR` set, the outcome is stored per
+    (ru_title, original_title, year): a pick for 30 days, a miss for 3. A stored
+    outcome is returned without calling `search_candidates`. A retrieval error or a
+    quota refusal is not an outcome and is never stored. The eval harness runs
+    without `STATE_DIR`, so its measurements always search.
     """
+    store = _trailer_store()
+    if store is not None:
+        cached = _cached_trailer(store, profile)
+        if cached is not None:
+            return cached
+        _count_trailer_lookup("miss")
     try:
         candidates = youtube.search_candidates(profile)
     except YoutubeQuotaExhausted:
@@ -666,6 +1045,8 @@ def select_trailer(profile: FilmProfile, youtube: Any) -> str:
         logger.warning("trailer lookup failed for %r: %s", profile.ru_title, exc, exc_info=True)
         return _TRAILER_ERROR_MARKER
     pick = HeuristicStrategy().pick(profile, candidates)
+    if store is not None:
+        _store_trailer(store, profile, pick.video_id)
     if pick.video_id is None:
         logger.info(
             "no trailer found for %r (pool=%d candidates)", profile.ru_title, len(candidates)
@@ -681,6 +1062,12 @@ def select_trailer(profile: FilmProfile, youtube: Any) -> str:
     return f"https://www.youtube.com/watch?v={pick.video_id}"
 
 
+def _release_year(item: NormalizedItem) -> int | None:
+    raw_for_year = item.raw.get("kinozal_raw_title", item.dedupe_key)
+    year_match = re.search(r"\b(20\d{2})\b", raw_for_year)
+    return int(year_match.group(1)) if year_match else None
+
+
 def enrich_with_trailer(item: NormalizedItem, youtube: Any) -> str:
     """Pick a YouTube trailer URL, or return a visible §IV marker (#144/#315).
 
@@ -695,16 +1082,27 @@ def enrich_with_trailer(item: NormalizedItem, youtube: Any) -> str:
     tests; #385 (game grammar) and #393 occurred here, so `trailer_baseline.json` will
     not see a change in this half.
     """
+    return select_trailer(_film_profile(item), youtube)
+
+
+def _film_profile(item: NormalizedItem) -> FilmProfile:
     clean = item.title.split("(")[0].strip()
     raw_for_year = item.raw.get("kinozal_raw_title", item.dedupe_key)
-    year_match = re.search(r"\b(20\d{2})\b", raw_for_year)
-    year = int(year_match.group(1)) if year_match else None
+    year = _release_year(item)
     # `original_title` itself suppresses a service second segment (`x64`, `RU`); the
     # guard belongs in title grammar, not here (#412). The former `kinozal_is_game`
     # branch (#385) suppressed originals for ALL game-URL listings, breaking localized
     # games that have an original in the standard position.
     orig = original_title(raw_for_year)
-    return select_trailer(FilmProfile(ru_title=clean, original_title=orig, year=year), youtube)
+    return FilmProfile(ru_title=clean, original_title=orig, year=year)
+
+
+def _trailer_without_quota(item: NormalizedItem) -> str:
+    """The trailer an item gets once the quota is gone: its cached outcome, since
+    serving one costs no search, or else the quota marker."""
+    store = _trailer_store()
+    cached = _cached_trailer(store, _film_profile(item)) if store is not None else None
+    return cached or _TRAILER_QUOTA_MARKER
 
 
 def _matched_excluded_genre(genre_raw: str, excluded: set[str]) -> str | None:
@@ -738,32 +1136,56 @@ class _ItemFilterOutcome:
     genre_unparsed: bool = False
 
 
+def _details_or_error(future: Future[DetailsPage]) -> DetailsPage | Exception:
+    try:
+        return future.result()
+    except Exception as exc:  # noqa: BLE001 — handed to `_filter_item`, which keeps the item fail-open
+        return exc
+
+
+def _prefetch_details(
+    items: list[NormalizedItem], fetcher: Kinozal
+) -> list[DetailsPage | Exception]:
+    """Fetch every item's details page on `prefetch`'s workers; one slot per item, in
+    item order.
+
+    A release already in the details cache is not fetched. Each other page goes
+    through `fetcher.fetch_details`, so the origin→mirror failover
+    applies per item exactly as in the serial loop it replaces. A failure is kept
+    as the exception in its slot rather than raised: `_filter_item` decides what it
+    means, in item order, so classification logs keep the listing's order even
+    though the fetches overlap."""
+    urls = [item.url for item in items]
+    pages = prefetch(functools.partial(_details_page, fetch=fetcher.fetch_details), urls)
+    return [_details_or_error(future) for future in pages]
+
+
 def _filter_item(
     item: NormalizedItem,
-    fetcher: Kinozal,
+    details: DetailsPage | Exception | None,
     excluded_categories: set[str],
     excluded_genres: set[str],
 ) -> _ItemFilterOutcome:
-    """Classify one new item from at most one details-page response."""
+    """Classify one new item from at most one details page.
+
+    `details` is that page, or the exception its fetch ended with; None when
+    no filter is configured and nothing was fetched."""
     item.raw["kinozal_item_category"] = None
     item.raw["kinozal_item_category_name"] = None
-    if not (excluded_categories or excluded_genres):
+    if not (excluded_categories or excluded_genres) or details is None:
         _log_item_filter_outcome(item, "delivered")
         return _ItemFilterOutcome()
 
-    try:
-        details_html = fetcher.fetch_details(item.url)
-    except Exception as exc:  # noqa: BLE001 — unknown type/genre stays visible and fail-open (§IV)
+    if isinstance(details, Exception):
         logger.warning(
             "[%s] item category/genre details lookup failed for %r (%s) — keeping item (fail-open)",
             item.source_id,
             item.title,
-            exc,
+            details,
         )
         _log_item_filter_outcome(item, "delivered")
         return _ItemFilterOutcome()
-
-    category_id = _parse_item_category(details_html)
+    category_id = details.category_id
     item.raw["kinozal_item_category"] = category_id
     category_name = _item_category_name(category_id) if category_id is not None else None
     item.raw["kinozal_item_category_name"] = category_name
@@ -792,7 +1214,7 @@ def _filter_item(
 
     genre_unparsed = False
     if excluded_genres:
-        genre = _parse_genre(details_html)
+        genre = details.genre
         if not genre:
             genre_unparsed = True
         elif matched_genre := _matched_excluded_genre(genre, excluded_genres):
@@ -862,6 +1284,9 @@ def _apply_item_filters(
     fail-open per item, while a category filter that resolves zero items becomes
     a visible source error. Filtered items are returned for terminal dedup storage
     and never reach trailer lookup or notification (#263, #506).
+
+    The details pages are fetched up front by `_prefetch_details`, in parallel;
+    classification then runs serially over the items in order.
     """
     kept: list[NormalizedItem] = []
     filtered: list[NormalizedItem] = []
@@ -871,12 +1296,15 @@ def _apply_item_filters(
     category_total_by_source: dict[str, int] = {}
     category_resolved_by_source: dict[str, int] = {}
 
-    for item in items:
+    details: list[DetailsPage | Exception | None] = [None] * len(items)
+    if excluded_categories or excluded_genres:
+        details = list(_prefetch_details(items, fetcher))
+    for item, item_details in zip(items, details, strict=True):
         if excluded_categories:
             category_total_by_source[item.source_id] = (
                 category_total_by_source.get(item.source_id, 0) + 1
             )
-        outcome = _filter_item(item, fetcher, excluded_categories, excluded_genres)
+        outcome = _filter_item(item, item_details, excluded_categories, excluded_genres)
         if outcome.category_resolved:
             category_resolved_by_source[item.source_id] = (
                 category_resolved_by_source.get(item.source_id, 0) + 1
@@ -902,17 +1330,53 @@ def _apply_item_filters(
     return kept, filtered
 
 
+def _listing_or_error(future: Future[tuple[str, str]]) -> tuple[str, str] | Exception:
+    try:
+        return future.result()
+    except Exception as exc:  # noqa: BLE001 — recorded per source by `_fetch_and_extract`
+        return exc
+
+
+def _hit_rate_line(name: str, stats: Counter[str]) -> list[str]:
+    if not stats:
+        return []
+    hits, misses = stats["hit"], stats["miss"]
+    return [f"{name}: hit={hits} miss={misses} hit_rate={hits / (hits + misses):.0%}"]
+
+
+def cache_summary_lines() -> list[str]:
+    """Run-summary lines for the details and trailer caches; a cache that was never
+    consulted (no `STATE_DIR`, no filter) has no line."""
+    return _hit_rate_line("kinozal_details_cache", DETAILS_CACHE_STATS) + _hit_rate_line(
+        "kinozal_trailer_cache", TRAILER_CACHE_STATS
+    )
+
+
+def _fetch_listings(urls: list[str], fetcher: Kinozal) -> dict[str, tuple[str, str] | Exception]:
+    """Fetch each distinct listing URL once, on `prefetch`'s workers: `(html,
+    effective_base_url)` per URL, or the exception its fetch ended with (the per-URL
+    isolation below)."""
+    distinct = list(dict.fromkeys(urls))
+    listings = prefetch(fetcher.fetch_listing, distinct)
+    return {url: _listing_or_error(future) for url, future in zip(distinct, listings, strict=True)}
+
+
 def _fetch_and_extract(
     kinozal_sources: list[dict[str, Any]],
     urls: list[str],
     fetcher: Kinozal,
+    existing: set[str] | None = None,
 ) -> tuple[list[NormalizedItem], list[PipelineResult]]:
-    """Fetch HTML for every (source × url) pair and extract items.
+    """Fetch HTML for every url once and extract items for every (source × url) pair.
 
     Returns the accumulated items plus one `PipelineResult` per source (fetch and
     extraction errors recorded per-URL). Items keep their source_id from
     `extract_from_html` so the per-source dedup below picks them up correctly.
 
+    Every source extracts from the same listings: `_fetch_listings` downloads each
+    URL once, concurrently, before the loop. A failed URL is an error in every
+    source that reads it, exactly as when each source fetched it itself.
+
     The double `for source: for url:` loop is kept atomic on purpose: both
     `continue` branches (fetch-fail, extraction-fail) stay `continue`, so when one
     URL of a source fails its sibling URL's items still accumulate AND the error
@@ -920,17 +1384,22 @@ def _fetch_and_extract(
     sub-helper would flip `continue`→`return` and silently regress that partial-
     fail-plus-success branch, which has no direct characterization test (#286).
     """
+    listings = _fetch_listings(urls, fetcher)
+    _remember_listing_latencies()
     all_items: list[NormalizedItem] = []
     results: list[PipelineResult] = []
     for source in kinozal_sources:
         result = PipelineResult(source_id=source["id"])
         for url in urls:
-            try:
-                html_text, effective_base_url = fetcher.fetch_listing(url)
-            except Exception as exc:  # noqa: BLE001 — per-URL isolation: logged + surfaced via result.errors
-                logger.exception("[%s] fetch failed for %s: %s", source["id"], url, exc)
-                result.errors.append(f"fetch failed for {url}: {exc}")
+            listing = listings[url]
+            if isinstance(listing, Exception):
+                # Per-URL isolation: logged + surfaced via result.errors.
+                logger.error(
+                    "[%s] fetch failed for %s: %s", source["id"], url, listing, exc_info=listing
+                )
+                result.errors.append(f"fetch failed for {url}: {listing}")
                 continue
+            html_text, effective_base_url = listing
             # Resolve this listing's links/posters against the origin that served
             # it (.tv on primary, .guru on mirror fallback) — not a fixed host (#247).
             extracted = _extract_kinozal_items(
@@ -938,6 +1407,7 @@ def _fetch_and_extract(
                 source,
                 base_url=effective_base_url,
                 listing_url=url,
+                existing=existing,
             )
             if not extracted.ok:
                 result.errors.extend(extracted.errors)
@@ -951,11 +1421,13 @@ def _dedup_and_log_coverage(
     all_items: list[NormalizedItem],
     results: list[PipelineResult],
     storage: Storage,
+    existing: set[str] | None = None,
 ) -> list[NormalizedItem]:
     """Collapse repacks, re-attach items per source, log coverage, return new items.
 
     Mutates `results` in-place: each result gets its `.items` set so callers can
-    inspect coverage. Returns the not-yet-seen items (dedup against the sheet).
+    inspect coverage. Returns the not-yet-seen items (dedup against the sheet);
+    `existing` is the sheet's keys when an incremental scan already read them.
     """
     raw_count = len(all_items)
     all_items = _normalize_items(all_items)
@@ -966,7 +1438,8 @@ def _dedup_and_log_coverage(
     for result in results:
         result.items = items_by_source.get(result.source_id, [])
 
-    existing = storage.get_existing_keys("movies")
+    if existing is None:
+        existing = storage.get_existing_keys("movies")
     new_items = [i for i in all_items if i.dedupe_key not in existing]
     # Visibility (§IV): log coverage on every run — including the common "0 new"
     # path — so a vanished film reads in the Actions log instead of looking like
@@ -981,6 +1454,91 @@ def _dedup_and_log_coverage(
     return new_items
 
 
+def _lazy_original_query() -> bool:
+    """KINOZAL_TRAILER_LAZY_ORIGINAL=1: `Youtube` issues a film's original-title query
+    only when its RU results hold no unique confident pick (`youtube.search_candidates`)."""
+    return os.environ.get("KINOZAL_TRAILER_LAZY_ORIGINAL", "").strip() == "1"
+
+
+def _trailer_priority() -> list[tuple[str, str]]:
+    """KINOZAL_TRAILER_PRIORITY: `;`-separated `source:<id>` / `category:<name>` terms,
+    most important first. Category names match like the item-category denylist
+    (exact or group prefix); an unknown kind is dropped with a WARNING."""
+    terms: list[tuple[str, str]] = []
+    for raw in os.environ.get("KINOZAL_TRAILER_PRIORITY", "").split(";"):
+        kind, _, value = raw.partition(":")
+        kind, value = kind.strip().lower(), value.strip()
+        if not raw.strip():
+            continue
+        if kind == "source" and value:
+            terms.append((kind, value))
+        elif kind == "category" and value:
+            terms.append((kind, _normalize_item_category_name(value)))
+        else:
+            logger.warning(
+                "KINOZAL_TRAILER_PRIORITY: ignoring %r (want source:… or category:…)", raw
+            )
+    return terms
+
+
+def _priority_rank(item: NormalizedItem, terms: list[tuple[str, str]]) -> int:
+    category = item.raw.get("kinozal_item_category_name")
+    for rank, (kind, value) in enumerate(terms):
+        if kind == "source" and item.source_id == value:
+            return rank
+        if kind == "category" and category and _item_category_excluded(category, {value}):
+            return rank
+    return len(terms)
+
+
+def _enrichment_order(
+    items: list[NormalizedItem], terms: list[tuple[str, str]]
+) -> list[NormalizedItem]:
+    """The order films are given the day's quota in: the first matching priority term,
+    then the newer release year, then listing order. Notifications keep listing order."""
+    return sorted(
+        items,
+        key=lambda item: (_priority_rank(item, terms), -(_release_year(item) or 0)),
+    )
+
+
+def _enrich_trailers(
+    kept: list[NormalizedItem], youtube: Any, quota_ledger: QuotaLedger | None
+) -> None:
+    """Set every kept item's `trailer_url`, in `_enrichment_order`, until the first
+    quota refusal (see `_notify_and_persist`). A refusal the ledger recorded earlier
+    today stops enrichment before the first search. Past the refusal, a film whose
+    outcome is cached still gets it (`_trailer_without_quota`)."""
+    ordered = _enrichment_order(kept, _trailer_priority())
+    quota_exhausted = quota_ledger is not None and quota_ledger.exhausted()
+    if quota_exhausted and ordered:
+        logger.warning(
+            "youtube quota already exhausted today (quota ledger); "
+            "%d films skip retrieval and get a cached outcome or a visible marker",
+            len(ordered),
+        )
+    for i, item in enumerate(ordered):
+        if quota_exhausted:
+            item.trailer_url = _trailer_without_quota(item)
+            continue
+        try:
+            item.trailer_url = enrich_with_trailer(item, youtube)
+        except YoutubeQuotaExhausted as exc:
+            quota_exhausted = True
+            item.trailer_url = _TRAILER_QUOTA_MARKER
+            # One line per run, not per film: the 163-line noise in run 30143534431
+            # is part of the defect and must not recur (§IV: an anomaly must be
+            # readable rather than drowned in repeats). `exc_info` names the API limit.
+            logger.warning(
+                "youtube quota exhausted after %d enriched films: %s; "
+                "%d remaining films skip retrieval and get a cached outcome or a visible marker",
+                i,
+                exc,
+                len(ordered) - i,
+                exc_info=True,
+            )
+
+
 def _notify_and_persist(
     kept: list[NormalizedItem],
     filtered: list[NormalizedItem],
@@ -989,6 +1547,7 @@ def _notify_and_persist(
     notifier: Notifier,
     storage: Storage,
     results: list[PipelineResult],
+    quota_ledger: QuotaLedger | None = None,
 ) -> None:
     """Enrich, notify, persist delivered+filtered, and surface failed deliveries.
 
@@ -1021,31 +1580,16 @@ def _notify_and_persist(
     The stop lives here because "a run" only exists at this level:
     `search_candidates` is stateless and `Youtube` builds a network client in its
     constructor.
+
+    **Which films get the quota.** `_enrich_trailers` spends it in priority order
+    (`KINOZAL_TRAILER_PRIORITY`, then the newer release), so a refusal lands on the
+    films that matter least. The `quota_ledger` only reports what was spent; the one
+    thing it decides is that a day the API already refused is not asked again.
     """
-    notifications: list[Notification] = []
-    quota_exhausted = False
-    for i, item in enumerate(kept):
-        if quota_exhausted:
-            item.trailer_url = _TRAILER_QUOTA_MARKER
-        else:
-            try:
-                item.trailer_url = enrich_with_trailer(item, youtube)
-            except YoutubeQuotaExhausted as exc:
-                quota_exhausted = True
-                item.trailer_url = _TRAILER_QUOTA_MARKER
-                # One line per run, not per film: the 163-line noise in run 30143534431
-                # is part of the defect and must not recur (§IV: an anomaly must be
-                # readable rather than drowned in repeats). `exc_info` names the API limit.
-                logger.warning(
-                    "youtube quota exhausted after %d enriched films: %s; "
-                    "%d remaining films skip retrieval with a visible marker",
-                    i,
-                    exc,
-                    len(kept) - i,
-                    exc_info=True,
-                )
-        template = source_map[item.source_id]["message_template"]
-        notifications.append(build_notification(item, template))
+    _enrich_trailers(kept, youtube, quota_ledger)
+    notifications = [
+        build_notification(item, source_map[item.source_id]["message_template"]) for item in kept
+    ]
 
     sent, failed = notifier.send_items(notifications)
 
@@ -1076,6 +1620,8 @@ def run_kinozal_pipeline(
     # via `_build_notifier(bot_token, chat_id, kinozal)` — otherwise posters keep
     # hitting the dead origin (the #241 bug). `__main__` does both.
     kinozal: Kinozal | None = None,
+    # The ledger `youtube` spends into, when one is attached (`__main__`).
+    quota_ledger: QuotaLedger | None = None,
 ) -> list[PipelineResult]:
     config = sources_config or load_sources_config()
     kinozal_sources = [
@@ -1108,7 +1654,8 @@ def run_kinozal_pipeline(
     # posters share one origin-vs-mirror decision (#241).
     fetcher = kinozal or Kinozal.from_env()
 
-    all_items, results = _fetch_and_extract(kinozal_sources, urls, fetcher)
+    existing = _incremental_existing_keys(kinozal_sources, storage)
+    all_items, results = _fetch_and_extract(kinozal_sources, urls, fetcher, existing)
     excluded_categories = _excluded_item_categories()
     excluded_genres = _excluded_genres()
     _validate_item_category_config(excluded_categories, results)
@@ -1116,7 +1663,7 @@ def run_kinozal_pipeline(
         logger.info("kinozal pipeline: no items extracted")
         return results
 
-    new_items = _dedup_and_log_coverage(all_items, results, storage)
+    new_items = _dedup_and_log_coverage(all_items, results, storage, existing)
     if not new_items:
         logger.info("kinozal pipeline: no new items")
         return results
@@ -1128,12 +1675,13 @@ def run_kinozal_pipeline(
         excluded_genres,
         results,
     )
-    _notify_and_persist(kept, filtered, source_map, youtube, notifier, storage, results)
+    _notify_and_persist(
+        kept, filtered, source_map, youtube, notifier, storage, results, quota_ledger
+    )
     return results
 
 
 if __name__ == "__main__":
-    import json
     import sys
 
     import gspread
@@ -1155,10 +1703,17 @@ if __name__ == "__main__":
         os.environ["TELEGRAM_CHAT_ID"],
         kinozal,
     )
-    youtube = Youtube()
-    prod_results = run_kinozal_pipeline(storage, notifier, youtube, kinozal=kinozal)
+    quota_ledger = open_quota_ledger()
+    youtube = Youtube(ledger=quota_ledger, lazy_original=_lazy_original_query())
+    prod_results = run_kinozal_pipeline(
+        storage, notifier, youtube, kinozal=kinozal, quota_ledger=quota_ledger
+    )
+
+    from kinozal_scraper.alerting import publish_run_summary, report_failures
 
-    from kinozal_scraper.alerting import report_failures
+    # Before the exit-code branch, as in the GitHub pipelines (#459).
+    quota_lines = [quota_ledger.summary_line()] if quota_ledger is not None else []
+    publish_run_summary(prod_results, extra_lines=cache_summary_lines() + quota_lines)
 
     if report_failures(notifier, prod_results):
         sys.exit(1)
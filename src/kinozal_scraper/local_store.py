@@ -0,0 +1,183 @@
+"""Cross-run local state: one sqlite file under `STATE_DIR`, opt-in.
+
+Every pipeline starts from nothing each night, so anything learned on the previous
+run — an `ETag`, a details page already parsed, a trailer already found — is paid for
+again. This module is the one place such state lives: a key/value table per
+*namespace*, values as bytes or JSON, each entry with an optional TTL and each
+namespace with an optional size bound (least-recently-used entries go first).
+
+**Opt-in by environment.** `open_store` returns `None` when `STATE_DIR` is unset, and
+every caller treats `None` as "no cache" — local runs, tests and a workflow without
+the cache step behave exactly as before. In production `run-script.yml` points
+`STATE_DIR` at a directory that `actions/cache` restores before the pipelines and
+saves after them.
+
+**A cache must never fail a run.** Any `sqlite3.Error` (a corrupt file from a
+half-saved cache, a read-only directory) degrades to a WARNING and a miss: the
+caller falls back to the network, which is what it did before the cache existed.
+Silent degradation would hide a cache that never hits, so the warning is kept (§IV).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+STATE_DIR_ENV = "STATE_DIR"
+_DB_NAME = "state.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value BLOB NOT NULL,
+    expires_at REAL,
+    touched_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+)
+"""
+
+
+def state_dir() -> Path | None:
+    raw = os.environ.get(STATE_DIR_ENV, "").strip()
+    return Path(raw) if raw else None
+
+
+class LocalStore:
+    """One namespace of the shared state file.
+
+    Each store keeps its own connection to the shared file; sqlite's locking covers
+    the file, and the lock below serialises this store's statements so one store can
+    be used from worker threads."""
+
+    def __init__(self, path: Path, namespace: str, *, max_entries: int | None = None) -> None:
+        self.path = path
+        self.namespace = namespace
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(_SCHEMA)
+
+    def get(self, key: str) -> bytes | None:
+        now = time.time()
+        try:
+            with self._lock, self._conn:
+                row = self._conn.execute(
+                    "SELECT value, expires_at FROM entries WHERE namespace = ? AND key = ?",
+                    (self.namespace, key),
+                ).fetchone()
+                if row is None:
+                    return None
+                value, expires_at = row
+                if expires_at is not None and expires_at <= now:
+                    self._conn.execute(
+                        "DELETE FROM entries WHERE namespace = ? AND key = ?",
+                        (self.namespace, key),
+                    )
+                    return None
+                self._conn.execute(
+                    "UPDATE entries SET touched_at = ? WHERE namespace = ? AND key = ?",
+                    (now, self.namespace, key),
+                )
+        except sqlite3.Error as exc:
+            self._degraded("read", exc)
+            return None
+        return bytes(value)
+
+    def put(self, key: str, value: bytes, *, ttl_s: float | None = None) -> None:
+        now = time.time()
+        expires_at = now + ttl_s if ttl_s is not None else None
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                    (self.namespace, key, value, expires_at, now),
+                )
+                if self._max_entries is not None:
+                    self._evict(self._max_entries)
+        except sqlite3.Error as exc:
+            self._degraded("write", exc)
+
+    def delete(self, key: str) -> None:
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "DELETE FROM entries WHERE namespace = ? AND key = ?", (self.namespace, key)
+                )
+        except sqlite3.Error as exc:
+            self._degraded("delete", exc)
+
+    def get_json(self, key: str) -> Any:
+        """`get` for JSON values; an undecodable entry is a miss, not a crash."""
+        raw = self.get(key)
+        if raw is None:
+            return None
+        try:
+            return json.loads(raw)
+        except ValueError as exc:
+            self._degraded("decode", exc)
+            return None
+
+    def put_json(self, key: str, value: Any, *, ttl_s: float | None = None) -> None:
+        self.put(key, json.dumps(value, ensure_ascii=False).encode("utf-8"), ttl_s=ttl_s)
+
+    def __len__(self) -> int:
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT COUNT(*) FROM entries WHERE namespace = ?", (self.namespace,)
+                ).fetchone()
+        except sqlite3.Error as exc:
+            self._degraded("count", exc)
+            return 0
+        return int(row[0])
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _evict(self, max_entries: int) -> None:
+        # Expired entries go first, then the least recently touched beyond the bound.
+        self._conn.execute(
+            "DELETE FROM entries WHERE namespace = ? AND expires_at IS NOT NULL "
+            "AND expires_at <= ?",
+            (self.namespace, time.time()),
+        )
+        self._conn.execute(
+            "DELETE FROM entries WHERE namespace = ? AND key NOT IN ("
+            "SELECT key FROM entries WHERE namespace = ? ORDER BY touched_at DESC LIMIT ?)",
+            (self.namespace, self.namespace, max_entries),
+        )
+
+    def _degraded(self, operation: str, exc: Exception) -> None:
+        logger.warning(
+            "[local_store] %s %s failed, treating as a miss: %s",
+            self.namespace,
+            operation,
+            exc,
+        )
+
+
+def open_store(namespace: str, *, max_entries: int | None = None) -> LocalStore | None:
+    """The `namespace` store under `STATE_DIR`, or None when persistence is off.
+
+    A store that cannot even be opened is logged and treated as off: the run goes on
+    without a cache rather than failing on one."""
+    directory = state_dir()
+    if directory is None:
+        return None
+    try:
+        return LocalStore(directory / _DB_NAME, namespace, max_entries=max_entries)
+    except (OSError, sqlite3.Error) as exc:
+        logger.warning("[local_store] cannot open %s under %s: %s", namespace, directory, exc)
+        return None
@@ -0,0 +1,116 @@
+"""Persisted attempt ledger: the patient schedule without the sleeping runner.
+
+`retry_antibot_patient` spreads soldout's attempts 720 s apart inside ONE process, so
+the step holds a runner for up to ~4.6 h and spends nearly all of it in `time.sleep`.
+What ADR 0002 measured is the *spacing* of the attempts, not that one process makes
+them. This ledger keeps the spacing and drops the sleep: each short invocation (the
+`soldout-patient.yml` cron) asks `admit` whether an attempt is due, makes at most ONE
+attempt, and `record`s its outcome in the cross-run `local_store`. The next
+invocation picks up where the last one stopped.
+
+The numbers are the policy's own — `_PATIENT_ATTEMPTS` attempts per window, never
+closer than `_PATIENT_WAIT_S` apart — imported from `http_retry`, so the ADR's 24 and
+720 stay in one place. A window is one UTC day: the daily run made its 24 attempts
+within one night, and a window closes early once an attempt succeeds or fails for a
+reason no retry would change, exactly where the in-process policy would have stopped.
+
+An attempt is stamped when it is admitted, not when its fetch returns: cron fires
+every 720 s, and an invocation whose runner start, install and fetch run faster than
+the previous one's would otherwise find itself a few seconds short and be refused,
+leaving a 24-minute gap. For the same reason the spacing is enforced with
+`_SPACING_SLACK_S` of slack: two admissions are at least 660 s apart, the cron slots
+720 s, so jitter in the runner start never costs a slot, and a late or dropped
+invocation still only widens the spread.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from kinozal_scraper.http_retry import _PATIENT_ATTEMPTS, _PATIENT_WAIT_S
+from kinozal_scraper.local_store import LocalStore, open_store
+
+_NAMESPACE = "patient_ledger"
+# Yesterday's window is all a new one ever needs to see; a week bounds a store
+# whose workflow stopped running.
+_ENTRY_TTL_S = 7 * 24 * 3600.0
+# A runner starts anywhere from seconds to a minute or so after its cron slot.
+_SPACING_SLACK_S = 60.0
+
+
+@dataclass(frozen=True)
+class Admission:
+    """`attempt` is the 1-based number of the attempt due now, or None when none is;
+    `reason` is the operator-facing line either way."""
+
+    attempt: int | None
+    reason: str
+
+
+class PatientLedger:
+    """Per-key attempt counts of the current window, in one `local_store` namespace."""
+
+    def __init__(
+        self,
+        store: LocalStore,
+        *,
+        attempts: int = _PATIENT_ATTEMPTS,
+        spacing_s: float = _PATIENT_WAIT_S,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._store = store
+        self._attempts = attempts
+        self._spacing_s = spacing_s
+        self._clock = clock
+
+    def admit(self, key: str) -> Admission:
+        """Whether an attempt is due now; a due one is stamped as started, so the
+        spacing runs from this admission."""
+        now = self._clock()
+        entry = self._entry(key, now)
+        if entry["closed"]:
+            return Admission(None, f"window {entry['window']} closed ({entry['closed']})")
+        if entry["attempts"] >= self._attempts:
+            return Admission(
+                None, f"window {entry['window']} exhausted ({self._attempts} attempts)"
+            )
+        last = entry["last_attempt_at"]
+        due_in = self._spacing_s - _SPACING_SLACK_S - (now - last) if last is not None else 0.0
+        if due_in > 0:
+            return Admission(
+                None,
+                f"attempt {entry['attempts'] + 1}/{self._attempts} not due for {due_in:.0f}s",
+            )
+        entry["last_attempt_at"] = now
+        self._store.put_json(key, entry, ttl_s=_ENTRY_TTL_S)
+        return Admission(entry["attempts"] + 1, f"attempt {entry['attempts'] + 1}/{self._attempts}")
+
+    def record(self, key: str, *, closed: str | None = None) -> int:
+        """Count the attempt `admit` let through; `closed` ends the window with that
+        reason ("delivered", "permanent failure"). Returns the attempts left in the
+        window. An attempt recorded without an admission is stamped now."""
+        now = self._clock()
+        entry = self._entry(key, now)
+        entry["attempts"] += 1
+        if entry["last_attempt_at"] is None:
+            entry["last_attempt_at"] = now
+        entry["closed"] = closed
+        self._store.put_json(key, entry, ttl_s=_ENTRY_TTL_S)
+        return 0 if closed else self._attempts - entry["attempts"]
+
+    def _entry(self, key: str, now: float) -> dict[str, Any]:
+        window = datetime.fromtimestamp(now, UTC).date().isoformat()
+        entry = self._store.get_json(key)
+        if not isinstance(entry, dict) or entry.get("window") != window:
+            return {"window": window, "attempts": 0, "last_attempt_at": None, "closed": None}
+        return entry
+
+
+def open_patient_ledger() -> PatientLedger | None:
+    """The ledger under `STATE_DIR`, or None when cross-run state is off."""
+    store = open_store(_NAMESPACE)
+    return PatientLedger(store) if store is not None else None
@@ -10,10 +10,9 @@ from datetime import date, timedelta
 from pathlib import Path
 from typing import Any, cast
 
-from bs4 import BeautifulSoup
 from soupsieve import SelectorSyntaxError
 
-from kinozal_scraper.generic_pipeline import _selector_css_part
+from kinozal_scraper.generic_pipeline import HTML_PARSERS, _selector_css_part, compile_css
 
 _MACRO_RE = re.compile(r"\{\{(\w+)\}\}")
 
@@ -37,9 +36,10 @@ class ConfigError(ValueError):
 
 def _check_css_selector(source_id: str, where: str, selector: str) -> None:
     """Compile a CSS selector at load time so a typo surfaces before the cron
-    run instead of mid-extraction inside BeautifulSoup (taxonomy D, §IV)."""
+    run instead of mid-extraction inside BeautifulSoup (taxonomy D, §IV). The
+    matcher lands in `compile_css`'s cache, which extraction then reads."""
     try:
-        BeautifulSoup("", "html.parser").select(selector)
+        compile_css(selector)
     except SelectorSyntaxError as exc:
         raise ConfigError(
             f"Source '{source_id}': invalid CSS in {where}: {selector!r}: {exc}"
@@ -122,19 +122,33 @@ def _validate_selector_candidate(source_id: str, where: str, selector: Any) -> N
 def _validate_html_source(source_id: str, source: dict[str, Any]) -> None:
     if not source.get("row_selector"):
         raise ConfigError(f"Source '{source_id}' is HTML-scraped but has no 'row_selector' field")
-    # row_selector is fed verbatim to soup.select(); field selectors carry
-    # an optional @attr suffix, so validate only their CSS part — the exact
-    # string runtime hands to select_one (shared `_selector_css_part`).
+    # row_selector is compiled verbatim; field selectors carry an optional
+    # @attr suffix, so validate only their CSS part — the exact string
+    # `compile_field_selector` compiles (shared `_selector_css_part`).
     _check_css_selector(source_id, "row_selector", source["row_selector"])
     fields = source.get("fields") or {}
     if not isinstance(fields, dict):
         raise ConfigError(f"Source '{source_id}': 'fields' must be a JSON object, got {fields!r}")
+    # Per-row values for `item.raw`, read in the same pass as `fields`.
+    extra_fields = source.get("extra_fields") or {}
+    if not isinstance(extra_fields, dict):
+        raise ConfigError(
+            f"Source '{source_id}': 'extra_fields' must be a JSON object, got {extra_fields!r}"
+        )
     candidates = {
         "dedupe_key": source.get("dedupe_key"),
         **{f"fields.{k}": v for k, v in fields.items()},
+        **{f"extra_fields.{k}": v for k, v in extra_fields.items()},
     }
     for where, selector in candidates.items():
         _validate_selector_candidate(source_id, where, selector)
+    # A misspelt engine would otherwise reach `html_backend` mid-run; an engine that
+    # is merely not installed is a runtime fallback, not a config error.
+    parser = source.get("parser", "html.parser")
+    if parser not in HTML_PARSERS:
+        raise ConfigError(
+            f"Source '{source_id}': 'parser' must be one of {list(HTML_PARSERS)}, got {parser!r}"
+        )
 
 
 def _validate_limit(source_id: str, source: dict[str, Any]) -> None:
@@ -148,6 +162,20 @@ def _validate_limit(source_id: str, source: dict[str, Any]) -> None:
         raise ConfigError(f"Source '{source_id}': 'limit' must be a positive integer, got {limit}")
 
 
+def _validate_incremental_stop_after(source_id: str, source: dict[str, Any]) -> None:
+    # Opt-in: the source asserts its listing puts new rows first. Absent = every row
+    # is read; anything but a positive integer would silently mean "never stop" or
+    # "stop at once", so it fails at load instead.
+    if "incremental_stop_after" not in source:
+        return
+    value = source["incremental_stop_after"]
+    if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+        raise ConfigError(
+            f"Source '{source_id}': 'incremental_stop_after' must be a positive integer, "
+            f"got {value!r}"
+        )
+
+
 def _validate_source(source: Any) -> None:
     if not isinstance(source, dict):
         raise ConfigError("Each source must be a JSON object")
@@ -165,6 +193,7 @@ def _validate_source(source: Any) -> None:
         _validate_html_source(source_id, source)
 
     _validate_limit(source_id, source)
+    _validate_incremental_stop_after(source_id, source)
 
 
 def validate_sources_config(config: Any) -> None:
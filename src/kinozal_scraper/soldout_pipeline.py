@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import os
 from typing import Any
 
 from kinozal_scraper.generic_pipeline import (
@@ -11,7 +12,9 @@ from kinozal_scraper.generic_pipeline import (
     build_notification,
     extract_from_html,
 )
-from kinozal_scraper.http_fetch import fetch_html_patient
+from kinozal_scraper.http_fetch import fetch_html_once, fetch_html_patient
+from kinozal_scraper.http_retry import is_antibot_transient
+from kinozal_scraper.patient_ledger import open_patient_ledger
 from kinozal_scraper.pipeline_config import load_sources_config
 from kinozal_scraper.sheets_storage import Storage
 from kinozal_scraper.telegram_notifier import Notifier
@@ -24,6 +27,10 @@ logger = logging.getLogger(__name__)
 # single-GET fetch actually exist (#276).
 _SOURCE_TYPE = "soldout"
 
+# "1" swaps the in-process patient schedule for the persisted ledger
+# (`patient_ledger.py`): one attempt per invocation, driven by `soldout-patient.yml`.
+_LEDGER_ENV = "SOLDOUT_PATIENT_LEDGER"
+
 
 def run_soldout_pipeline(
     storage: Storage,
@@ -64,12 +71,18 @@ def _run_single_source(
         logger.warning("[%s] no URL configured (set SOLDOUT_URL)", source_id)
         return result
 
-    try:
-        html_text = fetch_html_patient(url)
-    except Exception as exc:  # noqa: BLE001 — per-source isolation: logged + surfaced via result.errors
-        logger.exception("[%s] fetch failed: %s", source_id, exc)
-        result.errors.append(f"fetch failed: {exc}")
-        return result
+    if os.environ.get(_LEDGER_ENV, "").strip() == "1":
+        fetched = _fetch_by_ledger(source_id, url, result)
+        if fetched is None:
+            return result
+        html_text = fetched
+    else:
+        try:
+            html_text = fetch_html_patient(url)
+        except Exception as exc:  # noqa: BLE001 — per-source isolation: logged + surfaced via result.errors
+            logger.exception("[%s] fetch failed: %s", source_id, exc)
+            result.errors.append(f"fetch failed: {exc}")
+            return result
 
     extracted = extract_from_html(html_text, source)
     if not extracted.ok:
@@ -105,6 +118,44 @@ def _run_single_source(
     return result
 
 
+def _fetch_by_ledger(source_id: str, url: str, result: PipelineResult) -> str | None:
+    """At most one attempt, if the ledger says one is due; None when there is no page.
+
+    Mirrors the in-process policy's outcomes: a transient failure with attempts left
+    is a warning (the schedule is not done, nothing has failed yet), the last one or
+    a non-transient failure is the error the patient policy would have raised, and
+    an invocation with no attempt due is a quiet no-op."""
+    ledger = open_patient_ledger()
+    if ledger is None:
+        message = f"{_LEDGER_ENV}=1 needs STATE_DIR: the attempt ledger has nowhere to live"
+        logger.error("[%s] %s", source_id, message)
+        result.errors.append(message)
+        return None
+    admission = ledger.admit(source_id)
+    logger.info("[%s] patient ledger: %s", source_id, admission.reason)
+    if admission.attempt is None:
+        return None
+    try:
+        html_text = fetch_html_once(url)
+    except Exception as exc:  # noqa: BLE001 — per-source isolation: logged + surfaced via result
+        if not is_antibot_transient(exc):
+            ledger.record(source_id, closed="permanent failure")
+            logger.exception("[%s] fetch failed: %s", source_id, exc)
+            result.errors.append(f"fetch failed: {exc}")
+            return None
+        left = ledger.record(source_id)
+        if left:
+            message = f"attempt {admission.attempt} failed, {left} left in today's window: {exc}"
+            logger.warning("[%s] %s", source_id, message)
+            result.warnings.append(message)
+            return None
+        logger.exception("[%s] fetch failed on the window's last attempt: %s", source_id, exc)
+        result.errors.append(f"fetch failed after {admission.attempt} attempts: {exc}")
+        return None
+    ledger.record(source_id, closed="fetched")
+    return html_text
+
+
 if __name__ == "__main__":
     import json
     import os
@@ -129,7 +180,10 @@ if __name__ == "__main__":
     prod_notifier = TelegramNotifier(bot_token=bot_token, chat_id=chat_id)
     prod_results = run_soldout_pipeline(prod_storage, prod_notifier)
 
-    from kinozal_scraper.alerting import report_failures
+    from kinozal_scraper.alerting import publish_run_summary, report_failures
+
+    # Before the exit-code branch, as in the GitHub pipelines (#459).
+    publish_run_summary(prod_results)
 
     if report_failures(prod_notifier, prod_results):
         sys.exit(1)
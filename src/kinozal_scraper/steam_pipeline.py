@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import Future
 from typing import Any
 
 import requests
@@ -15,7 +16,11 @@ from kinozal_scraper.generic_pipeline import (
     build_notification,
     extract_from_json,
 )
-from kinozal_scraper.http_retry import retry_api_http
+from kinozal_scraper.host_governor import GOVERNOR
+from kinozal_scraper.http_fetch import prefetch
+from kinozal_scraper.http_observability import observe_http
+from kinozal_scraper.http_retry import raise_for_api_status, retry_api_http
+from kinozal_scraper.http_transport import exchange
 from kinozal_scraper.pipeline_config import load_sources_config
 from kinozal_scraper.sheets_storage import Storage
 from kinozal_scraper.telegram_notifier import Notifier
@@ -37,8 +42,11 @@ def _fetch_charts(url: str) -> dict[str, Any]:
     Its failure kills the whole source for the run, so a blip here is the most
     expensive of the three GETs — and the cheapest to survive.
     """
-    resp = requests.get(url, timeout=30)
-    resp.raise_for_status()
+    with GOVERNOR.guard(url), observe_http(url) as call:
+        resp = call.response = exchange(
+            "GET", url, lambda: requests.get(url, timeout=30), client="requests"
+        )
+        raise_for_api_status(resp)
     result: dict[str, Any] = resp.json()
     return result
 
@@ -53,17 +61,23 @@ def _fetch_appdetails(appid: int) -> dict[str, Any] | None:
     is stored as delivered, so dedupe by `appid` keeps it out of every later run
     (root cause of the irreversibility tracked in #437). Worst case with the retry
     is `limit` × ~7 s (≈70 s at the default `STEAM_TOP_LIMIT`), and only while
-    charts stays up — a full Steam outage is cut short by `_fetch_charts`.
+    charts stays up — a full Steam outage is cut short by `_fetch_charts`. A Store-
+    only outage is cut short by the host governor: once the circuit for the Store
+    host opens, the remaining appids fail fast to the placeholder.
 
     `success: false` on a 200 is a **different** route to the same placeholder and
     is not covered here — see the accepted gap in `coverage-gaps.md`.
     """
-    resp = requests.get(
-        _APPDETAILS_URL,
-        params={"appids": str(appid), "filters": "basic"},
-        timeout=15,
-    )
-    resp.raise_for_status()
+    with GOVERNOR.guard(_APPDETAILS_URL), observe_http(_APPDETAILS_URL) as call:
+        params = {"appids": str(appid), "filters": "basic"}
+        resp = call.response = exchange(
+            "GET",
+            _APPDETAILS_URL,
+            lambda: requests.get(_APPDETAILS_URL, params=params, timeout=15),
+            client="requests",
+            params=params,
+        )
+        raise_for_api_status(resp)
     payload = resp.json()
     entry = payload.get(str(appid)) or {}
     if not entry.get("success"):
@@ -72,8 +86,10 @@ def _fetch_appdetails(appid: int) -> dict[str, Any] | None:
     return data
 
 
-def _resolve_name(appid: int, source_id: str) -> tuple[str, str]:
-    """Resolve `(name, short_description)` for an appid.
+def _resolve_name(
+    appid: int, source_id: str, details: Future[dict[str, Any] | None]
+) -> tuple[str, str]:
+    """Resolve `(name, short_description)` for an appid from its appdetails fetch.
 
     1. `appdetails?filters=basic` — full payload (name + short_description).
     2. `f"⚠️ Game #{appid}"` — last-resort placeholder. The ⚠️ marker (same
@@ -90,13 +106,13 @@ def _resolve_name(appid: int, source_id: str) -> tuple[str, str]:
     never dropped from the notification stream.
     """
     try:
-        details = _fetch_appdetails(appid)
+        data = details.result()
     except Exception as exc:  # noqa: BLE001 — appdetails failure degrades to None, item still notified
         logger.warning("[%s] appdetails fetch failed for %s: %s", source_id, appid, exc)
-        details = None
-    if details and details.get("name"):
-        name: str = details["name"]
-        return name, details.get("short_description", "")
+        data = None
+    if data and data.get("name"):
+        name: str = data["name"]
+        return name, data.get("short_description", "")
 
     placeholder = f"⚠️ Game #{appid}"
     logger.warning("[%s] no name for %s — sending as '%s'", source_id, appid, placeholder)
@@ -113,14 +129,21 @@ def _enrich_with_appdetails(
     — that produced silent gaps in Telegram for entire chart positions during
     Steam flaps. Now each record reaches the notifier with at minimum a
     placeholder name (see `_resolve_name` for the fallback chain).
+
+    The appdetails GETs overlap on `prefetch`'s workers, held to the governor's
+    per-host cap and the Store's token bucket; names are resolved in chart order.
     """
-    enriched: list[dict[str, Any]] = []
+    with_appid: list[dict[str, Any]] = []
     for rec in records:
-        appid = rec.get("appid")
-        if appid is None:
+        if rec.get("appid") is None:
             logger.warning("[%s] record without appid: %s", source_id, rec)
             continue
-        name, description = _resolve_name(int(appid), source_id)
+        with_appid.append(rec)
+    appids = [int(rec["appid"]) for rec in with_appid]
+    pages = prefetch(_fetch_appdetails, appids)
+    enriched: list[dict[str, Any]] = []
+    for rec, appid, page in zip(with_appid, appids, pages, strict=True):
+        name, description = _resolve_name(appid, source_id, page)
         rec["name"] = name
         rec["short_description"] = description
         rec["store_url"] = f"https://store.steampowered.com/app/{appid}"
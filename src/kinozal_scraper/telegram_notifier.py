@@ -1,4 +1,11 @@
-"""Notifier Protocol: Telegram delivery and InMemoryNotifier."""
+"""Notifier Protocol: Telegram delivery and InMemoryNotifier.
+
+`TelegramNotifier.send_items` downloads posters ahead of the sends on the shared
+`http_fetch.prefetch` workers: up to `poster_prefetch` of the batch's next posters
+are in flight or waiting in memory while the current message is sent, so a batch
+costs the slowest posters rather than the sum of them. The window is what bounds
+memory; `0` downloads each poster inline, once, just before its send.
+"""
 
 from __future__ import annotations
 
@@ -6,18 +13,22 @@ import contextlib
 import logging
 import time
 from collections.abc import Callable
-from typing import Protocol, runtime_checkable
+from concurrent.futures import Future
+from typing import Any, Protocol, runtime_checkable
 
 import requests
 
 from kinozal_scraper.generic_pipeline import Notification
-from kinozal_scraper.http_fetch import fetch_bytes
+from kinozal_scraper.http_fetch import fetch_bytes, prefetch
+from kinozal_scraper.http_transport import exchange
 
 logger = logging.getLogger(__name__)
 
 _TG_TEXT_LIMIT = 4096
 _TG_CAPTION_LIMIT = 1024
 _TRUNCATION_SUFFIX = "\n… (truncated)"
+# Posters downloaded ahead of the send, and so the most held in memory at once.
+_POSTER_PREFETCH = 4
 
 
 def _truncate(text: str, limit: int) -> str:
@@ -26,6 +37,12 @@ def _truncate(text: str, limit: int) -> str:
     return text[: limit - len(_TRUNCATION_SUFFIX)] + _TRUNCATION_SUFFIX
 
 
+def _wants_poster(text: str, image_url: str) -> bool:
+    # Caption limit (1024) is much tighter than text limit (4096); if the
+    # message wouldn't fit as a caption, skip sendPhoto entirely.
+    return bool(image_url) and len(text) <= _TG_CAPTION_LIMIT
+
+
 @runtime_checkable
 class Notifier(Protocol):
     def send_items(
@@ -47,6 +64,7 @@ class TelegramNotifier:
         http_timeout: float = 30.0,
         session: requests.Session | None = None,
         image_fetcher: Callable[[str], bytes] = fetch_bytes,
+        poster_prefetch: int = _POSTER_PREFETCH,
     ) -> None:
         self._url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
         self._photo_url = f"https://api.telegram.org/bot{bot_token}/sendPhoto"
@@ -57,6 +75,7 @@ class TelegramNotifier:
         self._http_timeout = http_timeout
         self._session = session or requests.Session()
         self._image_fetcher = image_fetcher
+        self._poster_prefetch = poster_prefetch
 
     def send_text(self, text: str) -> bool:
         return self._send_one(text)
@@ -66,8 +85,11 @@ class TelegramNotifier:
     ) -> tuple[list[Notification], list[Notification]]:
         sent: list[Notification] = []
         failed: list[Notification] = []
+        wanted = [n.image_url for n in notifications if _wants_poster(n.text, n.image_url)]
+        posters = prefetch(self._image_fetcher, wanted, ahead=self._poster_prefetch)
         for i, notif in enumerate(notifications):
-            if self._send_one(notif.text, notif.image_url, notif.id):
+            poster = next(posters) if _wants_poster(notif.text, notif.image_url) else None
+            if self._send_one(notif.text, notif.image_url, notif.id, poster=poster):
                 sent.append(notif)
             else:
                 failed.append(notif)
@@ -75,10 +97,15 @@ class TelegramNotifier:
                 time.sleep(self._inter_message_delay)
         return sent, failed
 
-    def _send_one(self, text: str, image_url: str = "", notif_id: str = "") -> bool:
-        # Caption limit (1024) is much tighter than text limit (4096); if the
-        # message wouldn't fit as a caption, skip sendPhoto entirely.
-        use_caption = bool(image_url) and len(text) <= _TG_CAPTION_LIMIT
+    def _send_one(
+        self,
+        text: str,
+        image_url: str = "",
+        notif_id: str = "",
+        *,
+        poster: Future[bytes] | None = None,
+    ) -> bool:
+        use_caption = _wants_poster(text, image_url)
         message_text = _truncate(text, _TG_TEXT_LIMIT)
 
         # Download the poster ONCE, before the retry loop (#225): sendPhoto-by-URL
@@ -87,10 +114,14 @@ class TelegramNotifier:
         # as a multipart file. Fetching inside the loop would re-download on every
         # 429/5xx retry. A failed download degrades to text WITH a visible WARNING
         # (§IV: the dropped poster reaches the operator as a marker, not silently).
+        # `send_items` hands in the download it started ahead of this send; its
+        # failure surfaces here, with the same marker as an inline fetch.
         image_bytes: bytes | None = None
         if use_caption:
             try:
-                image_bytes = self._image_fetcher(image_url)
+                image_bytes = (
+                    poster.result() if poster is not None else self._image_fetcher(image_url)
+                )
             except Exception as exc:  # noqa: BLE001 — any fetch failure degrades to text, not crash
                 logger.warning(
                     "[telegram] poster dropped (image fetch failed) for %s: %s: %s",
@@ -105,7 +136,7 @@ class TelegramNotifier:
                 if image_bytes is not None:  # ⟺ use_caption stayed True (poster downloaded)
                     # `bytes` (not a one-shot stream): requests re-encodes the body
                     # on each POST, so the same poster survives a 429 retry (#225).
-                    resp = self._session.post(
+                    resp = self._post(
                         self._photo_url,
                         data={
                             "chat_id": self._chat_id,
@@ -113,7 +144,6 @@ class TelegramNotifier:
                             "parse_mode": "HTML",
                         },
                         files={"photo": ("poster.jpg", image_bytes)},
-                        timeout=self._http_timeout,
                     )
                     if resp.status_code == 400:
                         # fallback: broken image or caption issue → plain text.
@@ -122,24 +152,22 @@ class TelegramNotifier:
                             notif_id,
                             image_url,
                         )
-                        resp = self._session.post(
+                        resp = self._post(
                             self._url,
                             json={
                                 "chat_id": self._chat_id,
                                 "text": message_text,
                                 "parse_mode": "HTML",
                             },
-                            timeout=self._http_timeout,
                         )
                 else:
-                    resp = self._session.post(
+                    resp = self._post(
                         self._url,
                         json={
                             "chat_id": self._chat_id,
                             "text": message_text,
                             "parse_mode": "HTML",
                         },
-                        timeout=self._http_timeout,
                     )
             except requests.RequestException:
                 return False
@@ -162,6 +190,17 @@ class TelegramNotifier:
             time.sleep(1)
         return False
 
+    def _post(self, url: str, **kwargs: Any) -> requests.Response:
+        # Through `http_transport`, which keys a recorded send on the masked URL
+        # alone: the bot token never reaches a cassette.
+        resp: requests.Response = exchange(
+            "POST",
+            url,
+            lambda: self._session.post(url, timeout=self._http_timeout, **kwargs),
+            client="requests",
+        )
+        return resp
+
 
 class InMemoryNotifier:
     """Test double. Control failures with fail_ids (send_items) / fail_text (send_text)."""
@@ -20,6 +20,9 @@ from typing import Any
 
 import requests
 
+from kinozal_scraper.host_governor import GOVERNOR
+from kinozal_scraper.http_observability import observe_http
+from kinozal_scraper.http_transport import exchange
 from kinozal_scraper.trailer_strategy import FilmProfile, TrailerPick
 
 _YOUTUBE = "YouTube"
@@ -105,8 +108,16 @@ class TmdbClient:
         self.session.headers.update({"Authorization": f"Bearer {token}"})
 
     def _get(self, path: str, params: dict[str, Any]) -> dict[str, Any]:
-        resp = self.session.get(f"{_TMDB_API}{path}", params=params, timeout=15)
-        resp.raise_for_status()
+        url = f"{_TMDB_API}{path}"
+        with GOVERNOR.guard(url), observe_http(url) as call:
+            resp = call.response = exchange(
+                "GET",
+                url,
+                lambda: self.session.get(url, params=params, timeout=15),
+                client="requests",
+                params=params,
+            )
+            resp.raise_for_status()
         data: dict[str, Any] = resp.json()
         return data
 
@@ -9,14 +9,23 @@ from __future__ import annotations
 import html
 import logging
 import os
+from collections.abc import Callable
 from typing import Any
 
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 
-from kinozal_scraper.trailer_strategy import Candidate, FilmProfile
+from kinozal_scraper.trailer_strategy import Candidate, FilmProfile, HeuristicStrategy
+from kinozal_scraper.youtube_quota import SEARCH_LIST_UNITS, QuotaLedger
 
 logger = logging.getLogger(__name__)
 
+# Results per `search.list` query. The union pool lists the RU query's results first,
+# so the first `_MAX_RESULTS` of a recorded pool are what the RU query alone returned.
+_MAX_RESULTS = 5
+# `HeuristicStrategy`'s unique-top-rank confidence: the pick a lazy search settles for.
+_CONFIDENT = 0.9
+
 
 class TrailerRetrievalError(RuntimeError):
     """No union branch succeeded, so retrieval did not occur (#383).
@@ -67,6 +76,13 @@ def _is_quota_error(exc: BaseException) -> bool:
     return False
 
 
+def _is_charged(exc: BaseException) -> bool:
+    """Whether a failed query still cost quota: the API answered it with an error other
+    than a quota refusal. A refused query and a transport failure never reached the
+    quota counter, so the ledger must not bill them."""
+    return isinstance(exc, HttpError) and not _is_quota_error(exc)
+
+
 def _search_one(client: Any, query: str) -> list[Candidate]:
     """One YouTube query → candidates (only `youtube#video`); snippet fields map to
     `Candidate`. No year/title filter: this is pure retrieval; selection
@@ -78,7 +94,9 @@ def _search_one(client: Any, query: str) -> list[Candidate]:
     `&#39;` produces token `39`, `&amp;` produces `amp`, and the phrase breaks (#412)."""
     response = (
         client.search()
-        .list(q=query, part="id,snippet", maxResults=5, type="video", videoDuration="short")
+        .list(
+            q=query, part="id,snippet", maxResults=_MAX_RESULTS, type="video", videoDuration="short"
+        )
         .execute()
     )
     out: list[Candidate] = []
@@ -98,7 +116,23 @@ def _search_one(client: Any, query: str) -> list[Candidate]:
     return out
 
 
-def search_candidates(client: Any, profile: FilmProfile) -> list[Candidate]:
+def _query_titles(profile: FilmProfile) -> list[str]:
+    titles = [profile.ru_title]
+    if profile.original_title and profile.original_title != profile.ru_title:
+        titles.append(profile.original_title)
+    return titles
+
+
+def _ru_branch_suffices(profile: FilmProfile, pool: list[Candidate]) -> bool:
+    """Whether the RU query's pool alone already yields a unique confident pick, so a
+    lazy search skips the original-title query. Shared with the eval harness's
+    `--lazy-original` scorecard, which replays this decision over recorded pools."""
+    return HeuristicStrategy().pick(profile, pool).confidence >= _CONFIDENT
+
+
+def search_candidates(
+    client: Any, profile: FilmProfile, *, lazy_original: bool = False
+) -> list[Candidate]:
     """Trailer candidate pool = **union** of RU and original-title queries, deduplicated
     by `video_id` (#140). An RU trailer must enter the pool when available (#315:
     retrieval breadth, not selection bias); selection (#141), not retrieval, picks language.
@@ -109,14 +143,29 @@ def search_candidates(client: Any, profile: FilmProfile) -> list[Candidate]:
     An empty list means queries succeeded and YouTube returned nothing; it must not absorb
     429 or infrastructure failure becomes an honest selection miss (74 lines in run
     2026-07-25). `client` is injected googleapiclient YouTube resource so the `--record`
-    harness reuses this retrieval (§II)."""
+    harness reuses this retrieval (§II).
+
+    `lazy_original` runs the RU query first and issues the original-title query only
+    when `HeuristicStrategy` finds no unique confident (0.9) pick in the RU results
+    (`_ru_branch_suffices`). A failed RU branch always falls through to the original."""
+    return _search_pool(client, profile, lazy_original=lazy_original)
+
+
+def _search_pool(
+    client: Any,
+    profile: FilmProfile,
+    *,
+    lazy_original: bool,
+    charge: Callable[[int], None] | None = None,
+) -> list[Candidate]:
+    """`search_candidates`, reporting to `charge` — once, raised or not, and only when
+    nonzero — how many of its `search.list` queries counted against quota (`_is_charged`)."""
     year = profile.year
-    titles = [profile.ru_title]
-    if profile.original_title and profile.original_title != profile.ru_title:
-        titles.append(profile.original_title)
+    titles = _query_titles(profile)
     seen: set[str] = set()
     pool: list[Candidate] = []
     failed = 0
+    charged = 0
     last_exc: Exception | None = None
     quota_seen = False
     queries = [f"{t} {year} trailer" if year else f"{t} trailer" for t in titles]
@@ -126,20 +175,31 @@ def search_candidates(client: Any, profile: FilmProfile) -> list[Candidate]:
     # this log, a new service literal in the second segment (`RUS`, `Multi`, `Update 5`)
     # would become an “original title” query indistinguishable from a real trailer miss.
     logger.info("trailer retrieval queries for %r: %s", profile.ru_title, queries)
-    for query in queries:
-        try:
-            candidates = _search_one(client, query)
-        except Exception as exc:  # noqa: BLE001 — best-effort breadth: one union branch must not sink the pool (§IV); the counter below catches universal failure
-            logger.warning("trailer retrieval branch failed for %r: %s", query, exc)
-            failed += 1
-            last_exc = exc
-            quota_seen = quota_seen or _is_quota_error(exc)
-            continue
-        for candidate in candidates:
-            if candidate.video_id in seen:
+    try:
+        for issued, query in enumerate(queries):
+            if lazy_original and issued == 1 and not failed and _ru_branch_suffices(profile, pool):
+                logger.info(
+                    "original-title query skipped for %r: RU pick is confident", profile.ru_title
+                )
+                return pool
+            try:
+                candidates = _search_one(client, query)
+            except Exception as exc:  # noqa: BLE001 — best-effort breadth: one union branch must not sink the pool (§IV); the counter below catches universal failure
+                logger.warning("trailer retrieval branch failed for %r: %s", query, exc)
+                failed += 1
+                charged += 1 if _is_charged(exc) else 0
+                last_exc = exc
+                quota_seen = quota_seen or _is_quota_error(exc)
                 continue
-            seen.add(candidate.video_id)
-            pool.append(candidate)
+            charged += 1
+            for candidate in candidates:
+                if candidate.video_id in seen:
+                    continue
+                seen.add(candidate.video_id)
+                pool.append(candidate)
+    finally:
+        if charge is not None and charged:
+            charge(charged)
     # `titles` is non-empty by construction (it always contains ru_title), so
     # `failed == len(titles)` cannot run after zero attempts; an `attempted > 0`
     # safeguard would be dead code (precedent #256).
@@ -156,9 +216,26 @@ def search_candidates(client: Any, profile: FilmProfile) -> list[Candidate]:
 
 
 class Youtube:
-    def __init__(self) -> None:
+    def __init__(self, ledger: QuotaLedger | None = None, *, lazy_original: bool = False) -> None:
         self.youtube = build("youtube", "v3", developerKey=os.environ["API_KEY"])
+        self.ledger = ledger
+        self.lazy_original = lazy_original
 
     def search_candidates(self, profile: FilmProfile) -> list[Candidate]:
-        """Candidate pool for `profile` through shared `search_candidates` (#140)."""
-        return search_candidates(self.youtube, profile)
+        """Candidate pool for `profile` through shared `search_candidates` (#140).
+
+        With a `ledger`, every query the API answered is counted — a quota refusal or a
+        transport failure is not — and a quota refusal marks the Pacific day exhausted."""
+        if self.ledger is None:
+            return search_candidates(self.youtube, profile, lazy_original=self.lazy_original)
+        ledger = self.ledger
+        try:
+            return _search_pool(
+                self.youtube,
+                profile,
+                lazy_original=self.lazy_original,
+                charge=lambda queries: ledger.spend(SEARCH_LIST_UNITS * queries),
+            )
+        except YoutubeQuotaExhausted:
+            ledger.exhaust()
+            raise
@@ -0,0 +1,92 @@
+"""Persisted YouTube quota ledger: units spent per Pacific day, across runs.
+
+The kinozal run learns that the daily quota is gone only by being refused (#384), and
+every run of a day starts as if nothing were spent. This ledger keeps the count in
+the cross-run `local_store`: `Youtube` records every `search.list` it issues (100
+units each, one or two per film depending on `ru_title == original_title`), and a
+quota refusal closes the day outright. YouTube resets the quota at midnight Pacific
+time, so a window is one `America/Los_Angeles` day, not a UTC one.
+
+It is accounting, not a cap (`_notify_and_persist` rejects a precomputed budget). The
+numbers are what this project actually spent, so the run summary can say what is left;
+the API stays the authority. A refusal recorded earlier today stops a later run before
+its first search, since the API has already named the boundary; a count alone never
+does. Quota spent by anything that does not go through `Youtube` (the eval harness's
+`--record`) is not seen here, which is why.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from kinozal_scraper.local_store import LocalStore, open_store
+
+_NAMESPACE = "youtube_quota"
+# A day's entry is read until Pacific midnight; two days cover any UTC run time.
+_ENTRY_TTL_S = 2 * 24 * 3600.0
+_PACIFIC = ZoneInfo("America/Los_Angeles")
+
+SEARCH_LIST_UNITS = 100
+# The default project allocation: the 100 `search.list` calls measured 2026-07-26.
+DAILY_UNITS = 10_000
+
+
+class QuotaLedger:
+    """Units spent in the current Pacific day, in one `local_store` namespace."""
+
+    def __init__(
+        self,
+        store: LocalStore,
+        *,
+        daily_units: int = DAILY_UNITS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._store = store
+        self._daily_units = daily_units
+        self._clock = clock
+
+    def spend(self, units: int) -> None:
+        day, entry = self._entry()
+        entry["spent"] += units
+        self._store.put_json(day, entry, ttl_s=_ENTRY_TTL_S)
+
+    def exhaust(self) -> None:
+        """The API refused on quota grounds: nothing is left today, whatever we counted."""
+        day, entry = self._entry()
+        entry["exhausted"] = True
+        self._store.put_json(day, entry, ttl_s=_ENTRY_TTL_S)
+
+    def exhausted(self) -> bool:
+        """Whether the API has refused on quota grounds today."""
+        return bool(self._entry()[1]["exhausted"])
+
+    def remaining(self) -> int:
+        _, entry = self._entry()
+        if entry["exhausted"]:
+            return 0
+        return max(0, self._daily_units - int(entry["spent"]))
+
+    def summary_line(self) -> str:
+        day, entry = self._entry()
+        state = " exhausted" if entry["exhausted"] else ""
+        return (
+            f"youtube_quota: day={day} spent={entry['spent']} "
+            f"remaining={self.remaining()}/{self._daily_units}{state}"
+        )
+
+    def _entry(self) -> tuple[str, dict[str, Any]]:
+        day = datetime.fromtimestamp(self._clock(), _PACIFIC).date().isoformat()
+        entry = self._store.get_json(day)
+        if not isinstance(entry, dict):
+            return day, {"spent": 0, "exhausted": False}
+        return day, entry
+
+
+def open_quota_ledger() -> QuotaLedger | None:
+    """The ledger under `STATE_DIR`, or None when cross-run state is off."""
+    store = open_store(_NAMESPACE)
+    return QuotaLedger(store) if store is not None else None
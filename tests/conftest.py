@@ -1,12 +1,20 @@
 """Shared pytest fixtures for the whole suite.
 
-Today it holds one autouse fixture: ambient `KINOZAL_USERNAME`/`KINOZAL_PASSWORD`
-are cleared so a developer's local credentials can never turn a fetch-failure
-test into a real network login.
+Autouse fixtures: ambient `KINOZAL_USERNAME`/`KINOZAL_PASSWORD` are cleared so a
+developer's local credentials can never turn a fetch-failure test into a real
+network login; ambient `STATE_DIR` is cleared (with the process-wide caches reset)
+so no test reads or writes a developer's cross-run state; an ambient
+`HTTP_TRANSPORT_MODE` is cleared so no test records to or replays from a cassette
+unasked; and the shared host
+governor is reset so one test's failures never open a circuit for the next.
 """
 
 import pytest
 
+from kinozal_scraper import http_fetch, http_transport, kinozal_auth, kinozal_pipeline
+from kinozal_scraper.host_governor import GOVERNOR
+from kinozal_scraper.http_observability import HTTP_CALLS
+
 
 @pytest.fixture(autouse=True)
 def _clear_kinozal_credentials(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -21,3 +29,42 @@ def _clear_kinozal_credentials(monkeypatch: pytest.MonkeyPatch) -> None:
     """
     monkeypatch.delenv("KINOZAL_USERNAME", raising=False)
     monkeypatch.delenv("KINOZAL_PASSWORD", raising=False)
+
+
+@pytest.fixture(autouse=True)
+def _isolate_cross_run_state(monkeypatch: pytest.MonkeyPatch) -> None:
+    """No test may see state persisted by a previous run or by another test.
+
+    `STATE_DIR` switches on the `local_store` caches; the validator and kinozal
+    details/trailer/latency stores are opened once per process and their counters are process-wide,
+    so all of them are reset here. The saved mirror session also needs
+    `KINOZAL_SESSION_KEY`, which is cleared with it.
+    Tests that exercise a cache patch a store in explicitly."""
+    monkeypatch.delenv("STATE_DIR", raising=False)
+    monkeypatch.delenv(kinozal_auth.SESSION_KEY_ENV, raising=False)
+    kinozal_auth._session_persistence.cache_clear()
+    http_fetch._validator_store.cache_clear()
+    http_fetch.CACHE_STATS.clear()
+    kinozal_pipeline._details_store.cache_clear()
+    kinozal_pipeline.DETAILS_CACHE_STATS.clear()
+    kinozal_pipeline._trailer_store.cache_clear()
+    kinozal_pipeline.TRAILER_CACHE_STATS.clear()
+    kinozal_pipeline._latency_store.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def _live_transport(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Every test talks to its patched transports, never to a cassette.
+
+    The mode is read once per process; tests that exercise record/replay set the
+    environment and clear the cache themselves."""
+    monkeypatch.delenv(http_transport.MODE_ENV, raising=False)
+    http_transport._active.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset_host_governor() -> None:
+    """Circuit breakers and token buckets are per process; a test starts closed and full.
+    The latency samples behind the summary's `http_latency` lines are reset with them."""
+    GOVERNOR.reset()
+    HTTP_CALLS.reset()
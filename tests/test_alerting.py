@@ -15,7 +15,7 @@ from types import SimpleNamespace
 
 import pytest
 
-from kinozal_scraper import alerting
+from kinozal_scraper import alerting, http_fetch
 from kinozal_scraper.alerting import (
     format_metrics_line,
     format_pipeline_failures,
@@ -302,3 +302,25 @@ class TestPublishRunSummary:
         written = target.read_text(encoding="utf-8")
         assert "steam" not in written
         assert "github_trending" in written
+
+    def test_transport_cache_counters_follow_the_source_lines(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Validator-cache counters belong to the run, not to a source: one line after
+        # the per-source ones, and none at all when the run made no measured fetch.
+        target = tmp_path / "summary.md"
+        monkeypatch.setenv("GITHUB_STEP_SUMMARY", str(target))
+        http_fetch.CACHE_STATS.update({"hit": 2, "miss": 1, "304": 2})
+        publish_run_summary([_measured("github_trending", fetched=25)])
+        lines = target.read_text(encoding="utf-8").splitlines()
+        assert lines[-2] == "http_cache: hit=2 miss=1 304=2"
+
+    def test_pipeline_counters_come_after_the_transport_lines(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        target = tmp_path / "summary.md"
+        monkeypatch.setenv("GITHUB_STEP_SUMMARY", str(target))
+        http_fetch.CACHE_STATS.update({"hit": 1, "miss": 0, "304": 1})
+        publish_run_summary([_ok("kinozal_movies")], extra_lines=["kinozal_details_cache: hit=1"])
+        lines = target.read_text(encoding="utf-8").splitlines()
+        assert lines[-3:-1] == ["http_cache: hit=1 miss=0 304=1", "kinozal_details_cache: hit=1"]
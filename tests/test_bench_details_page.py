@@ -0,0 +1,22 @@
+"""The details-page micro-benchmark runs over a captured page and reports each strategy."""
+
+from __future__ import annotations
+
+import importlib
+from pathlib import Path
+
+import pytest
+
+
+def test_reports_every_strategy_against_the_per_field_baseline(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    bench = importlib.import_module("scripts.bench_details_page")
+    fixture = tmp_path / "details.html"
+    fixture.write_text("<b>Жанр:</b> драма<br>", encoding="utf-8")
+
+    bench.main([str(fixture), "--rounds", "1"])
+
+    lines = capsys.readouterr().out.splitlines()
+    assert [line.split()[0] for line in lines][:2] == ["per-field", "once/html.parser"]
+    assert lines[0].endswith("x1.0")
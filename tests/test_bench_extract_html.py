@@ -0,0 +1,29 @@
+"""The extraction benchmark reads a captured page on each installed engine, reference first."""
+
+from __future__ import annotations
+
+import importlib
+from pathlib import Path
+
+import pytest
+
+_TRENDING = Path(__file__).parent / "fixtures" / "github_trending" / "trending_daily.html"
+
+
+def test_reports_rows_per_second_against_the_reference(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    bench = importlib.import_module("scripts.bench_extract_html")
+
+    bench.main([str(_TRENDING), "--rounds", "1"])
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].split()[0] == "html.parser"
+    assert lines[0].endswith("rows/s  x1.0")
+
+
+def test_unknown_source_is_a_usage_error() -> None:
+    bench = importlib.import_module("scripts.bench_extract_html")
+
+    with pytest.raises(SystemExit):
+        bench.main([str(_TRENDING), "--source", "nope"])
@@ -24,6 +24,7 @@ from scripts.eval_trailers import (
     default_strategy,
     evaluate,
     evaluate_delivery,
+    evaluate_lazy_delivery,
     evaluate_tmdb,
     load_golden_set,
     main,
@@ -578,6 +579,20 @@ class TestTrapField(unittest.TestCase):
             load_golden_set(self._write([self._case(trap=[1])]))
 
 
+# ── lazy original-title query: replayed over the recorded pools ───────────────
+
+
+def test_lazy_original_keeps_every_delivery_outcome_and_saves_queries() -> None:
+    # Measured when `lazy_original` landed: no case moves against the delivery
+    # scorecard, and 14 of 60 `search.list` queries are skipped. A pool change that
+    # makes the lazy search lose a hit turns this red before anyone enables it.
+    cases = load_golden_set(GOLDEN_PATH)
+    lazy_rows, _, union_queries, lazy_queries = evaluate_lazy_delivery(cases)
+    delivery_rows, _ = evaluate_delivery(cases)
+    assert [o for _, _, o in lazy_rows] == [o for _, _, o in delivery_rows]
+    assert lazy_queries < union_queries
+
+
 # ── #138 red baseline: known-gap guard ────────────────────────────────────────
 
 
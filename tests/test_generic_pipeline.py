@@ -1,23 +1,37 @@
 """Tests for `generic_pipeline.py` — the declarative pipeline core.
 
-Covers JSON and HTML extraction with their quality failures, `PipelineResult.ok`,
-and notification rendering (raw-field fallbacks, newline collapse, escaped
-title/trailer links).
+Covers JSON and HTML extraction with their quality failures, the HTML backends'
+parity over every captured fixture, `PipelineResult.ok`, and notification rendering
+(raw-field fallbacks, newline collapse, escaped title/trailer links).
 """
 
+import importlib.util
 import unittest
+import unittest.mock
+from pathlib import Path
 
 from kinozal_scraper.generic_pipeline import (
+    HTML_PARSERS,
     NormalizedItem,
     PipelineResult,
+    SoupBackend,
+    _row_tag,
     _selector_css_part,
     bounded_evidence,
     build_notification,
+    compile_css,
+    compile_field_selector,
     extract_from_html,
     extract_from_json,
+    extract_html_page,
+    extraction_plan,
+    html_backend,
     select_new_items,
     without_source_prefix,
 )
+from kinozal_scraper.pipeline_config import load_sources_config, validate_sources_config
+
+_FIXTURES = Path(__file__).parent / "fixtures"
 
 _JSON_CONFIG = {
     "id": "test_src",
@@ -131,10 +145,17 @@ class TestExtractFromJson(unittest.TestCase):
         self.assertEqual(len(result.items), 1)
         self.assertEqual(len(result.errors), 4)
 
-    def test_raw_preserved(self) -> None:
-        records = [{"id": "1", "name": "T", "extra": "data"}]
-        result = extract_from_json(records, _JSON_CONFIG)
-        self.assertEqual(result.items[0].raw["extra"], "data")
+    def test_raw_keeps_only_the_keys_the_source_reads(self) -> None:
+        config = {
+            **_JSON_CONFIG,
+            "message_template": "{title} {language}",
+            "enrich": {"field": "summary_ru", "prompt": "$title ${topic}"},
+        }
+        records = [{"id": "1", "name": "T", "language": "Go", "topic": "db", "owner": {"id": 7}}]
+        result = extract_from_json(records, config)
+        self.assertEqual(
+            result.items[0].raw, {"id": "1", "name": "T", "language": "Go", "topic": "db"}
+        )
 
 
 class TestExtractFromHtml(unittest.TestCase):
@@ -182,6 +203,121 @@ class TestExtractFromHtml(unittest.TestCase):
         self.assertEqual(result.items[0].url, "https://x.com")
 
 
+def _extracted(html: str, source: dict, parser: str) -> tuple[list[tuple[str, ...]], list[str]]:
+    result = extract_from_html(html, {**source, "parser": parser})
+    rows = [
+        (i.dedupe_key, i.title, i.url, i.description, i.metric, i.image_url) for i in result.items
+    ]
+    return rows, result.errors
+
+
+class TestHtmlBackendParity(unittest.TestCase):
+    """Every captured HTML page, read by every shipped HTML source, gives the same
+    items and errors on each installed engine as on the reference html.parser."""
+
+    def test_installed_engines_match_the_reference(self) -> None:
+        engines = [p for p in HTML_PARSERS[1:] if importlib.util.find_spec(p) is not None]
+        if not engines:
+            self.skipTest("neither lxml nor selectolax is installed")
+        sources = [s for s in load_sources_config()["sources"] if s["type"] in {"html", "soldout"}]
+        pages = sorted(_FIXTURES.rglob("*.html"))
+        self.assertTrue(pages)
+        for page in pages:
+            html = page.read_text(encoding="utf-8")
+            for source in sources:
+                reference = _extracted(html, source, "html.parser")
+                for engine in engines:
+                    with self.subTest(page=page.name, source=source["id"], engine=engine):
+                        self.assertEqual(_extracted(html, source, engine), reference)
+
+
+class TestHtmlBackend(unittest.TestCase):
+    def test_missing_engine_falls_back_to_the_reference(self) -> None:
+        with (
+            unittest.mock.patch.object(importlib.util, "find_spec", return_value=None),
+            self.assertLogs("kinozal_scraper.generic_pipeline", level="WARNING") as logs,
+        ):
+            result = extract_from_html(_MINIMAL_HTML, {**_HTML_CONFIG, "parser": "selectolax"})
+        self.assertEqual([i.title for i in result.items], ["Film One", "Film Two"])
+        self.assertIn("selectolax is not installed", logs.output[0])
+
+    def test_unknown_engine_is_refused(self) -> None:
+        with self.assertRaises(ValueError):
+            html_backend("html5lib")
+
+
+class TestExtractionPlan(unittest.TestCase):
+    def test_field_selector_is_split_once(self) -> None:
+        for selector, css, attr in (
+            ("h2 a@href", "h2 a", "href"),
+            ("@title", "", "title"),
+            ("p", "p", None),
+        ):
+            with self.subTest(selector=selector):
+                compiled = compile_field_selector(selector)
+                self.assertEqual((compiled.css, compiled.attr), (css, attr))
+                self.assertEqual(compiled.matcher is None, not css)
+                self.assertIs(compile_field_selector(selector), compiled)
+
+    def test_loaded_config_leaves_extraction_nothing_to_compile(self) -> None:
+        config = load_sources_config()
+        validate_sources_config(config)
+        source = next(s for s in config["sources"] if s["id"] == "github_trending")
+        html = (_FIXTURES / "github_trending" / "trending_daily.html").read_text("utf-8")
+        misses = compile_css.cache_info().misses
+        for parser in ("html.parser", source["parser"]):
+            self.assertTrue(extract_from_html(html, {**source, "parser": parser}).items)
+        self.assertEqual(compile_css.cache_info().misses, misses)
+
+
+class TestLimitedRowParse(unittest.TestCase):
+    def _trending(self) -> tuple[str, dict]:
+        source = next(s for s in load_sources_config()["sources"] if s["id"] == "github_trending")
+        html = (_FIXTURES / "github_trending" / "trending_daily.html").read_text("utf-8")
+        return html, {**source, "parser": "html.parser"}
+
+    def test_row_tag_only_for_a_single_compound_selector(self) -> None:
+        for selector, tag in (
+            ("article.Box-row", "article"),
+            ("a[href^='/details.php']", "a"),
+            ("DIV.homeBoxEvent#top", "div"),
+            ("table tr.item", None),
+            ("tr.item:nth-child(2)", None),
+            ("h2, h3", None),
+            (".Box-row", None),
+        ):
+            with self.subTest(selector=selector):
+                self.assertEqual(_row_tag(selector), tag)
+
+    def test_tree_holds_only_the_kept_rows(self) -> None:
+        html, source = self._trending()
+        rows = SoupBackend().rows(html, extraction_plan({**source, "limit": 3}))
+        self.assertEqual(len(rows), 3)
+        self.assertEqual({row.parent.name for row in rows}, {"[document]"})
+
+    def test_limit_keeps_the_first_rows_of_the_full_page(self) -> None:
+        html, source = self._trending()
+        everything = extract_from_html(html, {**source, "limit": 0})
+        first = extract_from_html(html, {**source, "limit": 3})
+        self.assertGreater(len(everything.items), 3)
+        self.assertEqual(first.items, everything.items[:3])
+
+
+class TestHtmlPage(unittest.TestCase):
+    def test_rows_and_extra_fields_come_from_one_pass(self) -> None:
+        source = next(s for s in load_sources_config()["sources"] if s["id"] == "github_trending")
+        html = (_FIXTURES / "github_trending" / "trending_daily.html").read_text("utf-8")
+        page = extract_html_page(html, {**source, "parser": "html.parser", "limit": 4})
+        self.assertEqual(len(page.rows), 4)
+        self.assertEqual(len(page.result.items), 4)
+        self.assertIn("stars today", page.result.items[0].raw["stars_today"])
+
+    def test_no_row_selector_reads_no_rows(self) -> None:
+        page = extract_html_page(_MINIMAL_HTML, {**_HTML_CONFIG, "row_selector": ""})
+        self.assertEqual(page.rows, [])
+        self.assertFalse(page.result.ok)
+
+
 class TestPipelineResult(unittest.TestCase):
     def test_ok_true_when_no_errors(self) -> None:
         r = PipelineResult(source_id="s")
@@ -13,6 +13,8 @@ import unittest.mock
 from pathlib import Path
 from typing import Any
 
+from bs4 import BeautifulSoup
+
 from kinozal_scraper.gemini_enricher import FALLBACK_MARKER, QuotaExhausted
 from kinozal_scraper.generic_pipeline import extract_from_html
 from kinozal_scraper.github_trending_pipeline import (
@@ -42,6 +44,7 @@ _TRENDING_SOURCE: dict[str, Any] = {
         "metric": 'a[href$="/stargazers"]',
         "image_url": None,
     },
+    "extra_fields": {"stars_today": "span.d-inline-block.float-sm-right"},
     "message_template": "<b>{title}</b>\n{description}\n⭐ {metric} (+{stars_today} today)\n{url}",
 }
 
@@ -315,6 +318,24 @@ class TestMetricColumnSemantics(unittest.TestCase):
                 # And a "+N today" velocity marker must accompany it.
                 self.assertRegex(sent.text, r"\+\d+ today")
 
+    def test_stars_today_read_by_extra_fields(self) -> None:
+        # Read by the source's `extra_fields` in the extraction pass, then reduced to
+        # digits like `metric`.
+        result = extract_from_html(_fixture_html(), _TRENDING_SOURCE)
+        items = _normalize_items(result.items)
+        self.assertGreaterEqual(len(items), 1)
+        for item in items:
+            self.assertRegex(item.raw["stars_today"], r"^\d+$")
+
+    def test_page_is_parsed_once_per_run(self) -> None:
+        # Row count, fields and stars today all come out of one extraction pass.
+        with unittest.mock.patch(
+            "kinozal_scraper.generic_pipeline.BeautifulSoup", wraps=BeautifulSoup
+        ) as parse:
+            _, notifier = _run()
+        self.assertGreaterEqual(len(notifier.sent), 1)
+        parse.assert_called_once()
+
 
 # ── pipeline mechanics ───────────────────────────────────────────────────────
 
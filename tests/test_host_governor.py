@@ -0,0 +1,238 @@
+"""Tests for `host_governor.py` — per-host token buckets, circuit breakers and slots.
+
+Covers what counts as a host failure (5xx and transport, never 4xx), the
+open → cooldown → probe cycle, pacing of budgeted hosts, the per-host concurrency
+cap and its environment override, and the end-to-end effect
+on `fetch_html`: one call's own retries never open a circuit, but a host that keeps
+failing is refused without a request.
+"""
+
+import os
+import threading
+import time
+import unittest
+import unittest.mock
+
+import requests
+from curl_cffi.requests.exceptions import HTTPError as CurlHTTPError
+from curl_cffi.requests.exceptions import Timeout as CurlTimeout
+
+from kinozal_scraper.host_governor import (
+    _FAILURE_THRESHOLD,
+    CircuitOpenError,
+    HostGovernor,
+    concurrency_from_env,
+    is_host_failure,
+)
+from kinozal_scraper.http_fetch import fetch_html
+
+
+def _curl_status_error(status: int) -> CurlHTTPError:
+    response = unittest.mock.Mock(status_code=status)
+    return CurlHTTPError(f"HTTP Error {status}", 0, response)
+
+
+def _fail(governor: HostGovernor, url: str, exc: Exception) -> None:
+    with unittest.mock.patch("time.sleep"):
+        try:
+            with governor.guard(url):
+                raise exc
+        except type(exc):
+            pass
+
+
+class TestIsHostFailure(unittest.TestCase):
+    def test_5xx_and_transport_errors_count(self) -> None:
+        for exc in (
+            _curl_status_error(522),
+            CurlTimeout("slow"),
+            requests.ConnectionError("dns"),
+        ):
+            with self.subTest(exc=repr(exc)):
+                self.assertTrue(is_host_failure(exc))
+
+    def test_answers_do_not_count(self) -> None:
+        # A 403 is the Cloudflare verdict soldout's patient schedule outlasts (#396),
+        # a 404 a missing page: either way the host answered.
+        for exc in (_curl_status_error(403), _curl_status_error(404), ValueError("json")):
+            with self.subTest(exc=repr(exc)):
+                self.assertFalse(is_host_failure(exc))
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    url = "https://kinozal.tv/details.php?id=1"
+
+    def test_opens_after_threshold_and_refuses_without_calling(self) -> None:
+        governor = HostGovernor(failure_threshold=3, cooldown_s=60)
+        with self.assertLogs("kinozal_scraper.host_governor", level="WARNING") as logs:
+            for _ in range(3):
+                _fail(governor, self.url, _curl_status_error(522))
+        self.assertIn("kinozal.tv: circuit opened after 3 consecutive failures", logs.output[0])
+        with self.assertRaises(CircuitOpenError), governor.guard(self.url):
+            self.fail("the guarded body must not run while the circuit is open")
+        self.assertEqual(
+            governor.summary_lines(),
+            ["host_governor: kinozal.tv opened=1 short_circuited=1 paced=0"],
+        )
+
+    def test_an_answer_resets_the_count(self) -> None:
+        governor = HostGovernor(failure_threshold=2, cooldown_s=60)
+        _fail(governor, self.url, _curl_status_error(522))
+        _fail(governor, self.url, _curl_status_error(404))
+        _fail(governor, self.url, _curl_status_error(522))
+        with governor.guard(self.url):
+            pass  # still closed
+
+    def test_hosts_are_independent(self) -> None:
+        governor = HostGovernor(failure_threshold=1, cooldown_s=60)
+        with self.assertLogs("kinozal_scraper.host_governor", level="WARNING"):
+            _fail(governor, self.url, _curl_status_error(522))
+        with governor.guard("https://kinozal.guru/details.php?id=1"):
+            pass
+
+    def test_probe_after_cooldown_closes_or_reopens(self) -> None:
+        governor = HostGovernor(failure_threshold=1, cooldown_s=60)
+        clock = "kinozal_scraper.host_governor.time.monotonic"
+        with (
+            unittest.mock.patch(clock, return_value=0.0),
+            self.assertLogs("kinozal_scraper.host_governor", level="INFO"),
+        ):
+            _fail(governor, self.url, _curl_status_error(522))
+        with (
+            unittest.mock.patch(clock, return_value=61.0),
+            self.assertLogs("kinozal_scraper.host_governor", level="INFO") as logs,
+        ):
+            _fail(governor, self.url, CurlTimeout("still down"))
+        self.assertTrue(any("re-opened" in line for line in logs.output))
+        with unittest.mock.patch(clock, return_value=100.0), self.assertRaises(CircuitOpenError):
+            governor.before(self.url)
+        with (
+            unittest.mock.patch(clock, return_value=200.0),
+            self.assertLogs("kinozal_scraper.host_governor", level="INFO") as logs,
+            governor.guard(self.url),
+        ):
+            pass
+        self.assertTrue(any("circuit closed" in line for line in logs.output))
+
+    def test_only_one_probe_at_a_time(self) -> None:
+        governor = HostGovernor(failure_threshold=1, cooldown_s=0)
+        with self.assertLogs("kinozal_scraper.host_governor", level="INFO"):
+            _fail(governor, self.url, _curl_status_error(522))
+            governor.before(self.url)  # the probe is in flight
+        with self.assertRaises(CircuitOpenError):
+            governor.before(self.url)
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_budgeted_host_waits_for_a_token_once_the_burst_is_spent(self) -> None:
+        governor = HostGovernor(rates={"store.steampowered.com": (2.0, 2)})
+        url = "https://store.steampowered.com/api/appdetails"
+        with unittest.mock.patch("kinozal_scraper.host_governor.time.monotonic", return_value=0.0):
+            delays = [governor.before(url) for _ in range(3)]
+        self.assertEqual(delays, [0.0, 0.0, 0.5])
+
+    def test_every_paced_admission_is_counted_under_concurrency(self) -> None:
+        governor = HostGovernor(rates={"store.steampowered.com": (1.0, 1)})
+        url = "https://store.steampowered.com/api/appdetails"
+        delays: list[float] = []
+
+        def _admit() -> None:
+            for _ in range(200):
+                delays.append(governor.before(url))
+
+        threads = [threading.Thread(target=_admit) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(
+            governor.stats["store.steampowered.com", "paced"], sum(1 for d in delays if d)
+        )
+
+    def test_unlisted_host_is_not_paced(self) -> None:
+        governor = HostGovernor(rates={})
+        self.assertEqual([governor.before("https://kinozal.tv/") for _ in range(50)], [0.0] * 50)
+
+
+class TestConcurrencyCap(unittest.TestCase):
+    def test_a_host_never_has_more_attempts_in_flight_than_its_cap(self) -> None:
+        governor = HostGovernor(rates={}, host_concurrency=2)
+        release = threading.Event()
+        self.addCleanup(release.set)
+        lock = threading.Lock()
+        inside = 0
+        most = 0
+
+        def _attempt() -> None:
+            nonlocal inside, most
+            with governor.guard("https://kinozal.tv/details.php?id=1"):
+                with lock:
+                    inside += 1
+                    most = max(most, inside)
+                release.wait(5)
+                with lock:
+                    inside -= 1
+
+        threads = [threading.Thread(target=_attempt) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline and inside < 2:
+            time.sleep(0.01)
+        time.sleep(0.05)  # room for a third attempt to get in, were the cap broken
+        # Another host is not queued behind the full one.
+        with governor.guard("https://kinozal.guru/details.php?id=1"):
+            pass
+        with lock:
+            self.assertEqual((inside, most), (2, 2))
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(most, 2)
+
+    def test_a_refused_host_fails_fast_instead_of_waiting_for_a_slot(self) -> None:
+        governor = HostGovernor(failure_threshold=1, cooldown_s=60, host_concurrency=1)
+        url = "https://kinozal.tv/"
+        with self.assertLogs("kinozal_scraper.host_governor", level="WARNING"):
+            _fail(governor, url, _curl_status_error(522))
+        slot = governor._slot(url)
+        slot.acquire()
+        self.addCleanup(slot.release)
+        with self.assertRaises(CircuitOpenError), governor.guard(url):
+            self.fail("the guarded body must not run while the circuit is open")
+
+    def test_cap_comes_from_the_environment(self) -> None:
+        with unittest.mock.patch.dict(os.environ, {"HTTP_HOST_CONCURRENCY": "2"}):
+            self.assertEqual(HostGovernor().host_concurrency, 2)
+        for raw in ("0", "many"):
+            with (
+                self.subTest(raw=raw),
+                unittest.mock.patch.dict(os.environ, {"HTTP_MAX_CONCURRENCY": raw}),
+                self.assertLogs("kinozal_scraper.host_governor", level="WARNING"),
+            ):
+                self.assertEqual(concurrency_from_env("HTTP_MAX_CONCURRENCY", 8), 8)
+
+
+class TestFetchHtmlThroughTheGovernor(unittest.TestCase):
+    """The shared instance on the real transport: retries inside a call do not trip
+    the circuit, but the next failing call does, and later calls never reach the wire."""
+
+    @unittest.mock.patch("tenacity.nap.time.sleep")
+    def test_dead_origin_is_refused_after_one_more_call(self, _sleep: unittest.mock.Mock) -> None:
+        down = unittest.mock.Mock(status_code=503, headers={}, content=b"")
+        down.raise_for_status.side_effect = CurlHTTPError("HTTP Error 503", 0, down)
+        with (
+            unittest.mock.patch("kinozal_scraper.http_fetch._POOL.get", return_value=down) as get,
+            self.assertLogs(level="WARNING"),
+        ):
+            with self.assertRaises(CurlHTTPError):
+                fetch_html("https://kinozal.tv/top.php")
+            with self.assertRaises(CircuitOpenError):
+                fetch_html("https://kinozal.tv/details.php?id=1")
+            with self.assertRaises(CircuitOpenError):
+                fetch_html("https://kinozal.tv/details.php?id=2")
+        self.assertEqual(get.call_count, _FAILURE_THRESHOLD)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,25 +1,35 @@
 """Tests for `http_fetch.py` — the HTTP boundary shared by every scraper.
 
 Covers browser impersonation and shared request kwargs, image content-type
-rules, the transient-vs-permanent retry policy, and the single-line block
-diagnostics printed on a 403.
+rules, the transient-vs-permanent retry policy, the single-line block
+diagnostics printed on a 403, the keep-alive pool, the shared prefetch workers
+and the conditional-GET validator cache.
 """
 
 import pathlib
+import tempfile
+import threading
 import unittest
 import unittest.mock
+from typing import Any, cast
 
 from curl_cffi.requests.exceptions import HTTPError
 
 from kinozal_scraper.http_fetch import (
     _HTML_GET,
     _IMAGE_GET,
+    _VALIDATOR_TTL_S,
+    BodyTooLargeError,
     NotAnImageError,
+    _SessionPool,
     describe_block,
     fetch_bytes,
     fetch_html,
     fetch_html_patient,
+    prefetch,
+    transport_summary_lines,
 )
+from kinozal_scraper.local_store import LocalStore
 
 _FIXTURES = pathlib.Path(__file__).parent / "fixtures"
 
@@ -38,6 +48,7 @@ def _transient_resp(
     resp.status_code = status_code
     resp.headers = headers if headers is not None else {}
     resp.content = body
+    resp.iter_content.return_value = [body] if body else []
     resp.raise_for_status.side_effect = HTTPError(f"HTTP Error {status_code}", 0, resp)
     return resp
 
@@ -50,9 +61,17 @@ def _ok_html(text: str = "<html>ok</html>") -> unittest.mock.Mock:
 
 
 def _ok_image() -> unittest.mock.Mock:
+    return _streamed(b"\x89PNG\r\n", {"content-type": "image/png"})
+
+
+def _streamed(body: bytes, headers: dict[str, str], chunk: int = 0) -> unittest.mock.Mock:
+    """A 200 `stream=True` response: `iter_content` yields `body` in `chunk`-sized
+    pieces (one piece when 0); `content` stays set for the buffered paths."""
     resp = unittest.mock.Mock()
-    resp.content = b"\x89PNG\r\n"
-    resp.headers = {"content-type": "image/png"}
+    resp.content = body
+    resp.headers = headers
+    size = chunk or len(body) or 1
+    resp.iter_content.return_value = [body[i : i + size] for i in range(0, len(body), size)]
     resp.raise_for_status.return_value = None
     return resp
 
@@ -66,7 +85,7 @@ class TestFetchHtml(unittest.TestCase):
         mock_resp = unittest.mock.Mock()
         mock_resp.text = "<html></html>"
         with unittest.mock.patch(
-            "kinozal_scraper.http_fetch.requests.get", return_value=mock_resp
+            "kinozal_scraper.http_fetch._POOL.get", return_value=mock_resp
         ) as mget:
             fetch_html("https://example.com")
         mget.assert_called_once()
@@ -77,14 +96,14 @@ class TestFetchHtml(unittest.TestCase):
     def test_returns_response_text(self) -> None:
         mock_resp = unittest.mock.Mock()
         mock_resp.text = "<html>hi</html>"
-        with unittest.mock.patch("kinozal_scraper.http_fetch.requests.get", return_value=mock_resp):
+        with unittest.mock.patch("kinozal_scraper.http_fetch._POOL.get", return_value=mock_resp):
             self.assertEqual(fetch_html("https://example.com"), "<html>hi</html>")
 
     def test_raises_on_http_error(self) -> None:
         mock_resp = unittest.mock.Mock()
         mock_resp.raise_for_status.side_effect = RuntimeError("403")
         with (
-            unittest.mock.patch("kinozal_scraper.http_fetch.requests.get", return_value=mock_resp),
+            unittest.mock.patch("kinozal_scraper.http_fetch._POOL.get", return_value=mock_resp),
             self.assertRaises(RuntimeError),
         ):
             fetch_html("https://example.com")
@@ -100,9 +119,10 @@ class TestFetchBytes(unittest.TestCase):
     def test_passes_impersonate_chrome_and_returns_content(self) -> None:
         mock_resp = unittest.mock.Mock()
         mock_resp.content = b"\x89PNG\r\n"
+        mock_resp.iter_content.return_value = [mock_resp.content]
         mock_resp.headers = {"content-type": "image/png"}
         with unittest.mock.patch(
-            "kinozal_scraper.http_fetch.requests.get", return_value=mock_resp
+            "kinozal_scraper.http_fetch._POOL.get", return_value=mock_resp
         ) as mget:
             result = fetch_bytes("https://example.com/poster.jpg")
         mget.assert_called_once()
@@ -115,7 +135,7 @@ class TestFetchBytes(unittest.TestCase):
         mock_resp = unittest.mock.Mock()
         mock_resp.raise_for_status.side_effect = RuntimeError("403")
         with (
-            unittest.mock.patch("kinozal_scraper.http_fetch.requests.get", return_value=mock_resp),
+            unittest.mock.patch("kinozal_scraper.http_fetch._POOL.get", return_value=mock_resp),
             self.assertRaises(RuntimeError),
         ):
             fetch_bytes("https://example.com/poster.jpg")
@@ -130,9 +150,10 @@ class TestFetchBytes(unittest.TestCase):
         # a byte-exact q-value string.
         mock_resp = unittest.mock.Mock()
         mock_resp.content = b"\xff\xd8\xff\xe0JPEG"
+        mock_resp.iter_content.return_value = [mock_resp.content]
         mock_resp.headers = {"content-type": "image/jpeg"}
         with unittest.mock.patch(
-            "kinozal_scraper.http_fetch.requests.get", return_value=mock_resp
+            "kinozal_scraper.http_fetch._POOL.get", return_value=mock_resp
         ) as mget:
             fetch_bytes("https://i4.imageban.ru/out/2026/07/04/x.jpg")
         _, kwargs = mget.call_args
@@ -141,18 +162,19 @@ class TestFetchBytes(unittest.TestCase):
     def test_raises_not_an_image_on_text_html(self) -> None:
         # #265: a fastpic anti-hotlink viewer page returns 200 text/html (~300 KB).
         # fetch_bytes must NOT hand that HTML back as "poster bytes" — it raises a
-        # typed NotAnImageError carrying url + content-type + the already-downloaded
-        # body (so the resolver reuses it without a second GET).
+        # typed NotAnImageError carrying url + content-type + the downloaded body
+        # when the caller keeps HTML (so the resolver reuses it without a second GET).
         body = b"<html><title>FastPic viewer</title></html>"
         url = "https://i126.fastpic.org/big/x.jpg"
         mock_resp = unittest.mock.Mock()
         mock_resp.content = body
+        mock_resp.iter_content.return_value = [mock_resp.content]
         mock_resp.headers = {"content-type": "text/html"}
         with (
-            unittest.mock.patch("kinozal_scraper.http_fetch.requests.get", return_value=mock_resp),
+            unittest.mock.patch("kinozal_scraper.http_fetch._POOL.get", return_value=mock_resp),
             self.assertRaises(NotAnImageError) as ctx,
         ):
-            fetch_bytes(url)
+            fetch_bytes(url, keep_html=True)
         err = ctx.exception
         self.assertEqual(err.url, url)
         self.assertEqual(err.content_type, "text/html")
@@ -161,8 +183,9 @@ class TestFetchBytes(unittest.TestCase):
     def test_returns_content_for_image_content_type(self) -> None:
         mock_resp = unittest.mock.Mock()
         mock_resp.content = b"\xff\xd8\xff\xe0JPEG"
+        mock_resp.iter_content.return_value = [mock_resp.content]
         mock_resp.headers = {"content-type": "image/jpeg"}
-        with unittest.mock.patch("kinozal_scraper.http_fetch.requests.get", return_value=mock_resp):
+        with unittest.mock.patch("kinozal_scraper.http_fetch._POOL.get", return_value=mock_resp):
             result = fetch_bytes("https://example.com/poster.jpg")
         self.assertEqual(result, b"\xff\xd8\xff\xe0JPEG")
 
@@ -171,13 +194,72 @@ class TestFetchBytes(unittest.TestCase):
         # text/html and raise — a real server sends the charset param.
         mock_resp = unittest.mock.Mock()
         mock_resp.content = b"<html></html>"
+        mock_resp.iter_content.return_value = [mock_resp.content]
         mock_resp.headers = {"content-type": "text/html; charset=UTF-8"}
         with (
-            unittest.mock.patch("kinozal_scraper.http_fetch.requests.get", return_value=mock_resp),
+            unittest.mock.patch("kinozal_scraper.http_fetch._POOL.get", return_value=mock_resp),
             self.assertRaises(NotAnImageError),
         ):
             fetch_bytes("https://i126.fastpic.org/big/x.jpg")
 
+    def test_html_is_refused_unread_by_default(self) -> None:
+        # Streaming: the content-type is known from the headers, so a caller that
+        # cannot use the page never downloads it.
+        resp = _streamed(b"<html>" + b"x" * 300_000, {"content-type": "text/html"})
+        with (
+            unittest.mock.patch("kinozal_scraper.http_fetch._POOL.get", return_value=resp),
+            self.assertRaises(NotAnImageError) as ctx,
+        ):
+            fetch_bytes("https://imageban.ru/show/x")
+        self.assertEqual(ctx.exception.body, b"")
+        resp.iter_content.assert_not_called()
+        resp.close.assert_called_once()
+
+    def test_declared_oversize_body_is_refused_before_reading(self) -> None:
+        resp = _streamed(b"\x89PNG" * 10, {"content-type": "image/png", "Content-Length": "40"})
+        with (
+            unittest.mock.patch("kinozal_scraper.http_fetch._POOL.get", return_value=resp),
+            self.assertRaises(BodyTooLargeError),
+        ):
+            fetch_bytes("https://example.com/poster.png", max_bytes=39)
+        resp.iter_content.assert_not_called()
+        resp.close.assert_called_once()
+
+    def test_undeclared_oversize_body_is_cut_off_mid_stream(self) -> None:
+        # Chunked transfer (no Content-Length), or a length that understates the body.
+        for headers in ({"content-type": "image/png"}, {"Content-Length": "8"}):
+            with self.subTest(headers=headers):
+                resp = _streamed(b"\x89PNG" * 10, headers, chunk=8)
+                with (
+                    unittest.mock.patch("kinozal_scraper.http_fetch._POOL.get", return_value=resp),
+                    self.assertRaises(BodyTooLargeError),
+                ):
+                    fetch_bytes("https://example.com/poster.png", max_bytes=20)
+                resp.close.assert_called_once()
+
+    def test_chunks_are_joined_whatever_length_is_declared(self) -> None:
+        body = bytes(range(256)) * 4
+        for declared in (str(len(body)), "16", ""):
+            with self.subTest(content_length=declared):
+                headers = {"content-type": "image/jpeg", "content-length": declared}
+                resp = _streamed(body, headers, chunk=100)
+                with unittest.mock.patch("kinozal_scraper.http_fetch._POOL.get", return_value=resp):
+                    self.assertEqual(fetch_bytes("https://example.com/poster.jpg"), body)
+
+    def test_error_body_is_read_only_up_to_the_diagnostic_prefix(self) -> None:
+        page = b"<html><title>Attention Required! | Cloudflare</title>" + b"x" * 200_000
+        resp = _transient_resp(404, {"content-type": "text/html"}, page)
+        resp.iter_content.return_value = [page[i : i + 1000] for i in range(0, len(page), 1000)]
+        with (
+            unittest.mock.patch("kinozal_scraper.http_fetch._POOL.get", return_value=resp),
+            self.assertLogs("kinozal_scraper.http_fetch", level="WARNING") as logs,
+            self.assertRaises(HTTPError),
+        ):
+            fetch_bytes("https://example.com/poster.jpg")
+        self.assertIn("Attention Required!", logs.output[0])
+        self.assertIn(f"len={64 * 1024}", logs.output[0])
+        resp.close.assert_called_once()
+
 
 class TestBlockDiagnostics(unittest.TestCase):
     """#358: an anti-bot 403 must reach the operator as evidence, not as a bare
@@ -254,7 +336,7 @@ class TestFetchRetry(unittest.TestCase):
         self, _sleep: unittest.mock.Mock
     ) -> None:
         with unittest.mock.patch(
-            "kinozal_scraper.http_fetch.requests.get",
+            "kinozal_scraper.http_fetch._POOL.get",
             side_effect=[_transient_resp(403), _ok_html("<html>hi</html>")],
         ) as mget:
             result = fetch_html("https://example.com")
@@ -264,7 +346,7 @@ class TestFetchRetry(unittest.TestCase):
     @unittest.mock.patch("tenacity.nap.time.sleep")
     def test_fetch_html_retries_5xx_then_succeeds(self, _sleep: unittest.mock.Mock) -> None:
         with unittest.mock.patch(
-            "kinozal_scraper.http_fetch.requests.get",
+            "kinozal_scraper.http_fetch._POOL.get",
             side_effect=[_transient_resp(502), _ok_html("<html>hi</html>")],
         ) as mget:
             result = fetch_html("https://example.com")
@@ -277,7 +359,7 @@ class TestFetchRetry(unittest.TestCase):
         # fast — one GET, no retry — so a real config/permission fault surfaces.
         with (
             unittest.mock.patch(
-                "kinozal_scraper.http_fetch.requests.get", side_effect=[_transient_resp(404)]
+                "kinozal_scraper.http_fetch._POOL.get", side_effect=[_transient_resp(404)]
             ) as mget,
             self.assertRaises(HTTPError),
         ):
@@ -294,7 +376,7 @@ class TestFetchRetry(unittest.TestCase):
         # window makes four attempts hit one Cloudflare decision.
         with (
             unittest.mock.patch(
-                "kinozal_scraper.http_fetch.requests.get",
+                "kinozal_scraper.http_fetch._POOL.get",
                 side_effect=lambda *a, **k: _transient_resp(503),
             ) as mget,
             self.assertRaises(HTTPError),
@@ -306,7 +388,7 @@ class TestFetchRetry(unittest.TestCase):
     @unittest.mock.patch("tenacity.nap.time.sleep")
     def test_fetch_bytes_retries_transient_then_succeeds(self, _sleep: unittest.mock.Mock) -> None:
         with unittest.mock.patch(
-            "kinozal_scraper.http_fetch.requests.get",
+            "kinozal_scraper.http_fetch._POOL.get",
             side_effect=[_transient_resp(429), _ok_image()],
         ) as mget:
             result = fetch_bytes("https://example.com/poster.jpg")
@@ -317,14 +399,9 @@ class TestFetchRetry(unittest.TestCase):
     def test_fetch_bytes_not_an_image_not_retried(self, _sleep: unittest.mock.Mock) -> None:
         # Preservation guard: a 200 text/html (anti-hotlink viewer, #265) is a
         # content problem, not a transient — NotAnImageError, exactly one GET.
-        resp = unittest.mock.Mock()
-        resp.content = b"<html></html>"
-        resp.headers = {"content-type": "text/html"}
-        resp.raise_for_status.return_value = None
+        resp = _streamed(b"<html></html>", {"content-type": "text/html"})
         with (
-            unittest.mock.patch(
-                "kinozal_scraper.http_fetch.requests.get", return_value=resp
-            ) as mget,
+            unittest.mock.patch("kinozal_scraper.http_fetch._POOL.get", return_value=resp) as mget,
             self.assertRaises(NotAnImageError),
         ):
             fetch_bytes("https://i126.fastpic.org/big/x.jpg")
@@ -343,7 +420,7 @@ class TestFetchRetry(unittest.TestCase):
             for n in range(4)
         ]
         with (
-            unittest.mock.patch("kinozal_scraper.http_fetch.requests.get", side_effect=attempts),
+            unittest.mock.patch("kinozal_scraper.http_fetch._POOL.get", side_effect=attempts),
             self.assertLogs("kinozal_scraper.http_fetch", level="WARNING") as logs,
             self.assertRaises(HTTPError),
         ):
@@ -359,7 +436,7 @@ class TestFetchRetry(unittest.TestCase):
         # the same number of times — the log must not become a silent skip.
         with (
             unittest.mock.patch(
-                "kinozal_scraper.http_fetch.requests.get",
+                "kinozal_scraper.http_fetch._POOL.get",
                 side_effect=lambda *a, **k: _transient_resp(403),
             ) as mget,
             self.assertLogs("kinozal_scraper.http_fetch", level="WARNING") as logs,
@@ -381,7 +458,7 @@ class TestPatientHtml(unittest.TestCase):
     def test_fetch_html_patient_makes_24_attempts_on_403(self, _sleep: unittest.mock.Mock) -> None:
         with (
             unittest.mock.patch(
-                "kinozal_scraper.http_fetch.requests.get",
+                "kinozal_scraper.http_fetch._POOL.get",
                 side_effect=lambda *a, **k: _transient_resp(403),
             ) as mget,
             self.assertRaises(HTTPError),
@@ -393,7 +470,7 @@ class TestPatientHtml(unittest.TestCase):
         # Anti-drift: the slow path must use the fast path's kwargs so it remains
         # the same operation with a more patient schedule.
         with unittest.mock.patch(
-            "kinozal_scraper.http_fetch.requests.get", return_value=_ok_html()
+            "kinozal_scraper.http_fetch._POOL.get", return_value=_ok_html()
         ) as mget:
             fetch_html_patient("https://example.com")
 
@@ -405,7 +482,7 @@ class TestPatientHtml(unittest.TestCase):
         # times 12 minutes on every item and consume the entire job.
         with (
             unittest.mock.patch(
-                "kinozal_scraper.http_fetch.requests.get",
+                "kinozal_scraper.http_fetch._POOL.get",
                 side_effect=lambda *a, **k: _transient_resp(403),
             ) as mget,
             self.assertRaises(HTTPError),
@@ -426,7 +503,7 @@ class TestSharedRequestKwargs(unittest.TestCase):
 
     def test_fetch_html_uses_shared_kwargs(self) -> None:
         with unittest.mock.patch(
-            "kinozal_scraper.http_fetch.requests.get", return_value=_ok_html()
+            "kinozal_scraper.http_fetch._POOL.get", return_value=_ok_html()
         ) as mget:
             fetch_html("https://example.com")
 
@@ -434,12 +511,229 @@ class TestSharedRequestKwargs(unittest.TestCase):
 
     def test_fetch_bytes_uses_shared_kwargs(self) -> None:
         with unittest.mock.patch(
-            "kinozal_scraper.http_fetch.requests.get", return_value=_ok_image()
+            "kinozal_scraper.http_fetch._POOL.get", return_value=_ok_image()
         ) as mget:
             fetch_bytes("https://example.com/x.png")
 
-        self.assertEqual(mget.call_args.kwargs, _IMAGE_GET)
+        # `stream=True` is the transport mode, not a request parameter a second
+        # caller could drift on.
+        self.assertEqual(mget.call_args.kwargs, {**_IMAGE_GET, "stream": True})
+
+
+class TestSessionPool(unittest.TestCase):
+    """Per-host keep-alive sessions behind every fetch helper.
+
+    A module-level `requests.get` opened a fresh TCP + impersonated TLS handshake for
+    each details page and poster; the pool hands the same `Session` back per host so
+    libcurl can reuse the connection. `requests.Session` is patched so no socket opens.
+    """
+
+    def _pool(self, **kwargs: Any) -> tuple[_SessionPool, unittest.mock.Mock]:
+        factory = unittest.mock.Mock(side_effect=lambda **_: unittest.mock.Mock())
+        patcher = unittest.mock.patch("kinozal_scraper.http_fetch.requests.Session", factory)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return _SessionPool(**kwargs), factory
+
+    def test_same_host_reuses_one_session(self) -> None:
+        pool, factory = self._pool()
+        pool.get("https://kinozal.tv/details.php?id=1", **_HTML_GET)
+        pool.get("https://kinozal.tv/details.php?id=2", **_HTML_GET)
+        self.assertEqual(factory.call_count, 1)
+        self.assertEqual(pool._sessions["kinozal.tv"].reused, 1)
+
+    def test_request_kwargs_reach_the_pooled_session_unchanged(self) -> None:
+        # The sessions are bare; impersonate/timeout/Accept still travel per request,
+        # so the pooled GET is the same request the module-level one was.
+        pool, _ = self._pool()
+        with self.assertLogs("kinozal_scraper.http_fetch", level="INFO"):
+            pool.get("https://i4.imageban.ru/x.jpg", **_IMAGE_GET)
+        (session,) = [cast(unittest.mock.Mock, e.session) for e in pool._sessions.values()]
+        session.get.assert_called_once_with("https://i4.imageban.ru/x.jpg", **_IMAGE_GET)
+
+    def test_sessions_never_keep_cookies(self) -> None:
+        # The one-shot GET sent no cookie between calls; a pooled session must not
+        # start replaying a `Set-Cookie` from an earlier response to the host.
+        pool, factory = self._pool()
+        pool.get("https://kinozal.tv/top.php")
+        self.assertIs(factory.call_args.kwargs["discard_cookies"], True)
+
+    def test_distinct_hosts_get_distinct_sessions(self) -> None:
+        pool, factory = self._pool()
+        pool.get("https://kinozal.tv/top.php")
+        pool.get("https://i126.fastpic.org/big/x.jpg")
+        self.assertEqual(factory.call_count, 2)
+
+    def test_full_pool_evicts_least_recently_used_host(self) -> None:
+        pool, _ = self._pool(max_hosts=2)
+        pool.get("https://a.example/")
+        pool.get("https://b.example/")
+        pool.get("https://a.example/")
+        first_b = cast(unittest.mock.Mock, pool._sessions["b.example"].session)
+        with self.assertLogs("kinozal_scraper.http_fetch", level="INFO") as logs:
+            pool.get("https://c.example/")
+        self.assertEqual(list(pool._sessions), ["a.example", "c.example"])
+        first_b.close.assert_called_once()
+        self.assertTrue(any("b.example closed: evicted" in line for line in logs.output))
+
+    def test_idle_session_is_replaced(self) -> None:
+        pool, factory = self._pool(idle_timeout_s=60)
+        with unittest.mock.patch("kinozal_scraper.http_fetch.time.monotonic", return_value=0.0):
+            pool.get("https://kinozal.tv/top.php")
+        stale = cast(unittest.mock.Mock, pool._sessions["kinozal.tv"].session)
+        with unittest.mock.patch("kinozal_scraper.http_fetch.time.monotonic", return_value=61.0):
+            pool.get("https://kinozal.tv/top.php")
+        stale.close.assert_called_once()
+        self.assertEqual(factory.call_count, 2)
+
+    def test_open_and_close_lines_carry_the_knobs_and_reuse_count(self) -> None:
+        # Keep-alive must be readable in a run log: the opening line names the pool
+        # bounds, the closing line says how many requests rode the connection.
+        pool, _ = self._pool(max_hosts=4, idle_timeout_s=30)
+        with self.assertLogs("kinozal_scraper.http_fetch", level="INFO") as logs:
+            for _ in range(3):
+                pool.get("https://kinozal.tv/top.php")
+            pool.close()
+        self.assertIn("pool 1/4, idle_timeout=30s", logs.output[0])
+        self.assertIn("reused 2 time(s)", logs.output[-1])
+
+
+class TestConditionalGet(unittest.TestCase):
+    """Validator cache in front of `fetch_html`: the stored `ETag`/`Last-Modified`
+    goes out as `If-None-Match`/`If-Modified-Since` and a 304 is served from disk."""
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.store = LocalStore(pathlib.Path(tmp.name) / "state.sqlite3", "http_validators")
+        self.addCleanup(self.store.close)
+        patcher = unittest.mock.patch(
+            "kinozal_scraper.http_fetch._validator_store", return_value=self.store
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def _resp(status: int, text: str = "", headers: dict[str, str] | None = None) -> Any:
+        resp = _ok_html(text)
+        resp.status_code = status
+        resp.headers = headers or {}
+        return resp
+
+    def test_validators_are_sent_and_304_is_served_from_cache(self) -> None:
+        first = self._resp(200, "<html>v1</html>", {"etag": '"abc"', "last-modified": "Mon"})
+        with unittest.mock.patch(
+            "kinozal_scraper.http_fetch._POOL.get", side_effect=[first, self._resp(304)]
+        ) as mget:
+            self.assertEqual(fetch_html("https://github.com/trending"), "<html>v1</html>")
+            with self.assertLogs("kinozal_scraper.http_fetch", level="INFO"):
+                self.assertEqual(fetch_html("https://github.com/trending"), "<html>v1</html>")
+        self.assertEqual(mget.call_args_list[0].kwargs, _HTML_GET)
+        self.assertEqual(
+            mget.call_args_list[1].kwargs,
+            {**_HTML_GET, "headers": {"If-None-Match": '"abc"', "If-Modified-Since": "Mon"}},
+        )
+        self.assertEqual(transport_summary_lines(), ["http_cache: hit=1 miss=1 304=1"])
+
+    def test_changed_page_replaces_the_cached_body(self) -> None:
+        responses = [
+            self._resp(200, "v1", {"etag": '"1"'}),
+            self._resp(200, "v2", {"etag": '"2"'}),
+            self._resp(304),
+        ]
+        with unittest.mock.patch("kinozal_scraper.http_fetch._POOL.get", side_effect=responses):
+            fetch_html("https://a.example/")
+            self.assertEqual(fetch_html("https://a.example/"), "v2")
+            with self.assertLogs("kinozal_scraper.http_fetch", level="INFO"):
+                self.assertEqual(fetch_html("https://a.example/"), "v2")
+
+    def test_304_extends_the_validators_expiry(self) -> None:
+        url = "https://github.com/trending"
+        clock = "kinozal_scraper.local_store.time.time"
+        week = _VALIDATOR_TTL_S
+        responses = [self._resp(200, "v1", {"etag": '"1"'}), self._resp(304), self._resp(304)]
+        with (
+            unittest.mock.patch("kinozal_scraper.http_fetch._POOL.get", side_effect=responses),
+            self.assertLogs("kinozal_scraper.http_fetch", level="INFO"),
+        ):
+            with unittest.mock.patch(clock, return_value=0.0):
+                fetch_html(url)
+            with unittest.mock.patch(clock, return_value=week - 60):
+                self.assertEqual(fetch_html(url), "v1")
+            # Past the first response's week, the 304 has kept the entry alive.
+            with unittest.mock.patch(clock, return_value=week + 60):
+                self.assertEqual(fetch_html(url), "v1")
+        self.assertEqual(transport_summary_lines(), ["http_cache: hit=2 miss=1 304=2"])
+
+    def test_response_without_validators_is_not_stored(self) -> None:
+        with unittest.mock.patch(
+            "kinozal_scraper.http_fetch._POOL.get", return_value=self._resp(200, "x")
+        ):
+            fetch_html("https://kinozal.tv/details.php?id=1")
+        self.assertEqual(len(self.store), 0)
+
+    def test_patient_fetch_revalidates_too(self) -> None:
+        self.store.put_json("https://soldout.example/", {"etag": '"e"', "body": "cached"})
+        with (
+            unittest.mock.patch(
+                "kinozal_scraper.http_fetch._POOL.get", return_value=self._resp(304)
+            ),
+            self.assertLogs("kinozal_scraper.http_fetch", level="INFO"),
+        ):
+            self.assertEqual(fetch_html_patient("https://soldout.example/"), "cached")
+
+    def test_no_store_means_plain_get_and_no_summary_line(self) -> None:
+        with (
+            unittest.mock.patch("kinozal_scraper.http_fetch._validator_store", return_value=None),
+            unittest.mock.patch("kinozal_scraper.http_fetch._POOL.get", return_value=_ok_html()),
+        ):
+            fetch_html("https://a.example/")
+        self.assertEqual(transport_summary_lines(), [])
 
 
 if __name__ == "__main__":
     unittest.main()
+
+
+class TestPrefetch(unittest.TestCase):
+    def test_results_come_back_in_item_order_with_failures_in_place(self) -> None:
+        def _fetch(n: int) -> int:
+            if n == 2:
+                raise RuntimeError("boom")
+            return n * 10
+
+        futures = list(prefetch(_fetch, [1, 2, 3]))
+        self.assertEqual(futures[0].result(), 10)
+        self.assertIsInstance(futures[1].exception(), RuntimeError)
+        self.assertEqual(futures[2].result(), 30)
+
+    def test_ahead_bounds_the_fetches_started_beyond_the_one_yielded(self) -> None:
+        started: list[int] = []
+        lock = threading.Lock()
+
+        def _fetch(n: int) -> int:
+            with lock:
+                started.append(n)
+            return n
+
+        futures = prefetch(_fetch, list(range(6)), ahead=2)
+        first = next(futures)
+        self.assertEqual(first.result(), 0)
+        with lock:
+            self.assertLessEqual(set(started), {0, 1, 2})
+        self.assertEqual([f.result() for f in futures], [1, 2, 3, 4, 5])
+
+    def test_ahead_zero_fetches_on_the_consumers_thread_when_asked(self) -> None:
+        threads: list[str] = []
+
+        def _fetch(n: int) -> int:
+            threads.append(threading.current_thread().name)
+            if n == 1:
+                raise RuntimeError("boom")
+            return n
+
+        futures = prefetch(_fetch, [0, 1], ahead=0)
+        self.assertEqual(threads, [])
+        self.assertEqual(next(futures).result(), 0)
+        self.assertIsInstance(next(futures).exception(), RuntimeError)
+        self.assertEqual(threads, [threading.current_thread().name] * 2)
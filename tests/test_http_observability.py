@@ -0,0 +1,156 @@
+"""Tests for `http_observability.py` — the `http_call` breadcrumb and latency summary.
+
+Covers timer extraction from curl_cffi `infos` and from a `requests`-style `elapsed`,
+the breadcrumb fields (status, attempt, bytes, outcome) on success, HTTP error and
+transport error, attempt numbering through the real retry policy, and the per-host
+p50/p95 summary lines.
+"""
+
+from __future__ import annotations
+
+import datetime
+import unittest
+import unittest.mock
+from types import SimpleNamespace
+
+from curl_cffi import CurlInfo
+from curl_cffi.requests.exceptions import HTTPError as CurlHTTPError
+from curl_cffi.requests.exceptions import Timeout as CurlTimeout
+
+from kinozal_scraper.http_fetch import fetch_html
+from kinozal_scraper.http_observability import (
+    HTTP_CALLS,
+    HttpCallStats,
+    HttpTiming,
+    extract_timing,
+    observe_http,
+)
+
+_LOGGER = "kinozal_scraper.http_observability"
+
+
+class TestExtractTiming(unittest.TestCase):
+    def test_curl_infos_become_milliseconds(self) -> None:
+        resp = SimpleNamespace(
+            infos={
+                CurlInfo.NAMELOOKUP_TIME: 0.004,
+                CurlInfo.CONNECT_TIME: 0.020,
+                CurlInfo.APPCONNECT_TIME: 0.080,
+                CurlInfo.STARTTRANSFER_TIME: 0.350,
+            }
+        )
+        self.assertEqual(
+            extract_timing(resp),
+            HttpTiming(dns_ms=4.0, connect_ms=20.0, tls_ms=80.0, ttfb_ms=350.0),
+        )
+
+    def test_requests_response_reports_only_ttfb(self) -> None:
+        resp = SimpleNamespace(elapsed=datetime.timedelta(milliseconds=250))
+        self.assertEqual(
+            extract_timing(resp),
+            HttpTiming(dns_ms=None, connect_ms=None, tls_ms=None, ttfb_ms=250.0),
+        )
+
+    def test_unknown_shape_is_unmeasured_not_a_crash(self) -> None:
+        timing = extract_timing(unittest.mock.Mock(spec=[]))
+        self.assertEqual(timing, HttpTiming(None, None, None, None))
+
+
+class TestObserveHttp(unittest.TestCase):
+    url = "https://kinozal.tv/top.php"
+
+    def test_success_line_carries_status_bytes_and_phases(self) -> None:
+        resp = SimpleNamespace(
+            status_code=200,
+            content=b"x" * 1234,
+            infos={CurlInfo.STARTTRANSFER_TIME: 0.4},
+        )
+        with self.assertLogs(_LOGGER, level="INFO") as logs, observe_http(self.url) as call:
+            call.response = resp
+        line = logs.output[0]
+        for field in ("host=kinozal.tv", "status=200", "attempt=1", "bytes=1234", "ttfb_ms=400"):
+            self.assertIn(field, line)
+        self.assertIn("dns_ms=None", line)  # not requested → not measured, never 0
+        self.assertTrue(line.endswith("outcome=ok"))
+
+    def test_streaming_caller_reports_its_own_byte_count(self) -> None:
+        with self.assertLogs(_LOGGER, level="INFO") as logs, observe_http(self.url) as call:
+            call.response = SimpleNamespace(status_code=200, content=b"")
+            call.size = 98765
+        self.assertIn("bytes=98765", logs.output[0])
+
+    def test_errors_propagate_and_name_the_outcome(self) -> None:
+        answered = SimpleNamespace(status_code=503, content=b"down")
+        for exc, response, expected in (
+            (CurlHTTPError("HTTP Error 503", 0, answered), answered, "status=503"),
+            (CurlTimeout("slow"), None, "status=None"),
+        ):
+            with (
+                self.subTest(exc=type(exc).__name__),
+                self.assertLogs(_LOGGER, level="INFO") as logs,
+                self.assertRaises(type(exc)),
+                observe_http(self.url) as call,
+            ):
+                call.response = response
+                raise exc
+            self.assertIn(expected, logs.output[0])
+            self.assertTrue(logs.output[0].endswith(f"outcome={type(exc).__name__}"))
+
+
+class TestAttemptNumbers(unittest.TestCase):
+    @unittest.mock.patch("tenacity.nap.time.sleep")
+    def test_retried_fetch_numbers_each_attempt_then_resets(
+        self, _sleep: unittest.mock.Mock
+    ) -> None:
+        down = unittest.mock.Mock(status_code=503, headers={}, content=b"")
+        down.raise_for_status.side_effect = CurlHTTPError("HTTP Error 503", 0, down)
+        ok = unittest.mock.Mock(status_code=200, headers={}, content=b"<html>", text="<html>")
+        with (
+            unittest.mock.patch("kinozal_scraper.http_fetch._POOL.get", side_effect=[down, ok]),
+            self.assertLogs(_LOGGER, level="INFO") as logs,
+        ):
+            fetch_html("https://kinozal.tv/top.php")
+            with observe_http("https://kinozal.tv/login.php"):
+                pass  # a call outside any retry policy starts from 1 again
+        attempts = [line.split("attempt=")[1].split()[0] for line in logs.output]
+        self.assertEqual(attempts, ["1", "2", "1"])
+        self.assertEqual(len(HTTP_CALLS.summary_lines()), 1)
+
+
+class TestHttpCallStats(unittest.TestCase):
+    def test_per_host_nearest_rank_percentiles(self) -> None:
+        stats = HttpCallStats()
+        for ms in range(1, 21):
+            stats.record("kinozal.tv", float(ms * 10), float(ms))
+        stats.record("api.github.com", 300.0, None)
+        self.assertEqual(
+            stats.summary_lines(),
+            [
+                "http_latency: api.github.com n=1 p50=300ms p95=300ms",
+                "http_latency: kinozal.tv n=20 p50=100ms p95=190ms ttfb_p50=10ms ttfb_p95=19ms",
+            ],
+        )
+
+    def test_percentile_waits_for_enough_samples(self) -> None:
+        stats = HttpCallStats()
+        for ms in (100.0, 300.0, 200.0):
+            stats.record("kinozal.tv", ms, None)
+        self.assertIsNone(stats.percentile("kinozal.tv", 90, min_samples=5))
+        self.assertEqual(stats.percentile("kinozal.tv", 90), 300.0)
+        self.assertIsNone(stats.percentile("kinozal.guru", 90))
+
+    def test_percentile_leaves_failed_attempts_out(self) -> None:
+        stats = HttpCallStats()
+        for ms in (100.0, 200.0):
+            stats.record("kinozal.tv", ms, None)
+        stats.record("kinozal.tv", 30000.0, None, ok=False)
+        self.assertEqual(stats.percentile("kinozal.tv", 90), 200.0)
+        self.assertIsNone(stats.percentile("kinozal.tv", 90, min_samples=3))
+        self.assertIn("n=3", stats.summary_lines()[0])
+
+    def test_no_calls_no_lines(self) -> None:
+        self.assertEqual(HttpCallStats().summary_lines(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,6 +11,9 @@ The predicate is exercised on exceptions raised by the **real**
 stdlib `requests` have separate `HTTPError` hierarchies with no common parent;
 using the wrong status path would silently turn retry into no retry (the reality-
 anchor genre from #298/#306).
+
+The rate-limit half pins the one exception to "403/429 are not retried" on the API
+set: an advertised reset inside the budget buys exactly one retry, timed to it.
 """
 
 from __future__ import annotations
@@ -31,7 +34,9 @@ from curl_cffi.requests.models import Response as CurlResponse
 from kinozal_scraper.http_retry import (
     ANTIBOT_TRANSIENT_CODES,
     API_TRANSIENT_CODES,
+    RateLimited,
     _transient_http_predicate,
+    rate_limit_delay,
     retry_antibot_patient,
 )
 
@@ -256,5 +261,110 @@ class TestPatientPolicy(unittest.TestCase):
                 self.assertEqual(self._attempts(status), expected)
 
 
+class TestRateLimitDelay(unittest.TestCase):
+    """Reading the advertised reset off a real case-insensitive `Response.headers`."""
+
+    def _delay(self, headers: dict[str, str]) -> float | None:
+        return rate_limit_delay(make_response(429, headers=headers).headers)
+
+    @unittest.mock.patch("kinozal_scraper.http_retry.time.time", return_value=1_000.0)
+    def test_sources_of_the_delay(self, _time: unittest.mock.Mock) -> None:
+        cases = [
+            ({"Retry-After": "30"}, 30.0),
+            ({"Retry-After": "Thu, 01 Jan 1970 00:17:10 GMT"}, 30.0),
+            ({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1045"}, 45.0),
+            ({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "900"}, 0.0),
+            ({"Retry-After": "soon"}, None),
+            ({}, None),
+        ]
+        for headers, expected in cases:
+            with self.subTest(headers=headers):
+                self.assertEqual(self._delay(headers), expected)
+
+    def test_reset_without_exhausted_window_is_not_a_limit(self) -> None:
+        # GitHub sends x-ratelimit-reset on every response, a permission 403 included.
+        self.assertIsNone(self._delay({"X-RateLimit-Remaining": "7", "X-RateLimit-Reset": "9"}))
+
+
+class TestRateLimitRetry(unittest.TestCase):
+    """One retry timed to the advertised reset, within the budget — never a backoff."""
+
+    def _fetch(self, *responses: requests.Response) -> tuple[Any, unittest.mock.Mock]:
+        from kinozal_scraper.github_popular_pipeline import _fetch_json
+
+        with unittest.mock.patch(
+            "kinozal_scraper.github_popular_pipeline.requests.get", side_effect=list(responses)
+        ) as get:
+            return _fetch_json(_GITHUB_URL, {}, {}), get
+
+    @unittest.mock.patch("tenacity.nap.time.sleep")
+    def test_sleeps_exactly_until_the_reset_then_retries_once(
+        self, sleep: unittest.mock.Mock
+    ) -> None:
+        limited = make_response(429, headers={"Retry-After": "30"})
+        with self.assertLogs("kinozal_scraper.http_retry", level="WARNING") as logs:
+            data, get = self._fetch(limited, make_json_response(200, {"items": []}))
+        self.assertEqual(data, {"items": []})
+        self.assertEqual(get.call_count, 2)
+        self.assertEqual([call.args[0] for call in sleep.call_args_list], [30.0])
+        self.assertIn("resets at", logs.output[0])
+
+    @unittest.mock.patch("tenacity.nap.time.sleep")
+    def test_reset_beyond_budget_fails_fast_with_the_reset_time(
+        self, sleep: unittest.mock.Mock
+    ) -> None:
+        limited = make_response(
+            403, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "4102444800"}
+        )
+        with self.assertRaises(RateLimited) as caught:
+            self._fetch(limited)
+        self.assertIn("resets at 2100-01-01T00:00:00Z", str(caught.exception))
+        sleep.assert_not_called()
+
+    @unittest.mock.patch("tenacity.nap.time.sleep")
+    def test_second_limit_is_not_guessed_past(self, _sleep: unittest.mock.Mock) -> None:
+        limited = make_response(429, headers={"Retry-After": "5"})
+        with (
+            self.assertLogs("kinozal_scraper.http_retry", level="WARNING"),
+            self.assertRaises(RateLimited),
+        ):
+            self._fetch(limited, limited, make_json_response(200, {}))
+
+    @unittest.mock.patch("tenacity.nap.time.sleep")
+    def test_bare_429_fails_fast(self, sleep: unittest.mock.Mock) -> None:
+        with self.assertRaises(RateLimited) as caught:
+            self._fetch(make_response(429))
+        self.assertIn("no reset advertised", str(caught.exception))
+        sleep.assert_not_called()
+
+    @unittest.mock.patch("tenacity.nap.time.sleep")
+    def test_budget_is_configurable(self, sleep: unittest.mock.Mock) -> None:
+        limited = make_response(429, headers={"Retry-After": "120"})
+        with (
+            unittest.mock.patch.dict("os.environ", {"API_RATE_LIMIT_BUDGET_S": "180"}),
+            self.assertLogs("kinozal_scraper.http_retry", level="WARNING"),
+        ):
+            self._fetch(limited, make_json_response(200, {}))
+        self.assertEqual([call.args[0] for call in sleep.call_args_list], [120.0])
+
+    @unittest.mock.patch("tenacity.nap.time.sleep")
+    def test_steam_appdetails_honours_it_too(self, sleep: unittest.mock.Mock) -> None:
+        from kinozal_scraper.steam_pipeline import _fetch_appdetails
+
+        payload = {"730": {"success": True, "data": {"name": "CS"}}}
+        with (
+            unittest.mock.patch(
+                "kinozal_scraper.steam_pipeline.requests.get",
+                side_effect=[
+                    make_response(429, headers={"Retry-After": "10"}),
+                    make_json_response(200, payload),
+                ],
+            ),
+            self.assertLogs("kinozal_scraper.http_retry", level="WARNING"),
+        ):
+            self.assertEqual(_fetch_appdetails(730), {"name": "CS"})
+        self.assertEqual([call.args[0] for call in sleep.call_args_list], [10.0])
+
+
 if __name__ == "__main__":
     unittest.main()
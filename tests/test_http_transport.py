@@ -0,0 +1,188 @@
+"""Tests for `http_transport.py` — whole-run HTTP cassettes.
+
+Covers secret masking in the cassette key, a `fetch_html` recorded and then replayed
+with no session opened, the client-specific `HTTPError` of a replayed error status,
+in-order serving, misses, injected errors and latency, replayed login cookies, the
+streamed poster path, and the loud failure of a misconfigured mode.
+"""
+
+from __future__ import annotations
+
+import base64
+import gzip
+import json
+import os
+import tempfile
+import unittest
+import unittest.mock
+from pathlib import Path
+from typing import Any
+
+import requests
+from _http_doubles import make_response
+from curl_cffi import requests as curl_requests
+from curl_cffi.requests.exceptions import HTTPError as CurlHTTPError
+
+from kinozal_scraper import http_transport
+from kinozal_scraper.http_fetch import fetch_html
+from kinozal_scraper.http_transport import (
+    Cassette,
+    CassetteMissError,
+    Client,
+    cassette_key,
+    exchange,
+)
+
+_URL = "https://kinozal.tv/top.php"
+
+
+def _entry(request: str, status: int = 200, body: bytes = b"", **extra: Any) -> dict[str, Any]:
+    return {
+        "request": request,
+        "status": status,
+        "headers": {},
+        "body": base64.b64encode(body).decode("ascii"),
+        **extra,
+    }
+
+
+class _CassetteDir(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.path = self.dir / "cassette.jsonl.gz"
+        self.addCleanup(http_transport._active.cache_clear)
+
+    def _mode(self, mode: str, **env: str) -> None:
+        patcher = unittest.mock.patch.dict(
+            os.environ,
+            {http_transport.MODE_ENV: mode, http_transport.CASSETTE_DIR_ENV: str(self.dir), **env},
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        http_transport._active.cache_clear()
+
+    def _write(self, *entries: dict[str, Any]) -> None:
+        with self.path.open("ab") as out:
+            for entry in entries:
+                out.write(gzip.compress((json.dumps(entry) + "\n").encode("utf-8")))
+
+    def _replay(self, **kwargs: Any) -> Cassette:
+        return Cassette(self.path, replay=True, **kwargs)
+
+
+class TestCassetteKey(unittest.TestCase):
+    def test_bot_token_and_key_params_are_masked(self) -> None:
+        self.assertEqual(
+            cassette_key("post", "https://api.telegram.org/bot123:AbC-d_e/sendMessage"),
+            "POST https://api.telegram.org/botREDACTED/sendMessage",
+        )
+        self.assertEqual(
+            cassette_key("GET", "https://api.example/x?api_key=s3cret&q=1"),
+            "GET https://api.example/x?api_key=REDACTED&q=1",
+        )
+
+    def test_params_merge_into_a_sorted_query(self) -> None:
+        self.assertEqual(
+            cassette_key("GET", "https://store.example/api?x=1", {"filters": "basic", "appids": 7}),
+            "GET https://store.example/api?appids=7&filters=basic&x=1",
+        )
+
+
+class TestRecordThenReplay(_CassetteDir):
+    def test_fetch_html_replays_without_opening_a_session(self) -> None:
+        live = make_response(
+            200,
+            body=b"<html>top</html>",
+            content_type="text/html; charset=utf-8",
+            headers={"Set-Cookie": "uid=s3cret"},
+        )
+        self._mode("record")
+        session = unittest.mock.Mock()
+        session.get.return_value = live
+        with (
+            unittest.mock.patch("kinozal_scraper.http_fetch._POOL._acquire", return_value=session),
+            self.assertLogs("kinozal_scraper.http_transport", level="INFO"),
+        ):
+            self.assertEqual(fetch_html(_URL), "<html>top</html>")
+        self.assertNotIn(b"s3cret", gzip.decompress(self.path.read_bytes()))
+
+        self._mode("replay")
+        with (
+            unittest.mock.patch(
+                "kinozal_scraper.http_fetch._POOL._acquire", side_effect=AssertionError("network")
+            ),
+            self.assertLogs("kinozal_scraper.http_transport", level="INFO"),
+        ):
+            self.assertEqual(fetch_html(_URL), "<html>top</html>")
+
+    def test_streamed_recording_hands_back_a_readable_copy(self) -> None:
+        self._mode("record")
+        live = unittest.mock.Mock(status_code=200, headers={}, cookies={}, encoding=None)
+        live.iter_content.return_value = iter([b"\xff\xd8", b"jpeg"])
+        with self.assertLogs("kinozal_scraper.http_transport", level="INFO"):
+            resp = exchange("GET", _URL, lambda: live, client="curl_cffi", stream=True)
+        live.close.assert_called_once()
+        self.assertEqual(b"".join(resp.iter_content()), b"\xff\xd8jpeg")
+
+
+class TestReplay(_CassetteDir):
+    def test_error_status_raises_the_clients_own_http_error(self) -> None:
+        key = cassette_key("GET", _URL)
+        self._write(_entry(key, 503))
+        cases: list[tuple[Client, type[Exception]]] = [
+            ("curl_cffi", CurlHTTPError),
+            ("requests", requests.HTTPError),
+        ]
+        for client, expected in cases:
+            with self.subTest(client=client), self.assertLogs(level="INFO"):
+                entry, _ = self._replay().next_entry(key)
+                with self.assertRaises(expected):
+                    http_transport.CassetteResponse(entry, client).raise_for_status()
+
+    def test_serves_in_order_then_repeats_the_last(self) -> None:
+        key = cassette_key("GET", _URL)
+        self._write(_entry(key, 503), _entry(key, 200, b"ok"))
+        with self.assertLogs(level="INFO"):
+            cassette = self._replay()
+        statuses = [cassette.next_entry(key)[0]["status"] for _ in range(3)]
+        self.assertEqual(statuses, [503, 200, 200])
+
+    def test_unrecorded_request_is_a_miss_not_a_network_call(self) -> None:
+        self._write(_entry(cassette_key("GET", _URL)))
+        self._mode("replay")
+        with self.assertLogs(level="INFO"), self.assertRaises(CassetteMissError):
+            exchange("GET", "https://kinozal.tv/other", self.fail, client="curl_cffi")
+
+    def test_injected_errors_and_scaled_latency(self) -> None:
+        key = cassette_key("GET", _URL)
+        self._write(_entry(key, 200, b"ok", elapsed_ms=400.0))
+        with self.assertLogs(level="INFO"):
+            cassette = self._replay(latency_scale=0.5, error_rate=1.0)
+            entry, delay = cassette.next_entry(key)
+        self.assertEqual((entry["status"], delay), (503, 0.2))
+
+    def test_replayed_login_fills_the_session_jar(self) -> None:
+        takelogin = "https://kinozal.guru/takelogin.php"
+        self._write(_entry(cassette_key("POST", takelogin), 302, cookies=["pass", "uid"]))
+        self._mode("replay")
+        session: curl_requests.Session = curl_requests.Session()
+        self.addCleanup(session.close)
+        with self.assertLogs(level="INFO"):
+            exchange("POST", takelogin, self.fail, client="curl_cffi", jar=session.cookies)
+        self.assertEqual(sorted(dict(session.cookies)), ["pass", "uid"])
+
+
+class TestMisconfiguration(_CassetteDir):
+    def test_unknown_mode_or_missing_dir_raises(self) -> None:
+        self._mode("replya")
+        with self.assertRaisesRegex(ValueError, "HTTP_TRANSPORT_MODE"):
+            exchange("GET", _URL, self.fail, client="curl_cffi")
+        self._mode("record", HTTP_CASSETTE_DIR="")
+        with self.assertRaisesRegex(ValueError, "HTTP_CASSETTE_DIR"):
+            exchange("GET", _URL, self.fail, client="curl_cffi")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,10 +5,25 @@ tests/test_http_fetch.py). The login-success / redirect-to-login detection
 logic is NOT mocked — that is the internal behaviour under test (§II).
 """
 
+import os
+import tempfile
 import unittest
 import unittest.mock
 
-from kinozal_scraper.kinozal_auth import KinozalLoginError, fetch_authenticated, login
+from cryptography.fernet import Fernet
+from curl_cffi import requests
+from curl_cffi.requests.exceptions import Timeout as CurlTimeout
+
+from kinozal_scraper import kinozal_auth
+from kinozal_scraper.host_governor import _FAILURE_THRESHOLD, GOVERNOR, CircuitOpenError
+from kinozal_scraper.kinozal_auth import (
+    KinozalLoginError,
+    discard_session,
+    fetch_authenticated,
+    load_session,
+    login,
+    save_session,
+)
 
 
 def _resp(
@@ -82,6 +97,18 @@ class TestKinozalLogin(unittest.TestCase):
         self.assertEqual(kwargs["data"]["username"], "alice")
         self.assertEqual(kwargs["data"]["password"], "secret")
 
+    def test_login_to_a_mirror_that_keeps_failing_is_refused_without_a_request(self) -> None:
+        with self.assertLogs("kinozal_scraper.host_governor", level="WARNING"):
+            for _ in range(_FAILURE_THRESHOLD):
+                GOVERNOR.after("https://kinozal.guru/top.php", CurlTimeout("down"))
+        sess = _session(cookies={"someauth": "v"})
+        with (
+            unittest.mock.patch("kinozal_scraper.kinozal_auth.requests.Session", return_value=sess),
+            self.assertRaises(CircuitOpenError),
+        ):
+            login("user", "pass")
+        sess.post.assert_not_called()
+
 
 class TestAuthenticatedFetch(unittest.TestCase):
     def test_redirect_to_login_raises_login_error(self) -> None:
@@ -109,5 +136,73 @@ class TestAuthenticatedFetch(unittest.TestCase):
             fetch_authenticated(sess, "https://kinozal.guru/top.php")
 
 
+class TestSessionPersistence(unittest.TestCase):
+    """The saved jar round-trips through a real `local_store` under a temp `STATE_DIR`;
+    only the cipher key varies."""
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.state_dir = tmp.name
+        self.addCleanup(kinozal_auth._session_persistence.cache_clear)
+
+    def _persist_with(self, key: str) -> None:
+        patcher = unittest.mock.patch.dict(
+            os.environ, {"STATE_DIR": self.state_dir, kinozal_auth.SESSION_KEY_ENV: key}
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        kinozal_auth._session_persistence.cache_clear()
+
+    def _logged_in(self) -> requests.Session:
+        session: requests.Session = requests.Session()
+        self.addCleanup(session.close)
+        session.cookies.set("uid", "42", ".kinozal.guru", "/")
+        session.cookies.set("pass", "s3cret", ".kinozal.guru", "/")
+        return session
+
+    def test_saved_jar_comes_back_in_a_fresh_session(self) -> None:
+        self._persist_with(Fernet.generate_key().decode())
+        save_session(self._logged_in())
+        restored = load_session()
+        assert restored is not None
+        self.addCleanup(restored.close)
+        jar = {(c.name, c.value, c.domain, c.path) for c in restored.cookies.jar}
+        self.assertEqual(
+            jar, {("uid", "42", ".kinozal.guru", "/"), ("pass", "s3cret", ".kinozal.guru", "/")}
+        )
+
+    def test_jar_is_not_stored_in_the_clear(self) -> None:
+        self._persist_with(Fernet.generate_key().decode())
+        save_session(self._logged_in())
+        persistence = kinozal_auth._session_persistence()
+        assert persistence is not None
+        token = persistence[1].get(kinozal_auth._SESSION_KEY)
+        assert token is not None
+        self.assertNotIn(b"s3cret", token)
+
+    def test_rotated_key_logs_in_afresh_instead_of_failing(self) -> None:
+        self._persist_with(Fernet.generate_key().decode())
+        save_session(self._logged_in())
+        self._persist_with(Fernet.generate_key().decode())
+        with self.assertLogs("kinozal_scraper.kinozal_auth", level="WARNING") as logs:
+            self.assertIsNone(load_session())
+        self.assertIn("logging in afresh", logs.output[0])
+
+    def test_discarded_session_is_gone(self) -> None:
+        self._persist_with(Fernet.generate_key().decode())
+        save_session(self._logged_in())
+        discard_session()
+        self.assertIsNone(load_session())
+
+    def test_missing_or_malformed_key_disables_persistence(self) -> None:
+        self._persist_with("")
+        save_session(self._logged_in())
+        self.assertIsNone(load_session())
+        self._persist_with("not-a-fernet-key")
+        with self.assertLogs("kinozal_scraper.kinozal_auth", level="WARNING"):
+            self.assertIsNone(load_session())
+
+
 if __name__ == "__main__":
     unittest.main()
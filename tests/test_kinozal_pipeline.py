@@ -6,15 +6,21 @@ quota stop, the genre filter, notification content and delivery truthfulness,
 and the exit-code surface.
 """
 
+import importlib.util
 import logging
 import os
 import re
+import tempfile
+import threading
+import time
 import unittest
 import unittest.mock
+from pathlib import Path
 from typing import Any
 
 import kinozal_scraper.kinozal_pipeline as kp
 from kinozal_scraper.generic_pipeline import NormalizedItem, PipelineResult, extract_from_html
+from kinozal_scraper.http_observability import HTTP_CALLS
 from kinozal_scraper.kinozal_auth import KinozalLoginError
 from kinozal_scraper.kinozal_pipeline import (
     _TRAILER_ERROR_MARKER,
@@ -26,6 +32,7 @@ from kinozal_scraper.kinozal_pipeline import (
     enrich_with_trailer,
     run_kinozal_pipeline,
 )
+from kinozal_scraper.local_store import LocalStore
 from kinozal_scraper.pipeline_config import load_sources_config
 from kinozal_scraper.sheets_storage import InMemoryStorage
 from kinozal_scraper.telegram_notifier import InMemoryNotifier
@@ -33,6 +40,7 @@ from kinozal_scraper.text_utils import original_title
 from kinozal_scraper.text_utils import title_year_matches as _title_year_matches
 from kinozal_scraper.trailer_strategy import Candidate, FilmProfile
 from kinozal_scraper.youtube import YoutubeQuotaExhausted
+from kinozal_scraper.youtube_quota import QuotaLedger
 
 # ── minimal synthetic HTML matching kinozal_movies row_selector ──────────────
 
@@ -259,6 +267,59 @@ class TestEnrichWithTrailer(unittest.TestCase):
 # ── _kinozal_title ────────────────────────────────────────────────────────────
 
 
+class TestTrailerCache(unittest.TestCase):
+    """With a store, a film searched on an earlier run is answered without YouTube:
+    a pick for the long TTL, a miss for the short one, and an error never."""
+
+    _PROFILE = FilmProfile(ru_title="Гнев", original_title="Man on Fire", year=2026)
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.store = LocalStore(Path(tmp.name) / "state.sqlite3", "kinozal_trailers")
+        self.addCleanup(self.store.close)
+        patcher = unittest.mock.patch.object(kp, "_trailer_store", return_value=self.store)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _select(self, youtube: Any) -> str:
+        with self.assertLogs("kinozal_scraper.kinozal_pipeline", level="INFO"):
+            return kp.select_trailer(self._PROFILE, youtube)
+
+    def test_stored_pick_skips_the_search(self) -> None:
+        first = self._select(_PoolYoutube([Candidate("ru01", "Гнев 2026 трейлер")]))
+        again = self._select(_RaisingRetrieval())
+        self.assertEqual(again, first)
+        self.assertEqual(
+            kp.cache_summary_lines(), ["kinozal_trailer_cache: hit=1 miss=1 hit_rate=50%"]
+        )
+
+    def test_miss_is_stored_with_the_shorter_ttl(self) -> None:
+        with unittest.mock.patch.object(self.store, "put_json", wraps=self.store.put_json) as put:
+            self.assertEqual(self._select(_PoolYoutube([])), _TRAILER_MISS_MARKER)
+        self.assertEqual(put.call_args.kwargs["ttl_s"], kp._TRAILER_CACHE_MISS_TTL_S)
+        self.assertEqual(self._select(_RaisingRetrieval()), _TRAILER_MISS_MARKER)
+
+    def test_retrieval_error_is_not_stored(self) -> None:
+        self.assertEqual(self._select(_RaisingRetrieval()), _TRAILER_ERROR_MARKER)
+        self.assertEqual(len(self.store), 0)
+
+    def test_stored_pick_is_served_after_the_quota_is_gone(self) -> None:
+        first = self._select(_PoolYoutube([Candidate("ru01", "Гнев 2026 трейлер")]))
+        cached = NormalizedItem(dedupe_key="Гнев", title="Гнев", source_id="kinozal_series")
+        cached.raw["kinozal_raw_title"] = "Гнев / Man on Fire / 2026 / WEB-DLRip"
+        uncached = NormalizedItem(dedupe_key="Дюна", title="Дюна", source_id="kinozal_movies")
+        uncached.raw["kinozal_raw_title"] = "Дюна / Dune / 2021 / BDRip"
+        ledger = unittest.mock.Mock(spec=QuotaLedger)
+        ledger.exhausted.return_value = True
+        youtube = _CountingYoutube(fail_from=0, raises=YoutubeQuotaExhausted("429"))
+        with self.assertLogs("kinozal_scraper.kinozal_pipeline", level="INFO"):
+            kp._enrich_trailers([cached, uncached], youtube, ledger)
+        self.assertEqual(youtube.calls, 0)
+        self.assertEqual(cached.trailer_url, first)
+        self.assertEqual(uncached.trailer_url, _TRAILER_QUOTA_MARKER)
+
+
 class TestKinozalTitle(unittest.TestCase):
     def test_strips_metadata(self) -> None:
         raw = "Гнев (1 сезон: 1-7 серии из 7) / Man on Fire / 2026 / ДБ (Videofilm Int.), CT / WEB-DLRip"
@@ -650,6 +711,89 @@ class TestPipelineFailureIsolation(unittest.TestCase):
         self.assertEqual(notifier.sent, [])
 
 
+class TestListingFetchedOncePerUrl(unittest.TestCase):
+    """Every source extracts from one download per listing URL, the URLs fetched in
+    parallel, and a failed URL is still an error in each source that reads it."""
+
+    _TOP = "https://kinozal.tv/top.php"
+    _NEW = "https://kinozal.tv/new.php"
+
+    def test_sources_share_each_download_and_its_failure(self) -> None:
+        both_in_flight = threading.Barrier(2, timeout=5)
+
+        def _listing(url: str) -> tuple[str, str]:
+            both_in_flight.wait()
+            if url == self._NEW:
+                raise RuntimeError("522")
+            return _KINOZAL_HTML, "https://kinozal.tv"
+
+        fetcher = unittest.mock.Mock(spec=kp.Kinozal)
+        fetcher.fetch_listing.side_effect = _listing
+        sources = [_KINOZAL_SOURCE, {**_KINOZAL_SOURCE, "id": "kinozal_series"}]
+        with self.assertLogs("kinozal_scraper.kinozal_pipeline", level="ERROR") as logs:
+            items, results = kp._fetch_and_extract(sources, [self._TOP, self._NEW], fetcher)
+
+        self.assertEqual(
+            sorted(c.args[0] for c in fetcher.fetch_listing.call_args_list), [self._NEW, self._TOP]
+        )
+        self.assertEqual(len(items), 4)  # two items of the good listing, per source
+        for result in results:
+            self.assertEqual(result.errors, [f"fetch failed for {self._NEW}: 522"])
+        self.assertEqual(len(logs.output), 2)
+
+
+def _listing_html(titles: list[str]) -> str:
+    rows = "".join(
+        f'<a href="/details.php?id={i}" title="{title} / 2024 / BDRip"></a>'
+        for i, title in enumerate(titles)
+    )
+    return f"<html><body>{rows}</body></html>"
+
+
+class TestIncrementalScan(unittest.TestCase):
+    """`incremental_stop_after: K` stops a listing at its K-th already-stored row in a
+    row; `KINOZAL_FULL_SCAN=1` reads every row regardless."""
+
+    _URL = "https://kinozal.tv/browse.php"
+    _TITLES = ["New A", "Seen 1", "New B", "Seen 2", "Seen 3", "New C", "Seen 4"]
+    _STORED = {"Seen 1 / 2024", "Seen 2 / 2024", "Seen 3 / 2024", "Seen 4 / 2024"}
+
+    def _source(self) -> dict[str, Any]:
+        return {**_KINOZAL_SOURCE, "incremental_stop_after": 2}
+
+    def _extract(self, existing: set[str] | None) -> list[str]:
+        fetcher = unittest.mock.Mock(spec=kp.Kinozal)
+        fetcher.fetch_listing.return_value = (_listing_html(self._TITLES), "https://kinozal.tv")
+        items, _ = kp._fetch_and_extract([self._source()], [self._URL], fetcher, existing)
+        return [item.title for item in items]
+
+    def test_stops_after_k_consecutive_stored_rows(self) -> None:
+        with self.assertLogs("kinozal_scraper.kinozal_pipeline", level="INFO") as logs:
+            titles = self._extract(self._STORED)
+        # "Seen 1" alone is not a run; "Seen 2", "Seen 3" is, so "New C" is never read.
+        self.assertEqual(titles, ["New A", "Seen 1", "New B", "Seen 2", "Seen 3"])
+        self.assertIn("scanned 5 of 7 rows", logs.output[0])
+
+    def test_without_stored_keys_every_row_is_read(self) -> None:
+        self.assertEqual(len(self._extract(None)), len(self._TITLES))
+
+    def test_stored_keys_are_read_only_for_an_opted_in_source(self) -> None:
+        storage = unittest.mock.Mock(spec=InMemoryStorage)
+        storage.get_existing_keys.return_value = self._STORED
+        self.assertIsNone(kp._incremental_existing_keys([_KINOZAL_SOURCE], storage))
+        storage.get_existing_keys.assert_not_called()
+        self.assertEqual(kp._incremental_existing_keys([self._source()], storage), self._STORED)
+
+    def test_full_scan_override(self) -> None:
+        storage = InMemoryStorage()
+        with (
+            unittest.mock.patch.dict(os.environ, {"KINOZAL_FULL_SCAN": "1"}),
+            self.assertLogs("kinozal_scraper.kinozal_pipeline", level="INFO") as logs,
+        ):
+            self.assertIsNone(kp._incremental_existing_keys([self._source()], storage))
+        self.assertIn("KINOZAL_FULL_SCAN", logs.output[0])
+
+
 # ── exit-code surface (issue #97) ─────────────────────────────────────────────
 
 
@@ -985,6 +1129,50 @@ class TestQuotaStop(unittest.TestCase):
         self.assertIn(str(self._TOTAL - self._FAIL_FROM + 1), quota_warnings[0].getMessage())
 
 
+class TestTrailerPriority(unittest.TestCase):
+    """The day's quota goes to the films that matter most: configured priority terms
+    first, then newer releases. A refusal the ledger recorded earlier today stops the
+    run before its first search; notification order is untouched."""
+
+    @staticmethod
+    def _item(
+        title: str, source_id: str = "kinozal_movies", category: str | None = None
+    ) -> NormalizedItem:
+        item = NormalizedItem(dedupe_key=title, title=title, source_id=source_id)
+        item.raw["kinozal_raw_title"] = title
+        item.raw["kinozal_item_category_name"] = category
+        return item
+
+    def _enrich(self, items: list[NormalizedItem], ledger: Any = None) -> _CountingYoutube:
+        youtube = _CountingYoutube(fail_from=2, raises=YoutubeQuotaExhausted("429"))
+        with self.assertLogs("kinozal_scraper.kinozal_pipeline", level="INFO"):
+            kp._enrich_trailers(items, youtube, ledger)
+        return youtube
+
+    def test_configured_terms_then_newer_releases_get_the_quota(self) -> None:
+        old, new = self._item("Old / 2019"), self._item("New / 2025")
+        audiobook = self._item("Book / 2024", category="Другое - АудиоКниги")
+        series = self._item("Show / 2020", source_id="kinozal_series")
+        with unittest.mock.patch.dict(
+            os.environ, {"KINOZAL_TRAILER_PRIORITY": "source:kinozal_series;category:Другое"}
+        ):
+            self.assertEqual(
+                kp._enrichment_order([old, new, audiobook, series], kp._trailer_priority()),
+                [series, audiobook, new, old],
+            )
+        self._enrich([old, new])
+        self.assertIn("youtube.com", str(new.trailer_url))
+        self.assertEqual(old.trailer_url, _TRAILER_QUOTA_MARKER)
+
+    def test_refusal_recorded_today_skips_every_search(self) -> None:
+        ledger = unittest.mock.Mock(spec=QuotaLedger)
+        ledger.exhausted.return_value = True
+        items = [self._item("A / 2025"), self._item("B / 2025")]
+        youtube = self._enrich(items, ledger)
+        self.assertEqual(youtube.calls, 0)
+        self.assertEqual({item.trailer_url for item in items}, {_TRAILER_QUOTA_MARKER})
+
+
 class TestKinozalKnownBugs(unittest.TestCase):
     """Documents current behaviour for scenarios that should ideally be louder."""
 
@@ -1157,6 +1345,55 @@ class TestPipelineAuth(unittest.TestCase):
         self.assertTrue(any(not r.ok for r in results))  # primary 522 still red
 
 
+class TestSavedMirrorSession(unittest.TestCase):
+    """A session saved by an earlier run replaces the login until the mirror rejects
+    it; then one fresh login serves the rejected page and is saved in its place."""
+
+    _MIRROR_URL = "https://kinozal.guru/details.php?id=1"
+
+    def setUp(self) -> None:
+        self.saved = unittest.mock.Mock(name="saved")
+        self.fresh = unittest.mock.Mock(name="fresh")
+
+    def _fetch(self, *, load: Any, auth: Any) -> tuple[str, Any, Any, Any]:
+        with (
+            unittest.mock.patch("kinozal_scraper.kinozal_pipeline.load_session", return_value=load),
+            unittest.mock.patch(
+                "kinozal_scraper.kinozal_pipeline.login", return_value=self.fresh
+            ) as mlogin,
+            unittest.mock.patch(
+                "kinozal_scraper.kinozal_pipeline.fetch_authenticated", side_effect=auth
+            ) as mauth,
+            unittest.mock.patch("kinozal_scraper.kinozal_pipeline.save_session") as msave,
+            unittest.mock.patch("kinozal_scraper.kinozal_pipeline.discard_session") as mdiscard,
+            self.assertLogs("kinozal_scraper.kinozal_pipeline", level="INFO"),
+        ):
+            html = kp.Kinozal("u", "p").fetch_details(self._MIRROR_URL)
+        sessions = [c.args[0] for c in mauth.call_args_list]
+        return html, mlogin, sessions, (msave, mdiscard)
+
+    def test_saved_session_skips_the_login(self) -> None:
+        html, mlogin, sessions, (msave, _) = self._fetch(load=self.saved, auth=["<html>"])
+        self.assertEqual(html, "<html>")
+        mlogin.assert_not_called()
+        msave.assert_not_called()
+        self.assertEqual(sessions, [self.saved])
+
+    def test_rejected_saved_session_is_replaced_by_one_fresh_login(self) -> None:
+        html, mlogin, sessions, (msave, mdiscard) = self._fetch(
+            load=self.saved, auth=[KinozalLoginError("redirected to login"), "<html>"]
+        )
+        self.assertEqual(html, "<html>")
+        mlogin.assert_called_once()
+        mdiscard.assert_called_once()
+        msave.assert_called_once_with(self.fresh)
+        self.assertEqual(sessions, [self.saved, self.fresh])
+
+    def test_rejected_fresh_login_is_not_retried(self) -> None:
+        with self.assertRaises(KinozalLoginError):
+            self._fetch(load=None, auth=KinozalLoginError("redirected to login"))
+
+
 _POSTER_TV = "https://kinozal.tv/i/poster/2/7/2136727.jpg"
 
 
@@ -1339,6 +1576,133 @@ class TestFetchListingOrigin(unittest.TestCase):
         self.assertEqual(base, "https://kinozal.guru")
 
 
+class TestHedgedListing(unittest.TestCase):
+    """Opt-in hedging: a primary that is late (not failed) races the authenticated
+    mirror, and the winner's origin is the listing's base (#247 contract intact)."""
+
+    _URL = "https://kinozal.tv/top.php?d=14"
+
+    def setUp(self) -> None:
+        self.release = threading.Event()
+        # Worker threads must never outlive the test blocked on the event.
+        self.addCleanup(self.release.set)
+        patcher = unittest.mock.patch.object(kp, "_HEDGE_COLD_START_S", 0.05)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _slow_primary(self, *_: object) -> str:
+        self.release.wait(5)
+        return "<html>primary</html>"
+
+    def _fetch(self, *, primary: Any, mirror: Any) -> tuple[tuple[str, str], Any, Any]:
+        with (
+            unittest.mock.patch("kinozal_scraper.kinozal_pipeline.fetch_html", side_effect=primary),
+            unittest.mock.patch(
+                "kinozal_scraper.kinozal_pipeline.login", return_value=unittest.mock.Mock()
+            ) as mlogin,
+            unittest.mock.patch(
+                "kinozal_scraper.kinozal_pipeline.fetch_authenticated", side_effect=mirror
+            ) as mauth,
+        ):
+            result = kp.Kinozal("u", "p", hedge_percentile=90).fetch_listing(self._URL)
+        return result, mlogin, mauth
+
+    def test_slow_primary_is_beaten_by_the_mirror(self) -> None:
+        result, mlogin, mauth = self._fetch(
+            primary=self._slow_primary, mirror=lambda *_: "<html>mirror</html>"
+        )
+        self.assertEqual(result, ("<html>mirror</html>", "https://kinozal.guru"))
+        mlogin.assert_called_once()
+        self.assertEqual(mauth.call_args[0][1], "https://kinozal.guru/top.php?d=14")
+
+    def test_fast_primary_never_logs_in(self) -> None:
+        result, mlogin, mauth = self._fetch(primary=lambda _: "<html>tv</html>", mirror=None)
+        self.assertEqual(result, ("<html>tv</html>", "https://kinozal.tv"))
+        mlogin.assert_not_called()
+        mauth.assert_not_called()
+
+    def test_failed_mirror_leaves_the_late_primary_to_answer(self) -> None:
+        def _mirror(*_: object) -> str:
+            self.release.set()
+            raise RuntimeError("mirror 500")
+
+        result, _, _ = self._fetch(primary=self._slow_primary, mirror=_mirror)
+        self.assertEqual(result, ("<html>primary</html>", "https://kinozal.tv"))
+
+    def test_delay_is_the_runs_percentile_once_samples_exist(self) -> None:
+        for _ in range(5):
+            HTTP_CALLS.record("kinozal.tv", 20.0, None)
+        with self.assertLogs("kinozal_scraper.kinozal_pipeline", level="INFO") as logs:
+            self._fetch(primary=self._slow_primary, mirror=lambda *_: "<html>mirror</html>")
+        self.assertTrue(any("slower than 0.0s (p90)" in line for line in logs.output))
+
+    def test_listings_hedge_on_the_percentile_of_earlier_runs(self) -> None:
+        # The listings are the run's first kinozal.tv requests: only the stored
+        # history of earlier runs can give them a percentile to wait for.
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        store = LocalStore(Path(tmp.name) / "state.sqlite3", "kinozal_latency")
+        self.addCleanup(store.close)
+        store.put_json("kinozal.tv", [20.0] * 5)
+        with (
+            unittest.mock.patch.object(kp, "_latency_store", return_value=store),
+            unittest.mock.patch.object(kp, "_HEDGE_COLD_START_S", 5.0),
+            unittest.mock.patch(
+                "kinozal_scraper.kinozal_pipeline.fetch_html", side_effect=self._slow_primary
+            ),
+            unittest.mock.patch("kinozal_scraper.kinozal_pipeline.login"),
+            unittest.mock.patch(
+                "kinozal_scraper.kinozal_pipeline.fetch_authenticated",
+                return_value="<html>mirror</html>",
+            ),
+            self.assertLogs("kinozal_scraper.kinozal_pipeline", level="INFO") as logs,
+        ):
+            listings = kp._fetch_listings([self._URL], kp.Kinozal("u", "p", hedge_percentile=90))
+        self.assertEqual(listings[self._URL], ("<html>mirror</html>", "https://kinozal.guru"))
+        self.assertTrue(any("slower than 0.0s (p90)" in line for line in logs.output))
+
+    def test_a_runs_successful_latencies_are_kept_for_the_next(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        store = LocalStore(Path(tmp.name) / "state.sqlite3", "kinozal_latency")
+        self.addCleanup(store.close)
+        store.put_json("kinozal.tv", [float(ms) for ms in range(49)])
+        HTTP_CALLS.record("kinozal.tv", 100.0, None)
+        HTTP_CALLS.record("kinozal.tv", 200.0, None)
+        HTTP_CALLS.record("kinozal.tv", 30000.0, None, ok=False)
+        with unittest.mock.patch.object(kp, "_latency_store", return_value=store):
+            kp._remember_listing_latencies()
+        self.assertEqual(store.get_json("kinozal.tv"), [*range(1, 49), 100.0, 200.0])
+
+    def test_details_wait_for_the_primary_unhedged(self) -> None:
+        def _primary(*_: object) -> str:
+            time.sleep(0.2)
+            return "<html>tv</html>"
+
+        with (
+            unittest.mock.patch(
+                "kinozal_scraper.kinozal_pipeline.fetch_html", side_effect=_primary
+            ),
+            unittest.mock.patch("kinozal_scraper.kinozal_pipeline.login") as mlogin,
+            unittest.mock.patch("kinozal_scraper.kinozal_pipeline.fetch_authenticated") as mauth,
+        ):
+            html = kp.Kinozal("u", "p", hedge_percentile=90).fetch_details(
+                "https://kinozal.tv/details.php?id=1"
+            )
+        self.assertEqual(html, "<html>tv</html>")
+        mlogin.assert_not_called()
+        mauth.assert_not_called()
+
+    def test_from_env_rejects_an_out_of_range_percentile(self) -> None:
+        with (
+            unittest.mock.patch.dict(os.environ, {"KINOZAL_HEDGE_PERCENTILE": "100"}),
+            self.assertLogs("kinozal_scraper.kinozal_pipeline", level="WARNING") as logs,
+        ):
+            kinozal = kp.Kinozal.from_env()
+        self.assertIsNone(kinozal._hedge_percentile)
+        self.assertIn("KINOZAL_HEDGE_PERCENTILE", logs.output[0])
+
+
 class TestLinkOriginFollowsHost(unittest.TestCase):
     """End-to-end (#247): notification links resolve against the host that served
     the listing. Injection stays on the HTTP boundary (fetch_html / login /
@@ -1424,7 +1788,7 @@ def _details_html(genre: str, *, cast: str = "", director: str = "", description
 
     #140 extends the same tag-wrapped `<b>Label:</b> … <br>` shape to
     cast / director / plot labels so the shared
-    `_parse_labeled_field` is exercised against markup of the same family as
+    `DetailsPage.field` is exercised against markup of the same family as
     genre label—no parallel saved-HTML fixture."""
     rows = ["<b>Год выпуска:</b> 2024<br>"]
     if director:
@@ -1454,12 +1818,12 @@ _MOVIE_B_KEY = "Movie B / 2025"
 
 
 class TestParseGenre(unittest.TestCase):
-    """`_parse_genre` reads the genre value from a details page (pure)."""
+    """`DetailsPage.genre` reads the genre value from a details page (pure)."""
 
     def test_extracts_tag_wrapped_genre_as_plain_text(self) -> None:
         # Real markup wraps the value in <span>; must return visible text, never
         # the raw '<span ...>' HTML (would break denylist matching).
-        result = kp._parse_genre(_details_html("Hidden objects"))
+        result = kp.DetailsPage(_details_html("Hidden objects")).genre
         self.assertEqual(result, "Hidden objects")
         self.assertNotIn("<span", result)
 
@@ -1471,14 +1835,15 @@ class TestParseGenre(unittest.TestCase):
             '<span class="lnks_tobrs">триллер</span><br>'
             "<b>Разработчик:</b> X</h2></body></html>"
         )
-        parsed = kp._parse_genre(html)
+        parsed = kp.DetailsPage(html).genre
         self.assertIn("боевик", parsed)
         self.assertIn("триллер", parsed)
         # And the parsed value must be matchable by the denylist splitter.
         self.assertTrue(kp._genre_excluded(parsed, {"триллер"}))
 
     def test_returns_empty_when_no_genre_field(self) -> None:
-        self.assertEqual(kp._parse_genre("<html><body><h2>no genre here</h2></body></html>"), "")
+        page = kp.DetailsPage("<html><body><h2>no genre here</h2></body></html>")
+        self.assertEqual(page.genre, "")
 
 
 class TestGenreMatching(unittest.TestCase):
@@ -1499,20 +1864,20 @@ class TestGenreMatching(unittest.TestCase):
 
 
 class TestParseLabeledField(unittest.TestCase):
-    """`_parse_labeled_field` is the shared sibling walk for `<b>Label:</b> … <br>`,
-    from which `_parse_genre` is factored (§II—no four copies of br/b termination)."""
+    """`DetailsPage.field` is the shared sibling walk for `<b>Label:</b> … <br>`,
+    from which `genre` is factored (§II—no four copies of br/b termination)."""
 
     def test_reads_tag_wrapped_value(self) -> None:
         html = _details_html("боевик", cast="Дензел Вашингтон")
-        self.assertEqual(kp._parse_labeled_field(html, "В ролях"), "Дензел Вашингтон")
+        self.assertEqual(kp.DetailsPage(html).field("В ролях"), "Дензел Вашингтон")
 
     def test_missing_label_returns_empty(self) -> None:
-        self.assertEqual(kp._parse_labeled_field(_details_html("боевик"), "В ролях"), "")
+        self.assertEqual(kp.DetailsPage(_details_html("боевик")).field("В ролях"), "")
 
 
 class TestParseDetailsMetadata(unittest.TestCase):
-    """`_parse_details_metadata` collects cast/director/genre/description from details.php
-    through shared `_parse_labeled_field`."""
+    """`DetailsPage.metadata` collects cast/director/genre/description from details.php
+    through the shared `field`, parsing the page once."""
 
     def test_parses_cast_director_description(self) -> None:
         html = _details_html(
@@ -1521,7 +1886,7 @@ class TestParseDetailsMetadata(unittest.TestCase):
             director="Тони Скотт",
             description="Бывший агент защищает девочку.",
         )
-        meta = kp._parse_details_metadata(html)
+        meta = kp.DetailsPage(html).metadata()
         self.assertEqual(meta["director"], "Тони Скотт")
         self.assertEqual(meta["genre"], "боевик")
         self.assertEqual(meta["description"], "Бывший агент защищает девочку.")
@@ -1530,11 +1895,35 @@ class TestParseDetailsMetadata(unittest.TestCase):
 
     def test_missing_field_yields_empty(self) -> None:
         # Absence of ONE field while others exist is normal (empty, no exception).
-        meta = kp._parse_details_metadata(_details_html("боевик", director="Тони Скотт"))
+        meta = kp.DetailsPage(_details_html("боевик", director="Тони Скотт")).metadata()
         self.assertEqual(meta["cast"], [])
         self.assertEqual(meta["director"], "Тони Скотт")
 
 
+class TestDetailsPage(unittest.TestCase):
+    """One page is parsed once however many fields are read (the filter reads the
+    category and genre, the profile the rest), and lxml reads what html.parser reads."""
+
+    _HTML = _details_html("боевик", cast="А, Б", director="В", description="Г")
+
+    def test_every_field_reads_one_soup(self) -> None:
+        with unittest.mock.patch.object(kp, "BeautifulSoup", wraps=kp.BeautifulSoup) as soup:
+            page = kp.DetailsPage(self._HTML)
+            self.assertIsNone(page.category_id)
+            self.assertEqual(page.genre, "боевик")
+            page.metadata()
+        soup.assert_called_once()
+
+    @unittest.skipUnless(importlib.util.find_spec("lxml"), "lxml is optional")
+    def test_lxml_reads_what_html_parser_reads(self) -> None:
+        for html in (self._HTML, _item_details(2, onclick=True), _item_details(2, onclick=False)):
+            stdlib = kp.DetailsPage(html, parser="html.parser")
+            lxml = kp.DetailsPage(html, parser="lxml")
+            self.assertEqual(
+                (lxml.category_id, lxml.metadata()), (stdlib.category_id, stdlib.metadata())
+            )
+
+
 class _StubFetcher:
     def __init__(self, html: str = "", exc: Exception | None = None) -> None:
         self._html = html
@@ -1729,7 +2118,7 @@ class TestItemCategory(unittest.TestCase):
     def test_category_id_parsed_from_marker_onclick_and_from_src_fallback(self) -> None:
         for onclick in (True, False):
             with self.subTest(onclick=onclick):
-                self.assertEqual(kp._parse_item_category(_item_details(2, onclick=onclick)), 2)
+                self.assertEqual(kp.DetailsPage(_item_details(2, onclick=onclick)).category_id, 2)
 
     def test_zero_or_multiple_markers_are_unknown_with_warning(self) -> None:
         for details in (
@@ -1802,6 +2191,123 @@ class TestItemCategoryDenylist(unittest.TestCase):
         self.assertIn("details fetch boom", "\n".join(logs.output))
 
 
+class TestDetailsPrefetch(unittest.TestCase):
+    """The details pages are fetched in parallel, but items are classified — and
+    their outcome lines logged — in listing order, with the same fail-open rules."""
+
+    def _items(self, n: int) -> list[NormalizedItem]:
+        return [
+            NormalizedItem(
+                dedupe_key=f"k{i}",
+                title=f"Film {i}",
+                source_id="movies",
+                url=f"https://kinozal.tv/details.php?id={i}",
+            )
+            for i in range(n)
+        ]
+
+    @staticmethod
+    def _fetcher(details: Any) -> Any:
+        fetcher = unittest.mock.Mock(spec=kp.Kinozal)
+        fetcher.fetch_details.side_effect = details
+        return fetcher
+
+    def test_pages_overlap_and_outcomes_keep_listing_order(self) -> None:
+        # Two fetches that each wait for the other: a serial loop would break the barrier.
+        both_in_flight = threading.Barrier(2, timeout=5)
+        pages = {"0": _item_details(2), "1": _item_details(6)}
+
+        def _details(url: str) -> str:
+            both_in_flight.wait()
+            return pages[url.rsplit("=", 1)[1]]
+
+        with self.assertLogs("kinozal_scraper.kinozal_pipeline", level="INFO") as logs:
+            kept, filtered = kp._apply_item_filters(
+                self._items(2), self._fetcher(_details), {"другое - аудиокниги"}, set(), []
+            )
+        self.assertEqual([item.title for item in kept], ["Film 1"])
+        self.assertEqual([item.title for item in filtered], ["Film 0"])
+        outcomes = [line for line in logs.output if "kinozal new item" in line]
+        self.assertIn("'Film 0'", outcomes[0])
+        self.assertIn("'Film 1'", outcomes[1])
+
+    def test_one_failed_page_is_fail_open_for_that_item_only(self) -> None:
+        def _details(url: str) -> str:
+            if url.endswith("=0"):
+                raise RuntimeError("details 522")
+            return _item_details(2)
+
+        results = [PipelineResult(source_id="movies")]
+        with self.assertLogs("kinozal_scraper.kinozal_pipeline", level="WARNING") as logs:
+            kept, filtered = kp._apply_item_filters(
+                self._items(2), self._fetcher(_details), {"другое - аудиокниги"}, set(), results
+            )
+        self.assertEqual([item.title for item in kept], ["Film 0"])
+        self.assertEqual([item.title for item in filtered], ["Film 1"])
+        self.assertIn("details 522", "\n".join(logs.output))
+        self.assertEqual(results[0].errors, [])  # one item resolved: no drift error
+
+    def test_no_filter_configured_fetches_nothing(self) -> None:
+        fetcher = self._fetcher(AssertionError("no details fetch without a filter"))
+        with self.assertLogs("kinozal_scraper.kinozal_pipeline", level="INFO"):
+            kept, _ = kp._apply_item_filters(self._items(3), fetcher, set(), set(), [])
+        self.assertEqual(len(kept), 3)
+        fetcher.fetch_details.assert_not_called()
+
+
+_ITEM_URL = "https://kinozal.tv/details.php?id=2142272"
+_ITEM_URL_ON_MIRROR = "https://kinozal.guru/details.php?id=2142272"
+
+
+class TestDetailsCache(unittest.TestCase):
+    """A release's parsed fields are stored by its details.php id, so a later run
+    (or a retried delivery) classifies it without fetching the page again."""
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.store = LocalStore(Path(tmp.name) / "state.sqlite3", "kinozal_details")
+        self.addCleanup(self.store.close)
+        patcher = unittest.mock.patch.object(kp, "_details_store", return_value=self.store)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _run(self, page: str) -> tuple[list[NormalizedItem], unittest.mock.Mock]:
+        fetcher = unittest.mock.Mock(spec=kp.Kinozal)
+        fetcher.fetch_details.return_value = page
+        item = NormalizedItem(
+            dedupe_key="k", title="Film", source_id="movies", url=_ITEM_URL_ON_MIRROR
+        )
+        with self.assertLogs("kinozal_scraper.kinozal_pipeline", level="INFO"):
+            _, filtered = kp._apply_item_filters(
+                [item], fetcher, {"другое - аудиокниги"}, set(), []
+            )
+        return filtered, fetcher
+
+    def test_second_run_is_served_from_the_store(self) -> None:
+        first, fetcher = self._run(_item_details(2))
+        second, refetcher = self._run("unused")
+        self.assertEqual((len(first), len(second)), (1, 1))
+        fetcher.fetch_details.assert_called_once()
+        refetcher.fetch_details.assert_not_called()
+        self.assertEqual(
+            kp.cache_summary_lines(), ["kinozal_details_cache: hit=1 miss=1 hit_rate=50%"]
+        )
+
+    def test_page_without_category_or_genre_is_not_stored(self) -> None:
+        self._run("<html><body>login</body></html>")
+        _, refetcher = self._run(_item_details(2))
+        refetcher.fetch_details.assert_called_once()
+
+    def test_profile_reads_the_stored_fields(self) -> None:
+        kp._details_page(_ITEM_URL_ON_MIRROR, lambda _url: _details_html("драма", cast="А, Б"))
+        profile = kp.build_film_profile(
+            NormalizedItem(dedupe_key="k", title="Film", source_id="movies", url=_ITEM_URL),
+            _StubFetcher(exc=AssertionError("served from the store")),
+        )
+        self.assertEqual((profile.genre, profile.cast), ("драма", ["А", "Б"]))
+
+
 class TestItemCategoryDrift(unittest.TestCase):
     def test_all_items_unresolved_appends_pipeline_error_and_still_delivers(self) -> None:
         details = {
@@ -2018,10 +2524,10 @@ class TestFetchPosterFastpic(unittest.TestCase):
     def test_fetch_poster_resolves_fastpic_viewer_to_signed_image(self) -> None:
         from kinozal_scraper.http_fetch import NotAnImageError
 
-        calls: list[str] = []
+        calls: list[tuple[str, bool]] = []
 
-        def _fetch(url: str) -> bytes:
-            calls.append(url)
+        def _fetch(url: str, keep_html: bool = False) -> bytes:
+            calls.append((url, keep_html))
             if url == _FASTPIC_URL:
                 raise NotAnImageError(url, "text/html", _FASTPIC_VIEWER_HTML.encode("utf-8"))
             return b"\xff\xd8\xff\xe0JPEG"
@@ -2032,8 +2538,8 @@ class TestFetchPosterFastpic(unittest.TestCase):
             data = self._kinozal().fetch_poster(_FASTPIC_URL)
         self.assertEqual(data, b"\xff\xd8\xff\xe0JPEG")
         # second fetch hit the SIGNED link, resolved from the exception body (no
-        # re-GET of the viewer page).
-        self.assertEqual(calls, [_FASTPIC_URL, _FASTPIC_SIGNED])
+        # re-GET of the viewer page). Only the viewer fetch keeps an HTML body.
+        self.assertEqual(calls, [(_FASTPIC_URL, True), (_FASTPIC_SIGNED, False)])
 
     def test_fetch_poster_fastpic_unresolvable_propagates(self) -> None:
         from kinozal_scraper.http_fetch import NotAnImageError
@@ -2042,7 +2548,7 @@ class TestFetchPosterFastpic(unittest.TestCase):
         # NotAnImageError propagates so the notifier degrades visibly (§IV).
         viewer = b"<html><body><img src='https://i126.fastpic.org/thumb/x.jpeg'></body></html>"
 
-        def _fetch(url: str) -> bytes:
+        def _fetch(url: str, keep_html: bool = False) -> bytes:
             raise NotAnImageError(url, "text/html", viewer)
 
         with (
@@ -0,0 +1,96 @@
+"""Tests for `local_store.py` — the opt-in cross-run sqlite state.
+
+Covers the `STATE_DIR` switch, TTL expiry, least-recently-used eviction per
+namespace, namespace isolation, and degradation of a broken store to a miss.
+"""
+
+import tempfile
+import unittest
+import unittest.mock
+from pathlib import Path
+
+from kinozal_scraper.local_store import LocalStore, open_store
+
+
+class TestLocalStore(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / "state.sqlite3"
+
+    def _store(self, namespace: str = "ns", **kwargs: int) -> LocalStore:
+        store = LocalStore(self.path, namespace, **kwargs)
+        self.addCleanup(store.close)
+        return store
+
+    def test_round_trip_survives_reopening(self) -> None:
+        # Cross-run means a new process: a second store on the same file sees the value.
+        self._store().put_json("k", {"body": "<html>"})
+        self.assertEqual(self._store().get_json("k"), {"body": "<html>"})
+
+    def test_expired_entry_is_a_miss(self) -> None:
+        store = self._store()
+        with unittest.mock.patch("kinozal_scraper.local_store.time.time", return_value=1000.0):
+            store.put("k", b"v", ttl_s=60)
+        with unittest.mock.patch("kinozal_scraper.local_store.time.time", return_value=1061.0):
+            self.assertIsNone(store.get("k"))
+        self.assertEqual(len(store), 0)
+
+    def test_size_bound_evicts_least_recently_used(self) -> None:
+        store = self._store(max_entries=2)
+        clock = iter(float(t) for t in range(100))
+        with unittest.mock.patch("kinozal_scraper.local_store.time.time", lambda: next(clock)):
+            store.put("a", b"1")
+            store.put("b", b"2")
+            store.get("a")  # touched: "b" is now the least recently used
+            store.put("c", b"3")
+        self.assertEqual(store.get("a"), b"1")
+        self.assertIsNone(store.get("b"))
+        self.assertEqual(store.get("c"), b"3")
+
+    def test_namespaces_do_not_see_each_other(self) -> None:
+        self._store("one").put("k", b"1")
+        self.assertIsNone(self._store("two").get("k"))
+
+    def test_undecodable_json_is_a_logged_miss(self) -> None:
+        store = self._store()
+        store.put("k", b"{not json")
+        with self.assertLogs("kinozal_scraper.local_store", level="WARNING"):
+            self.assertIsNone(store.get_json("k"))
+
+    def test_broken_store_degrades_to_a_miss(self) -> None:
+        store = self._store()
+        store.close()
+        with self.assertLogs("kinozal_scraper.local_store", level="WARNING") as logs:
+            self.assertIsNone(store.get("k"))
+            store.put("k", b"v")
+        self.assertTrue(all("treating as a miss" in line for line in logs.output))
+
+
+class TestOpenStore(unittest.TestCase):
+    def test_unset_state_dir_means_no_store(self) -> None:
+        with unittest.mock.patch.dict("os.environ", {"STATE_DIR": ""}):
+            self.assertIsNone(open_store("ns"))
+
+    def test_state_dir_creates_the_file(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            target = Path(tmp) / "nested" / ".state"
+            with unittest.mock.patch.dict("os.environ", {"STATE_DIR": str(target)}):
+                store = open_store("ns")
+            assert store is not None
+            store.close()
+            self.assertTrue((target / "state.sqlite3").is_file())
+
+    def test_unopenable_dir_is_logged_and_off(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            blocker = Path(tmp) / "file"
+            blocker.write_text("x", encoding="utf-8")
+            with (
+                unittest.mock.patch.dict("os.environ", {"STATE_DIR": str(blocker / "sub")}),
+                self.assertLogs("kinozal_scraper.local_store", level="WARNING"),
+            ):
+                self.assertIsNone(open_store("ns"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -24,9 +24,14 @@ _MODULES = [
     "generic_pipeline",
     "github_popular_pipeline",
     "github_trending_pipeline",
+    "host_governor",
     "http_fetch",
+    "http_observability",
+    "http_transport",
     "kinozal_auth",
     "kinozal_pipeline",
+    "local_store",
+    "patient_ledger",
     "pipeline_config",
     "sheets_storage",
     "soldout_pipeline",
@@ -36,6 +41,7 @@ _MODULES = [
     "TelegramChannelSummarizer",
     "text_utils",
     "youtube",
+    "youtube_quota",
 ]
 
 
@@ -0,0 +1,81 @@
+"""Tests for `patient_ledger.py` — the patient schedule across short invocations.
+
+Covers the 720 s spacing between admissions (less a minute of runner-start slack),
+the per-window attempt budget, early
+closing of a window, the UTC-day window rollover, and persistence across a fresh
+ledger on the same state file (the next cron invocation).
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from kinozal_scraper.http_retry import _PATIENT_ATTEMPTS, _PATIENT_WAIT_S
+from kinozal_scraper.local_store import LocalStore
+from kinozal_scraper.patient_ledger import _SPACING_SLACK_S, PatientLedger
+
+# 2026-08-01T01:00:00Z
+_START = 1785546000.0
+
+
+class TestPatientLedger(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / "state.sqlite3"
+        self.now = _START
+
+    def _ledger(self, **kwargs: int) -> PatientLedger:
+        # A new store per call: each one stands for a separate cron invocation.
+        store = LocalStore(self.path, "patient_ledger")
+        self.addCleanup(store.close)
+        return PatientLedger(store, clock=lambda: self.now, **kwargs)
+
+    def test_first_attempt_is_due_and_the_next_waits_the_spacing_less_slack(self) -> None:
+        self.assertEqual(self._ledger().admit("soldout").attempt, 1)
+        self._ledger().record("soldout")
+        self.now += _PATIENT_WAIT_S - _SPACING_SLACK_S - 1
+        admission = self._ledger().admit("soldout")
+        self.assertIsNone(admission.attempt)
+        self.assertIn("not due for 1s", admission.reason)
+        self.now += 1
+        self.assertEqual(self._ledger().admit("soldout").attempt, 2)
+
+    def test_a_faster_invocation_on_the_next_cron_slot_is_still_due(self) -> None:
+        # Slot 1: a slow runner start and a 90 s fetch. Slot 2, 720 s later: a
+        # runner that starts 30 s sooner. The spacing runs from the admission, so
+        # the fetch's length does not count against the next slot.
+        self.now = _START + 45
+        self.assertEqual(self._ledger().admit("soldout").attempt, 1)
+        self.now += 90
+        self._ledger().record("soldout")
+        self.now = _START + _PATIENT_WAIT_S + 15
+        self.assertEqual(self._ledger().admit("soldout").attempt, 2)
+
+    def test_an_admission_is_stamped_even_if_its_outcome_is_never_recorded(self) -> None:
+        self._ledger().admit("soldout")
+        self.now += 1
+        self.assertIsNone(self._ledger().admit("soldout").attempt)
+
+    def test_window_is_exhausted_after_the_policy_attempts(self) -> None:
+        for left in range(_PATIENT_ATTEMPTS - 1, -1, -1):
+            self.assertEqual(self._ledger().record("soldout"), left)
+            self.now += _PATIENT_WAIT_S
+        admission = self._ledger().admit("soldout")
+        self.assertIsNone(admission.attempt)
+        self.assertIn("exhausted", admission.reason)
+
+    def test_closed_window_admits_nothing_until_the_next_utc_day(self) -> None:
+        self.assertEqual(self._ledger().record("soldout", closed="fetched"), 0)
+        self.now += _PATIENT_WAIT_S
+        self.assertIn("closed (fetched)", self._ledger().admit("soldout").reason)
+        self.now = _START + 24 * 3600
+        self.assertEqual(self._ledger().admit("soldout").attempt, 1)
+
+    def test_keys_are_independent(self) -> None:
+        self._ledger().record("soldout", closed="fetched")
+        self.assertEqual(self._ledger().admit("other").attempt, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,8 @@
 """Tests for `pipeline_config.py` — loading and validating `sources.json`.
 
 Covers macro expansion (dates, env, overrides), the closed set of supported
-source types, selector and limit validation on both the direct and the load
-path, and the Russian enrichment prompts shipped in the real config.
+source types, selector, limit and incremental-scan validation on both the direct
+and the load path, and the Russian enrichment prompts shipped in the real config.
 """
 
 import json
@@ -171,6 +171,14 @@ class TestValidateSourcesConfig(unittest.TestCase):
         source = {**_MINIMAL_SOURCE, "limit": 1}
         validate_sources_config(_make_config([source]))
 
+    def test_incremental_stop_after_must_be_a_positive_integer(self) -> None:
+        validate_sources_config(_make_config([{**_MINIMAL_SOURCE, "incremental_stop_after": 1}]))
+        for bad in (0, -3, "5", True, 2.5):
+            with self.subTest(value=bad), self.assertRaises(ConfigError) as ctx:
+                source = {**_MINIMAL_SOURCE, "incremental_stop_after": bad}
+                validate_sources_config(_make_config([source]))
+            self.assertIn("incremental_stop_after", str(ctx.exception))
+
     def test_html_requires_row_selector(self) -> None:
         source = {**_MINIMAL_SOURCE, "type": "html"}
         source.pop("row_selector", None)
@@ -183,6 +191,22 @@ class TestValidateSourcesConfig(unittest.TestCase):
         source = {**_MINIMAL_SOURCE, "type": "html", "row_selector": "article.Box-row"}
         validate_sources_config(_make_config([source]))
 
+    def test_html_parser_must_be_a_known_engine(self) -> None:
+        source = {**_MINIMAL_SOURCE, "type": "html", "row_selector": "article.Box-row"}
+        for known in ("html.parser", "lxml", "selectolax"):
+            validate_sources_config(_make_config([{**source, "parser": known}]))
+        with self.assertRaises(ConfigError) as ctx:
+            validate_sources_config(_make_config([{**source, "parser": "html5lib"}]))
+        self.assertIn("'parser'", str(ctx.exception))
+
+    def test_extra_fields_are_selectors_validated_at_load(self) -> None:
+        source = {**_MINIMAL_SOURCE, "type": "html", "row_selector": "article.Box-row"}
+        validate_sources_config(_make_config([{**source, "extra_fields": {"delta": "span"}}]))
+        for bad in (["span"], {"delta": "span["}, {"delta": 3}):
+            with self.subTest(extra_fields=bad), self.assertRaises(ConfigError) as ctx:
+                validate_sources_config(_make_config([{**source, "extra_fields": bad}]))
+            self.assertIn("extra_fields", str(ctx.exception))
+
     def test_invalid_css_row_selector_raises(self) -> None:
         source = {**_MINIMAL_SOURCE, "type": "html", "row_selector": "div[unclosed-bracket"}
         with self.assertRaises(ConfigError) as ctx:
@@ -1,14 +1,19 @@
 """Tests for the `soldout_events` source, driven through Protocol doubles.
 
-Covers extraction and its discriminator, the fetch transport, dedupe,
-notification content, delivery truthfulness and the exit-code surface.
+Covers extraction and its discriminator, the fetch transport (including the
+persisted patient ledger), dedupe, notification content, delivery truthfulness and
+the exit-code surface.
 """
 
+import tempfile
 import unittest
 import unittest.mock
 from typing import Any
 
+from curl_cffi.requests.exceptions import HTTPError
+
 from kinozal_scraper.generic_pipeline import PipelineResult, extract_from_html
+from kinozal_scraper.http_retry import _PATIENT_WAIT_S
 from kinozal_scraper.pipeline_config import load_sources_config
 from kinozal_scraper.sheets_storage import InMemoryStorage
 from kinozal_scraper.soldout_pipeline import run_soldout_pipeline
@@ -172,6 +177,71 @@ class TestSoldoutFetchTransport(unittest.TestCase):
         mfetch.assert_called_once()
 
 
+class TestSoldoutPatientLedger(unittest.TestCase):
+    """`SOLDOUT_PATIENT_LEDGER=1`: one attempt per invocation, counted in the
+    cross-run ledger, with the in-process policy's outcomes."""
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        env = unittest.mock.patch.dict(
+            "os.environ", {"SOLDOUT_PATIENT_LEDGER": "1", "STATE_DIR": tmp.name}
+        )
+        env.start()
+        self.addCleanup(env.stop)
+
+    def _invoke(self, fetch: unittest.mock.Mock) -> tuple[PipelineResult, InMemoryNotifier]:
+        notifier = InMemoryNotifier()
+        with (
+            unittest.mock.patch("kinozal_scraper.soldout_pipeline.fetch_html_once", fetch),
+            unittest.mock.patch("kinozal_scraper.soldout_pipeline.fetch_html_patient") as patient,
+        ):
+            results = run_soldout_pipeline(
+                InMemoryStorage(), notifier, sources_config=_SOURCES_CONFIG
+            )
+        patient.assert_not_called()  # the sleeping schedule is never used in this mode
+        return results[0], notifier
+
+    def test_blocked_attempt_is_a_warning_and_the_next_waits_for_the_spacing(self) -> None:
+        blocked = HTTPError("HTTP Error 403", 0, unittest.mock.Mock(status_code=403))
+        fetch = unittest.mock.Mock(side_effect=blocked)
+        with self.assertLogs("kinozal_scraper.soldout_pipeline", level="INFO") as logs:
+            first, _ = self._invoke(fetch)
+            second, _ = self._invoke(fetch)
+        self.assertTrue(first.ok)
+        self.assertIn("attempt 1 failed, 23 left", first.warnings[0])
+        self.assertTrue(second.ok and not second.warnings)
+        self.assertEqual(fetch.call_count, 1)
+        self.assertTrue(any("not due" in line for line in logs.output))
+
+    def test_success_delivers_and_closes_the_window(self) -> None:
+        fetch = unittest.mock.Mock(return_value=_SOLDOUT_HTML)
+        with unittest.mock.patch("kinozal_scraper.patient_ledger.time.time", return_value=0.0):
+            result, notifier = self._invoke(fetch)
+        self.assertTrue(result.ok)
+        self.assertEqual(len(notifier.sent), 2)
+        with unittest.mock.patch(
+            "kinozal_scraper.patient_ledger.time.time", return_value=float(_PATIENT_WAIT_S)
+        ):
+            self._invoke(fetch)
+        fetch.assert_called_once()
+
+    def test_permanent_failure_is_an_error_at_once(self) -> None:
+        missing = HTTPError("HTTP Error 404", 0, unittest.mock.Mock(status_code=404))
+        with self.assertLogs("kinozal_scraper.soldout_pipeline", level="ERROR"):
+            result, _ = self._invoke(unittest.mock.Mock(side_effect=missing))
+        self.assertFalse(result.ok)
+        self.assertIn("fetch failed", result.errors[0])
+
+    def test_ledger_mode_without_state_dir_fails_loudly(self) -> None:
+        with (
+            unittest.mock.patch.dict("os.environ", {"STATE_DIR": ""}),
+            self.assertLogs("kinozal_scraper.soldout_pipeline", level="ERROR"),
+        ):
+            result, _ = self._invoke(unittest.mock.Mock())
+        self.assertIn("needs STATE_DIR", result.errors[0])
+
+
 # ── pipeline deduplication ────────────────────────────────────────────────────
 
 
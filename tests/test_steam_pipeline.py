@@ -7,6 +7,7 @@ behaviour.
 
 from __future__ import annotations
 
+import threading
 import unittest
 import unittest.mock
 from typing import Any
@@ -279,7 +280,33 @@ class TestLimit(unittest.TestCase):
             ),
         ):
             run_steam_pipeline(storage, notifier, sources_config=sources_config)
-        self.assertEqual(calls, [730, 578080])
+        # The GETs overlap, so only the set of appids is fixed, not their order.
+        self.assertCountEqual(calls, [730, 578080])
+
+    def test_appdetails_are_fetched_concurrently_in_chart_order(self) -> None:
+        # Each fetch waits for the other: only overlapping GETs get past the barrier.
+        barrier = threading.Barrier(2, timeout=5)
+        source = {**_SOURCE, "limit": 2}
+
+        def _concurrent_appdetails(appid: int) -> dict[str, Any] | None:
+            barrier.wait()
+            return _APPDETAILS.get(appid)
+
+        storage = InMemoryStorage()
+        notifier = InMemoryNotifier()
+        with (
+            unittest.mock.patch(
+                "kinozal_scraper.steam_pipeline._fetch_charts", return_value=_CHARTS_RESPONSE
+            ),
+            unittest.mock.patch(
+                "kinozal_scraper.steam_pipeline._fetch_appdetails",
+                side_effect=_concurrent_appdetails,
+            ),
+        ):
+            run_steam_pipeline(
+                storage, notifier, sources_config={"version": 1, "sources": [source]}
+            )
+        self.assertEqual([n.id for n in notifier.sent], ["730", "578080"])
 
 
 _RU_SOURCE: dict[str, Any] = {
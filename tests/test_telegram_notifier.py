@@ -1,10 +1,11 @@
 """Tests for `telegram_notifier.py` — the Telegram boundary.
 
 Covers field formatting and notification assembly, retry, image upload with its
-fallback to a text message, message-length limits, and the `InMemoryNotifier`
-double.
+fallback to a text message, the bounded poster prefetch, message-length limits, and
+the `InMemoryNotifier` double.
 """
 
+import threading
 import unittest
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -289,6 +290,97 @@ class TestTelegramNotifierImageUpload(unittest.TestCase):
             self.assertEqual(call.kwargs["files"]["photo"][1], b"\x89PNGDATA")
 
 
+class TestPosterPrefetch(unittest.TestCase):
+    """Posters of a batch are downloaded ahead of the sends, a bounded window at a time."""
+
+    def _batch(self, n: int) -> list[Notification]:
+        return [
+            Notification(id=f"k{i}", text="caption", image_url=f"https://host.example/{i}.jpg")
+            for i in range(n)
+        ]
+
+    def test_posters_download_concurrently(self) -> None:
+        # Each download waits for the other: only a concurrent prefetch gets past it.
+        barrier = threading.Barrier(2, timeout=5)
+
+        def _fetch(url: str) -> bytes:
+            barrier.wait()
+            return url.encode()
+
+        session = _make_session((200, {"ok": True}, {}), (200, {"ok": True}, {}))
+        sent, failed = _notifier(session, image_fetcher=_fetch).send_items(self._batch(2))
+        self.assertEqual((len(sent), failed), (2, []))
+        uploads = [call.kwargs["files"]["photo"][1] for call in session.post.call_args_list]
+        self.assertEqual(uploads, [b"https://host.example/0.jpg", b"https://host.example/1.jpg"])
+
+    def test_window_bounds_posters_held_ahead_of_the_send(self) -> None:
+        lock = threading.Lock()
+        fetched = 0
+        most_ahead = 0
+
+        def _fetch(url: str) -> bytes:
+            nonlocal fetched
+            with lock:
+                fetched += 1
+            return b"\x89PNG"
+
+        def _post(*_args: Any, **_kwargs: Any) -> requests.Response:
+            nonlocal most_ahead
+            with lock:
+                most_ahead = max(most_ahead, fetched - session.post.call_count)
+            return make_json_response(200, {"ok": True})
+
+        session = MagicMock()
+        session.post.side_effect = _post
+        notifier = _notifier(session, image_fetcher=_fetch, poster_prefetch=2)
+        sent, _ = notifier.send_items(self._batch(6))
+        self.assertEqual(len(sent), 6)
+        # The poster being sent plus the two behind it, never the whole batch.
+        self.assertLessEqual(most_ahead, 3)
+
+    def test_each_poster_is_downloaded_once_at_any_window(self) -> None:
+        for window in (0, 1, 4):
+            with self.subTest(poster_prefetch=window):
+                lock = threading.Lock()
+                fetched: list[str] = []
+
+                def _fetch(url: str, fetched: list[str] = fetched, lock: Any = lock) -> bytes:
+                    with lock:
+                        fetched.append(url)
+                    return b"\x89PNG"
+
+                session = _make_session(*[(200, {"ok": True}, {})] * 3)
+                notifier = _notifier(session, image_fetcher=_fetch, poster_prefetch=window)
+                sent, _ = notifier.send_items(self._batch(3))
+                self.assertEqual(len(sent), 3)
+                self.assertEqual(
+                    sorted(fetched), [f"https://host.example/{i}.jpg" for i in range(3)]
+                )
+
+    def test_failed_prefetch_drops_only_its_own_poster(self) -> None:
+        def _fetch(url: str) -> bytes:
+            if url.endswith("/1.jpg"):
+                raise RuntimeError("cloudflare 403")
+            return b"\x89PNG"
+
+        session = _make_session(*[(200, {"ok": True}, {})] * 3)
+        notifier = _notifier(session, image_fetcher=_fetch)
+        with self.assertLogs("kinozal_scraper.telegram_notifier", level="WARNING") as logs:
+            sent, failed = notifier.send_items(self._batch(3))
+        self.assertEqual((len(sent), failed), (3, []))
+        endpoints = [call.args[0].rsplit("/", 1)[1] for call in session.post.call_args_list]
+        self.assertEqual(endpoints, ["sendPhoto", "sendMessage", "sendPhoto"])
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("k1", logs.output[0])
+
+    def test_long_text_poster_is_never_downloaded(self) -> None:
+        fetcher = MagicMock(return_value=b"\x89PNG")
+        session = _make_session((200, {"ok": True}, {}))
+        notif = Notification(id="k1", text="x" * 1025, image_url="https://host.example/p.jpg")
+        _notifier(session, image_fetcher=fetcher).send_items([notif])
+        fetcher.assert_not_called()
+
+
 class TestTelegramNotifierMessageLimits(unittest.TestCase):
     def test_message_over_4096_chars_is_truncated_and_sent(self) -> None:
         long_text = "x" * 5000
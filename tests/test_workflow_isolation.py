@@ -187,3 +187,30 @@ class TestSoldoutStepPlacement:
         triggers = doc.get("on", doc.get(True, {}))
         crons = [entry["cron"] for entry in triggers["schedule"]]
         assert crons == ["0 1 * * *"], f"daily cron changed to {crons}"
+
+
+_PATIENT_WORKFLOW = _WORKFLOW.parent / "soldout-patient.yml"
+
+
+class TestSoldoutPatientLedgerWorkflow:
+    """The ledger alternative to the in-process schedule: exactly one of the two
+    runs soldout, and the short invocations never overlap or share run-script's state."""
+
+    def _patient(self) -> dict[Any, Any]:
+        return cast("dict[Any, Any]", yaml.safe_load(_PATIENT_WORKFLOW.read_text(encoding="utf-8")))
+
+    def test_the_two_schedules_are_mutually_exclusive_on_one_variable(self) -> None:
+        soldout = [s for s in _steps() if _SOLDOUT_RUN.search(str(s.get("run", "")))]
+        assert "vars.SOLDOUT_PATIENT_LEDGER!='1'" in _norm(str(soldout[0]["if"]))
+        job = self._patient()["jobs"]["attempt"]
+        assert _norm(job["if"]) == "${{vars.SOLDOUT_PATIENT_LEDGER=='1'}}"
+
+    def test_invocations_are_serialised_and_keep_their_own_state(self) -> None:
+        doc = self._patient()
+        assert doc["concurrency"]["cancel-in-progress"] is False, (
+            "a cancelled invocation may have spent its attempt without saving the ledger"
+        )
+        state_dir = doc["jobs"]["attempt"]["env"]["STATE_DIR"]
+        assert state_dir != _doc()["jobs"]["run-script"]["env"]["STATE_DIR"]
+        caches = [s["with"]["key"] for s in doc["jobs"]["attempt"]["steps"] if "cache" in str(s)]
+        assert caches and all(key.startswith("soldout-ledger-") for key in caches)
@@ -14,6 +14,7 @@ from __future__ import annotations
 
 import json
 import logging
+import unittest.mock
 from typing import Any
 
 import pytest
@@ -22,10 +23,12 @@ from googleapiclient.errors import HttpError
 from kinozal_scraper.trailer_strategy import Candidate, FilmProfile
 from kinozal_scraper.youtube import (
     TrailerRetrievalError,
+    Youtube,
     YoutubeQuotaExhausted,
     _is_quota_error,
     search_candidates,
 )
+from kinozal_scraper.youtube_quota import QuotaLedger
 
 
 def _video_item(video_id: str, title: str, **snippet: str) -> dict[str, Any]:
@@ -348,3 +351,88 @@ class TestQuotaDetection:
         with pytest.raises(TrailerRetrievalError) as excinfo:
             search_candidates(client, profile)
         assert not isinstance(excinfo.value, YoutubeQuotaExhausted)
+
+
+class TestLazyOriginalQuery:
+    """`lazy_original` skips the original-title query when the RU results already hold a
+    unique confident pick, and only then."""
+
+    _PROFILE = FilmProfile(ru_title="Волк", original_title="The Wolf", year=2025)
+
+    def test_confident_ru_pick_skips_the_original_query(self) -> None:
+        client = _FakeClient([("Волк", [_video_item("ru_wolf", "Волк 2025 трейлер")])])
+        pool = search_candidates(client, self._PROFILE, lazy_original=True)
+        assert [c.video_id for c in pool] == ["ru_wolf"]
+        assert len(client.queries) == 1
+
+    def test_ambiguous_ru_pick_still_queries_the_original(self) -> None:
+        ru = [_video_item("a", "Волк 2025 трейлер"), _video_item("b", "Волк 2025 трейлер")]
+        client = _FakeClient([("Волк", ru), ("The Wolf", [])])
+        search_candidates(client, self._PROFILE, lazy_original=True)
+        assert len(client.queries) == 2
+
+    def test_failed_ru_branch_falls_through(self) -> None:
+        client = _FakeClient(
+            [
+                ("Волк", RuntimeError("YouTube 500")),
+                ("The Wolf", [_video_item("eng_wolf", "The Wolf 2025 Official Trailer")]),
+            ]
+        )
+        pool = search_candidates(client, self._PROFILE, lazy_original=True)
+        assert [c.video_id for c in pool] == ["eng_wolf"]
+
+
+class TestQuotaAccounting:
+    """`Youtube` spends 100 units per answered query into its ledger — two for a film with
+    a distinct original title — and a quota refusal closes the day (#384) unbilled."""
+
+    @staticmethod
+    def _youtube(client: _FakeClient, ledger: Any, monkeypatch: pytest.MonkeyPatch) -> Youtube:
+        monkeypatch.setenv("API_KEY", "test")
+        monkeypatch.setattr("kinozal_scraper.youtube.build", lambda *_a, **_k: client)
+        return Youtube(ledger=ledger)
+
+    def test_each_query_is_spent(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        ledger = unittest.mock.Mock(spec=QuotaLedger)
+        youtube = self._youtube(_FakeClient([]), ledger, monkeypatch)
+        youtube.search_candidates(
+            FilmProfile(ru_title="Волк", original_title="The Wolf", year=2025)
+        )
+        youtube.search_candidates(FilmProfile(ru_title="Волк", original_title="Волк", year=2025))
+        assert [c.args[0] for c in ledger.spend.call_args_list] == [200, 100]
+        ledger.exhaust.assert_not_called()
+
+    def test_quota_refusal_exhausts_the_day(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        ledger = unittest.mock.Mock(spec=QuotaLedger)
+        client = _FakeClient([("Волк", _http_error(429, _RATE_LIMIT_429))])
+        youtube = self._youtube(client, ledger, monkeypatch)
+        with pytest.raises(YoutubeQuotaExhausted):
+            youtube.search_candidates(FilmProfile(ru_title="Волк", original_title="", year=None))
+        ledger.exhaust.assert_called_once()
+
+    def test_refused_queries_are_not_spent(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        # A quota refusal and a dropped connection never reached the quota counter; only
+        # the branch the API answered — here with a 500 — is billed.
+        for failures, spent in (
+            ((_http_error(403, _QUOTA_403), RuntimeError("connection reset")), []),
+            ((_http_error(403, _QUOTA_403), _http_error(500, _BACKEND_500)), [100]),
+        ):
+            ledger = unittest.mock.Mock(spec=QuotaLedger)
+            client = _FakeClient(list(zip(("Волк", "The Wolf"), failures, strict=True)))
+            youtube = self._youtube(client, ledger, monkeypatch)
+            with pytest.raises(YoutubeQuotaExhausted):
+                youtube.search_candidates(
+                    FilmProfile(ru_title="Волк", original_title="The Wolf", year=2025)
+                )
+            assert [c.args[0] for c in ledger.spend.call_args_list] == spent
+            ledger.exhaust.assert_called_once()
+
+    def test_skipped_query_is_not_spent(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        ledger = unittest.mock.Mock(spec=QuotaLedger)
+        client = _FakeClient([("Волк", [_video_item("ru_wolf", "Волк 2025 трейлер")])])
+        youtube = self._youtube(client, ledger, monkeypatch)
+        youtube.lazy_original = True
+        youtube.search_candidates(
+            FilmProfile(ru_title="Волк", original_title="The Wolf", year=2025)
+        )
+        ledger.spend.assert_called_once_with(100)
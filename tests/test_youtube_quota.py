@@ -0,0 +1,58 @@
+"""Tests for `youtube_quota.py` — the per-Pacific-day YouTube quota ledger.
+
+Covers spending and the remaining budget, a refusal closing the day whatever was
+counted, the rollover at Pacific (not UTC) midnight, persistence across a fresh
+ledger on the same state file (the next run), and the run-summary line.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from kinozal_scraper.local_store import LocalStore
+from kinozal_scraper.youtube_quota import DAILY_UNITS, SEARCH_LIST_UNITS, QuotaLedger
+
+# 2026-08-01T06:59:00Z = 2026-07-31 23:59 PDT
+_BEFORE_PACIFIC_MIDNIGHT = 1785567540.0
+
+
+class TestQuotaLedger(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / "state.sqlite3"
+        self.now = _BEFORE_PACIFIC_MIDNIGHT
+
+    def _ledger(self) -> QuotaLedger:
+        # A new store per call: each one stands for a separate run of the day.
+        store = LocalStore(self.path, "youtube_quota")
+        self.addCleanup(store.close)
+        return QuotaLedger(store, clock=lambda: self.now)
+
+    def test_spending_persists_across_runs(self) -> None:
+        self._ledger().spend(2 * SEARCH_LIST_UNITS)
+        self._ledger().spend(SEARCH_LIST_UNITS)
+        self.assertEqual(self._ledger().remaining(), DAILY_UNITS - 3 * SEARCH_LIST_UNITS)
+        self.assertFalse(self._ledger().exhausted())
+
+    def test_refusal_leaves_nothing_whatever_was_counted(self) -> None:
+        self._ledger().spend(SEARCH_LIST_UNITS)
+        self._ledger().exhaust()
+        self.assertTrue(self._ledger().exhausted())
+        self.assertEqual(self._ledger().remaining(), 0)
+
+    def test_day_rolls_over_at_pacific_midnight(self) -> None:
+        self._ledger().exhaust()
+        self.now += 60  # 07:00 UTC: still the same UTC day, a new Pacific one
+        self.assertEqual(self._ledger().remaining(), DAILY_UNITS)
+
+    def test_summary_line(self) -> None:
+        self._ledger().spend(SEARCH_LIST_UNITS)
+        self.assertEqual(
+            self._ledger().summary_line(),
+            f"youtube_quota: day=2026-07-31 spent=100 remaining={DAILY_UNITS - 100}/{DAILY_UNITS}",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()